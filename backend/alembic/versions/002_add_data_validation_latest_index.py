@@ -0,0 +1,32 @@
+"""Add index for latest data validation lookup
+
+Revision ID: 002_validation_latest
+Revises: 001_verification
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002_validation_latest'
+down_revision = '001_verification'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Latest validation of collected data is an index range scan + 1 row;
+    # the composite index also serves lookups by collected_data_id alone
+    op.create_index(
+        'ix_data_validations_collected_data_id_created_at',
+        'data_validations',
+        ['collected_data_id', sa.text('created_at DESC')],
+    )
+    op.drop_index('ix_data_validations_collected_data_id')
+
+
+def downgrade() -> None:
+    op.create_index('ix_data_validations_collected_data_id', 'data_validations', ['collected_data_id'])
+    op.drop_index('ix_data_validations_collected_data_id_created_at')
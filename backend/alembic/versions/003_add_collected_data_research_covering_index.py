@@ -0,0 +1,30 @@
+"""Add covering index for related collected data lookup
+
+Revision ID: 003_related_data_cover
+Revises: 002_validation_latest
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '003_related_data_cover'
+down_revision = '002_validation_latest'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Related data lookup filters on research_id and excludes by id and
+    # source_id; including both lets those exclusions be checked from the index
+    op.create_index(
+        'ix_collected_data_research_id_covering',
+        'collected_data',
+        ['research_id'],
+        postgresql_include=['id', 'source_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_collected_data_research_id_covering')
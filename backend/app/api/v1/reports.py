@@ -323,7 +323,7 @@ async def delete_report(
     if report.file_path and Path(report.file_path).exists():
         Path(report.file_path).unlink()
 
-    # Delete report record
+    # Delete report record; its figures may be shared and are swept later
     db.delete(report)
     db.commit()
 
@@ -1,5 +1,6 @@
 """Database configuration and session management."""
 
+import orjson
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
@@ -7,6 +8,14 @@ from app.core.config import settings
 # Convert postgres:// to postgresql:// for asyncpg
 database_url = str(settings.database_url).replace("postgresql://", "postgresql+asyncpg://")
 
+
+def json_serializer(value) -> str:
+    """Serialize JSON column values with orjson (handles numpy and datetimes)."""
+    return orjson.dumps(
+        value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+
 # Create async engine
 engine = create_async_engine(
     database_url,
@@ -15,6 +24,8 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
@@ -3,9 +3,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 
 from app.core.config import settings
 from app.api.v1 import auth, research, analysis, verification, reports
+from app.services.report_generation.report_generator import run_figure_sweeper
+from app.services.report_generation.visualization import shutdown_render_executor
+from app.services.verification.fact_checker import close_http_client
 
 
 @asynccontextmanager
@@ -13,9 +17,13 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     print(f"Starting {settings.app_name} v{settings.app_version}")
+    figure_sweeper = asyncio.create_task(run_figure_sweeper())
     yield
     # Shutdown
     print("Shutting down...")
+    figure_sweeper.cancel()
+    shutdown_render_executor()
+    await close_http_client()
 
 
 # Create FastAPI application
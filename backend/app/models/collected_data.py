@@ -1,6 +1,6 @@
 """Collected data model."""
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum, JSON, Integer
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum, JSON, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -52,3 +52,12 @@ class CollectedData(Base):
     # Relationships
     source = relationship("DataSource", back_populates="collected_data")
     research = relationship("Research", back_populates="collected_data")
+
+    # Covering index for looking up related data of a research
+    __table_args__ = (
+        Index(
+            'ix_collected_data_research_id_covering',
+            'research_id',
+            postgresql_include=['id', 'source_id'],
+        ),
+    )
@@ -1,6 +1,6 @@
 """Source verification models."""
 
-from sqlalchemy import Column, String, Text, DateTime, Float, ForeignKey, Enum, Boolean, JSON
+from sqlalchemy import Column, String, Text, DateTime, Float, ForeignKey, Enum, Boolean, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -154,3 +154,12 @@ class DataValidation(Base):
 
     # Relationships
     collected_data = relationship("CollectedData", backref="validations")
+
+    # Index for fetching the latest validation of collected data
+    __table_args__ = (
+        Index(
+            'ix_data_validations_collected_data_id_created_at',
+            'collected_data_id',
+            created_at.desc(),
+        ),
+    )
@@ -362,15 +362,17 @@ class ContentGenerator:
         Returns:
             List of bibliography entries
         """
+        # Index verifications by source URL once (first verification wins)
+        verifications_by_url = {}
+        for v in source_verifications:
+            verifications_by_url.setdefault(v.source_url, v)
+
         # Collect unique sources
         sources = {}
         for data in collected_data:
             if data.source_url and data.source_url not in sources:
                 # Find verification for this source
-                verification = next(
-                    (v for v in source_verifications if v.source_url == data.source_url),
-                    None
-                )
+                verification = verifications_by_url.get(data.source_url)
 
                 sources[data.source_url] = {
                     "url": data.source_url,
@@ -11,7 +11,7 @@ from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
-from .gost_formatter import GOSTFormatter
+from .gost_formatter import GOSTFormatter, format_table_rows, upper_if_needed
 
 
 class DOCXExporter:
@@ -157,7 +157,7 @@ class DOCXExporter:
             self.document.add_paragraph()
 
         # Report type
-        p = self.document.add_paragraph(data.get("report_type", "").upper())
+        p = self.document.add_paragraph(upper_if_needed(data.get("report_type")))
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         p.runs[0].font.size = Pt(16)
         p.runs[0].font.bold = True
@@ -201,7 +201,7 @@ class DOCXExporter:
         # Keywords
         keywords = data.get("keywords", [])
         if keywords:
-            keywords_text = "КЛЮЧЕВЫЕ СЛОВА: " + ", ".join(keywords).upper()
+            keywords_text = "КЛЮЧЕВЫЕ СЛОВА: " + upper_if_needed(", ".join(keywords))
             p = self.document.add_paragraph(keywords_text)
             p.runs[0].font.bold = True
 
@@ -226,7 +226,7 @@ class DOCXExporter:
 
         # Add main sections
         for i, section in enumerate(sections, 1):
-            toc_items.append((f"{i} {section.get('title', '').upper()}", section.get('page', i + 3)))
+            toc_items.append((f"{i} {upper_if_needed(section.get('title'))}", section.get('page', i + 3)))
 
             # Add subsections if any
             for j, subsection in enumerate(section.get('subsections', []), 1):
@@ -265,7 +265,7 @@ class DOCXExporter:
             self.section_numbers[section.get("id", "")] = i
 
             # Section heading
-            title = f"{i} {section.get('title', '').upper()}"
+            title = f"{i} {upper_if_needed(section.get('title'))}"
             p = self.document.add_paragraph(title, style='GOST Heading 1')
 
             # Section content
@@ -300,10 +300,15 @@ class DOCXExporter:
         self.figure_counter += 1
 
         # Add image if available
+        image_path = figure_data.get("image_path")
         image_data = figure_data.get("image_bytes")
-        if image_data:
-            image_stream = io.BytesIO(image_data)
-            self.document.add_picture(image_stream, width=Inches(6))
+        if image_path or image_data:
+            try:
+                image = image_path if image_path else io.BytesIO(image_data)
+                self.document.add_picture(image, width=Inches(6))
+            except Exception:
+                # Skip if image cannot be loaded; the caption is still added
+                pass
 
         # Add caption
         caption = self.formatter.format_figure_caption(
@@ -328,11 +333,11 @@ class DOCXExporter:
         p.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
         # Create table
-        data = table_data.get("data", [])
+        rows = format_table_rows(table_data.get("data", []))
         headers = table_data.get("headers", [])
 
-        if data and headers:
-            table = self.document.add_table(rows=len(data) + 1, cols=len(headers))
+        if rows and headers:
+            table = self.document.add_table(rows=len(rows) + 1, cols=len(headers))
             table.style = 'Table Grid'
 
             # Add headers
@@ -342,9 +347,9 @@ class DOCXExporter:
                 cell.paragraphs[0].runs[0].font.bold = True
 
             # Add data
-            for row_idx, row_data in enumerate(data, 1):
+            for row_idx, row_data in enumerate(rows, 1):
                 for col_idx, value in enumerate(row_data):
-                    table.rows[row_idx].cells[col_idx].text = str(value)
+                    table.rows[row_idx].cells[col_idx].text = value
 
         self.document.add_paragraph()
 
@@ -1,8 +1,42 @@
 """GOST 7.32-2017 formatting rules and utilities."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
+
+# Shared values for formatting dicts, so every returned dict references
+# the same string objects
+ALIGN_JUSTIFY = "justify"
+ALIGN_LEFT = "left"
+ALIGN_CENTER = "center"
+LIST_MARKER = "–"
+
+
+def upper_if_needed(text: Optional[str]) -> str:
+    """
+    Convert text to upper case, skipping the copy if it already is.
+
+    GOST headings are usually uppercase already, and missing (None or
+    empty) values yield an empty string.
+    """
+    if not text:
+        return ""
+    return text if text.isupper() else text.upper()
+
+
+def format_table_rows(data: Any) -> List[List[str]]:
+    """
+    Convert a table body (rows of cells) to rows of cell strings.
+
+    Lists and numpy arrays are formatted the same way (str() of every
+    cell); arrays are converted in a single vectorized pass.
+    """
+    if isinstance(data, np.ndarray):
+        return data.astype(str).tolist()
+    return [[str(value) for value in row] for row in data or []]
+
 
 @dataclass
 class GOSTPageSettings:
@@ -21,7 +55,7 @@ class GOSTPageSettings:
     font_name: str = "Times New Roman"
     font_size: int = 14
     line_spacing: float = 1.5
-    text_align: str = "justify"
+    text_align: str = ALIGN_JUSTIFY
 
 
 @dataclass
@@ -43,6 +77,70 @@ class GOSTNumberingRules:
     formula_number_format: str = "({section}.{number})"
 
 
+# Heading formatting templates indexed by level
+# (0=structural element, 1=section, 2=subsection, 3=subsubsection)
+_HEADING_TEMPLATES = (
+    # Structural elements (РЕФЕРАТ, СОДЕРЖАНИЕ, etc.)
+    {
+        "bold": True,
+        "alignment": ALIGN_CENTER,
+        "spacing_before": 0,
+        "spacing_after": 12,
+        "keep_with_next": True,
+        "page_break_before": True,
+    },
+    # Sections
+    {
+        "bold": True,
+        "alignment": ALIGN_LEFT,
+        "spacing_before": 12,
+        "spacing_after": 12,
+        "keep_with_next": True,
+    },
+    # Subsections
+    {
+        "bold": True,
+        "alignment": ALIGN_LEFT,
+        "spacing_before": 12,
+        "spacing_after": 6,
+        "keep_with_next": True,
+    },
+    # Subsubsections
+    {
+        "bold": False,
+        "alignment": ALIGN_LEFT,
+        "spacing_before": 6,
+        "spacing_after": 6,
+        "keep_with_next": True,
+    },
+)
+
+
+# Order of structural elements according to GOST
+_STRUCTURAL_ELEMENTS_ORDER = (
+    "ТИТУЛЬНЫЙ ЛИСТ",
+    "РЕФЕРАТ",
+    "СОДЕРЖАНИЕ",
+    "ТЕРМИНЫ И ОПРЕДЕЛЕНИЯ",
+    "ПЕРЕЧЕНЬ СОКРАЩЕНИЙ И ОБОЗНАЧЕНИЙ",
+    "ВВЕДЕНИЕ",
+    "ОСНОВНАЯ ЧАСТЬ",
+    "ЗАКЛЮЧЕНИЕ",
+    "СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ",
+    "ПРИЛОЖЕНИЯ",
+)
+
+# Structural elements every report must contain
+_REQUIRED_SECTIONS = frozenset({
+    "ТИТУЛЬНЫЙ ЛИСТ",
+    "РЕФЕРАТ",
+    "СОДЕРЖАНИЕ",
+    "ВВЕДЕНИЕ",
+    "ЗАКЛЮЧЕНИЕ",
+    "СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ",
+})
+
+
 class GOSTFormatter:
     """
     GOST 7.32-2017 formatter.
@@ -54,6 +152,11 @@ class GOSTFormatter:
         self.page_settings = GOSTPageSettings()
         self.numbering_rules = GOSTNumberingRules()
 
+    @staticmethod
+    def _cap_first(text: str) -> str:
+        """Uppercase the first character, leaving the rest of the text intact."""
+        return text[:1].upper() + text[1:]
+
     def format_heading(self, text: str, level: int) -> Dict[str, Any]:
         """
         Format heading according to GOST rules.
@@ -65,51 +168,17 @@ class GOSTFormatter:
         Returns:
             Dictionary with formatting parameters
         """
-        if level == 0:
-            # Structural elements (РЕФЕРАТ, СОДЕРЖАНИЕ, etc.)
-            return {
-                "text": text.upper(),
-                "bold": True,
-                "alignment": "center",
-                "font_size": self.page_settings.font_size,
-                "spacing_before": 0,
-                "spacing_after": 12,
-                "keep_with_next": True,
-                "page_break_before": True,
-            }
-        elif level == 1:
-            # Sections
-            return {
-                "text": text.upper(),
-                "bold": True,
-                "alignment": "left",
-                "font_size": self.page_settings.font_size,
-                "spacing_before": 12,
-                "spacing_after": 12,
-                "keep_with_next": True,
-            }
-        elif level == 2:
-            # Subsections
-            return {
-                "text": text.capitalize() if not text[0].isupper() else text,
-                "bold": True,
-                "alignment": "left",
-                "font_size": self.page_settings.font_size,
-                "spacing_before": 12,
-                "spacing_after": 6,
-                "keep_with_next": True,
-            }
+        if level in (0, 1):
+            formatted_text = upper_if_needed(text)
         else:
-            # Subsubsections
-            return {
-                "text": text.capitalize() if not text[0].isupper() else text,
-                "bold": False,
-                "alignment": "left",
-                "font_size": self.page_settings.font_size,
-                "spacing_before": 6,
-                "spacing_after": 6,
-                "keep_with_next": True,
-            }
+            formatted_text = self._cap_first(text)
+
+        template = _HEADING_TEMPLATES[level if level in (0, 1, 2) else 3]
+        return {
+            "text": formatted_text,
+            **template,
+            "font_size": self.page_settings.font_size,
+        }
 
     def format_paragraph(self, text: str) -> Dict[str, Any]:
         """
@@ -192,7 +261,7 @@ class GOSTFormatter:
             return f"[{number}, с. {page}]"
         return f"[{number}]"
 
-    def format_list_item(self, text: str, marker: str = "–") -> Dict[str, Any]:
+    def format_list_item(self, text: str, marker: str = LIST_MARKER) -> Dict[str, Any]:
         """
         Format list item according to GOST rules.
 
@@ -219,18 +288,7 @@ class GOSTFormatter:
         Returns:
             List of structural element names in order
         """
-        return [
-            "ТИТУЛЬНЫЙ ЛИСТ",
-            "РЕФЕРАТ",
-            "СОДЕРЖАНИЕ",
-            "ТЕРМИНЫ И ОПРЕДЕЛЕНИЯ",
-            "ПЕРЕЧЕНЬ СОКРАЩЕНИЙ И ОБОЗНАЧЕНИЙ",
-            "ВВЕДЕНИЕ",
-            "ОСНОВНАЯ ЧАСТЬ",
-            "ЗАКЛЮЧЕНИЕ",
-            "СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ",
-            "ПРИЛОЖЕНИЯ",
-        ]
+        return list(_STRUCTURAL_ELEMENTS_ORDER)
 
     def validate_structure(self, sections: List[str]) -> bool:
         """
@@ -242,18 +300,8 @@ class GOSTFormatter:
         Returns:
             True if structure is valid, False otherwise
         """
-        required_sections = {
-            "ТИТУЛЬНЫЙ ЛИСТ",
-            "РЕФЕРАТ",
-            "СОДЕРЖАНИЕ",
-            "ВВЕДЕНИЕ",
-            "ЗАКЛЮЧЕНИЕ",
-            "СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ",
-        }
-
         # Check if all required sections are present
-        sections_set = set(sections)
-        return required_sections.issubset(sections_set)
+        return _REQUIRED_SECTIONS.issubset(sections)
 
     def format_bibliography_entry(
         self,
@@ -276,48 +324,64 @@ class GOSTFormatter:
         Returns:
             Formatted bibliography entry
         """
-        if entry_type == "book":
-            authors_str = ", ".join(authors[:3])
-            if len(authors) > 3:
-                authors_str += " и др."
-
-            publisher = kwargs.get("publisher", "")
-            pages = kwargs.get("pages", "")
-
-            entry = f"{authors_str} {title}. – {publisher}, {year}."
-            if pages:
-                entry += f" – {pages} с."
-            return entry
-
-        elif entry_type == "article":
-            authors_str = ", ".join(authors[:3])
-            if len(authors) > 3:
-                authors_str += " и др."
-
-            journal = kwargs.get("journal", "")
-            volume = kwargs.get("volume", "")
-            number = kwargs.get("number", "")
-            pages = kwargs.get("pages", "")
-
-            entry = f"{authors_str} {title} // {journal}. – {year}."
-            if volume:
-                entry += f" – Т. {volume}."
-            if number:
-                entry += f" – № {number}."
-            if pages:
-                entry += f" – С. {pages}."
-            return entry
-
-        elif entry_type == "website":
-            url = kwargs.get("url", "")
-            access_date = kwargs.get("access_date", "")
-
-            entry = f"{title}. – URL: {url}"
-            if access_date:
-                entry += f" (дата обращения: {access_date})"
-            return entry
-
-        else:
-            # Default format
-            authors_str = ", ".join(authors) if authors else ""
-            return f"{authors_str} {title}. – {year}."
+        format_entry = self._BIBLIOGRAPHY_FORMATTERS.get(entry_type, self._format_default_entry)
+        return format_entry(authors, title, year, **kwargs)
+
+    @staticmethod
+    def _format_authors(authors: List[str]) -> str:
+        """Format author list, abbreviating more than three authors."""
+        authors_str = ", ".join(authors[:3])
+        if len(authors) > 3:
+            authors_str += " и др."
+        return authors_str
+
+    @staticmethod
+    def _format_book_entry(authors: List[str], title: str, year: int, **kwargs) -> str:
+        """Format book bibliography entry."""
+        publisher = kwargs.get("publisher", "")
+        pages = kwargs.get("pages", "")
+
+        parts = [GOSTFormatter._format_authors(authors), " ", str(title), ". – ", str(publisher), ", ", str(year), "."]
+        if pages:
+            parts += [" – ", str(pages), " с."]
+        return "".join(parts)
+
+    @staticmethod
+    def _format_article_entry(authors: List[str], title: str, year: int, **kwargs) -> str:
+        """Format journal article bibliography entry."""
+        journal = kwargs.get("journal", "")
+        volume = kwargs.get("volume", "")
+        number = kwargs.get("number", "")
+        pages = kwargs.get("pages", "")
+
+        parts = [GOSTFormatter._format_authors(authors), " ", str(title), " // ", str(journal), ". – ", str(year), "."]
+        if volume:
+            parts += [" – Т. ", str(volume), "."]
+        if number:
+            parts += [" – № ", str(number), "."]
+        if pages:
+            parts += [" – С. ", str(pages), "."]
+        return "".join(parts)
+
+    @staticmethod
+    def _format_website_entry(authors: List[str], title: str, year: int, **kwargs) -> str:
+        """Format website bibliography entry."""
+        url = kwargs.get("url", "")
+        access_date = kwargs.get("access_date", "")
+
+        parts = [str(title), ". – URL: ", str(url)]
+        if access_date:
+            parts += [" (дата обращения: ", str(access_date), ")"]
+        return "".join(parts)
+
+    @staticmethod
+    def _format_default_entry(authors: List[str], title: str, year: int, **kwargs) -> str:
+        """Format bibliography entry of unknown type."""
+        authors_str = ", ".join(authors) if authors else ""
+        return f"{authors_str} {title}. – {year}."
+
+    _BIBLIOGRAPHY_FORMATTERS = {
+        "book": _format_book_entry,
+        "article": _format_article_entry,
+        "website": _format_website_entry,
+    }
@@ -1,23 +1,201 @@
 """PDF report exporter using ReportLab."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, BinaryIO
 import io
+import threading
 from datetime import datetime
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import cm, mm
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, PageBreak,
-    Table, TableStyle, Image, KeepTogether
+    Table, TableStyle, Image, KeepTogether, Flowable
 )
 from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus.tableofcontents import TableOfContents
+from reportlab.platypus.paraparser import ParaParser, ParaFrag
+
+from .gost_formatter import GOSTFormatter, format_table_rows, upper_if_needed
+
+
+# Vertical spacing after body text paragraphs
+PARAGRAPH_SPACING = 0.3*cm
+
+# Page number footer
+PAGE_NUMBER_FONT_SIZE = 12
+PAGE_CENTER_X = A4[0] / 2
+
+_shared_resources: Optional[Tuple[str, StyleSheet1]] = None
+_shared_resources_lock = threading.Lock()
+_frag_prototypes: Dict[Tuple[str, str], ParaFrag] = {}
+
+
+def _register_font() -> str:
+    """Register Times New Roman font once per process (fallback to default if not available)."""
+    try:
+        pdfmetrics.registerFont(TTFont('TimesNewRoman', 'times.ttf'))
+        return 'TimesNewRoman'
+    except Exception:
+        # Use default font if Times New Roman is not available
+        return 'Times-Roman'
+
+
+def _build_styles(font_name: str) -> StyleSheet1:
+    """Build document styles according to GOST."""
+    styles = getSampleStyleSheet()
+
+    # GOST Normal style
+    styles.add(ParagraphStyle(
+        name='GOSTNormal',
+        fontName=font_name,
+        fontSize=14,
+        leading=21,  # 1.5 line spacing
+        alignment=TA_JUSTIFY,
+        firstLineIndent=12.5*mm,
+        spaceAfter=6,
+    ))
+
+    # GOST Heading 0 (structural elements)
+    styles.add(ParagraphStyle(
+        name='GOSTHeading0',
+        fontName=font_name,
+        fontSize=14,
+        leading=16,
+        alignment=TA_CENTER,
+        spaceBefore=0,
+        spaceAfter=12,
+        fontWeight='bold',
+    ))
+
+    # GOST Heading 1 (sections)
+    styles.add(ParagraphStyle(
+        name='GOSTHeading1',
+        fontName=font_name,
+        fontSize=14,
+        leading=16,
+        alignment=TA_LEFT,
+        spaceBefore=12,
+        spaceAfter=12,
+        fontWeight='bold',
+    ))
+
+    # GOST Heading 2 (subsections)
+    styles.add(ParagraphStyle(
+        name='GOSTHeading2',
+        fontName=font_name,
+        fontSize=14,
+        leading=16,
+        alignment=TA_LEFT,
+        spaceBefore=12,
+        spaceAfter=6,
+        fontWeight='bold',
+    ))
+
+    # Caption style
+    styles.add(ParagraphStyle(
+        name='Caption',
+        fontName=font_name,
+        fontSize=12,
+        leading=14,
+        alignment=TA_CENTER,
+        spaceAfter=6,
+    ))
+
+    # Bibliography style
+    styles.add(ParagraphStyle(
+        name='Bibliography',
+        fontName=font_name,
+        fontSize=14,
+        leading=21,
+        alignment=TA_LEFT,
+        leftIndent=10*mm,
+        firstLineIndent=-10*mm,
+        spaceAfter=6,
+    ))
+
+    return styles
+
+
+def _frag_prototype(style: ParagraphStyle, markup: str) -> ParaFrag:
+    """Get the parsed text fragment of markup for style, parsing it once per style."""
+    key = (style.name, markup)
+    prototype = _frag_prototypes.get(key)
+    if prototype is None:
+        _, frags, _ = ParaParser().parse(markup, style)
+        prototype = _frag_prototypes[key] = frags[0]
+    return prototype
+
+
+def _get_shared_resources() -> Tuple[str, StyleSheet1]:
+    """
+    Get the process-wide font name and GOST stylesheet.
+
+    Font registration parses the TTF file and the stylesheet is identical
+    for every report, so both are built once on first use and shared by
+    all exporter instances (ReportLab does not mutate paragraph styles).
+    """
+    global _shared_resources
+    if _shared_resources is None:
+        with _shared_resources_lock:
+            if _shared_resources is None:
+                font_name = _register_font()
+                _shared_resources = (font_name, _build_styles(font_name))
+    return _shared_resources
+
+
+class BoldParagraph(Paragraph):
+    """
+    Paragraph whose whole text is bold.
+
+    Headings are plain text wrapped in <b>...</b>, so instead of running
+    the ReportLab markup parser for each one, the text fragment is cloned
+    from a prototype parsed once per style. The text is used as is and
+    must not contain markup.
+    """
+
+    def __init__(self, text: str, style: ParagraphStyle):
+        super().__init__(text, style, frags=[_frag_prototype(style, "<b>x</b>").clone(text=text)])
+
+
+class PlainParagraph(Paragraph):
+    """
+    Paragraph of plain text without any markup.
+
+    Skips the ReportLab markup parser the same way as BoldParagraph. Use
+    only for text that contains no '<' or '&' characters.
+    """
+
+    def __init__(self, text: str, style: ParagraphStyle):
+        super().__init__(text, style, frags=[_frag_prototype(style, "x").clone(text=text)])
 
-from .gost_formatter import GOSTFormatter
+
+class BytesImage(Image):
+    """
+    Image flowable backed by in-memory image bytes.
+
+    The stock Image keeps an open image reader for file-like sources from
+    construction until the document is built. This one only reads the
+    image header to size itself and opens the reader just for drawing, so
+    at most one figure is held open at a time.
+    """
+
+    def __init__(self, image_bytes: bytes, width: float, height: float, kind: str = 'direct'):
+        super().__init__(io.BytesIO(image_bytes), width=width, height=height, kind=kind)
+        self._image_bytes = image_bytes
+        # Size is known now; release the reader until the image is drawn
+        self._img = self._file = None
+
+    def draw(self) -> None:
+        self._img = ImageReader(io.BytesIO(self._image_bytes))
+        try:
+            super().draw()
+        finally:
+            self._img = None
 
 
 class PDFExporter:
@@ -33,26 +211,26 @@ class PDFExporter:
         self.styles = None
         self.figure_counter = 0
         self.table_counter = 0
+        self._paragraph_cache: Dict[str, List[str]] = {}
 
-        # Try to register Times New Roman font (fallback to default if not available)
-        try:
-            pdfmetrics.registerFont(TTFont('TimesNewRoman', 'times.ttf'))
-            self.font_name = 'TimesNewRoman'
-        except:
-            # Use default font if Times New Roman is not available
-            self.font_name = 'Times-Roman'
+        self.font_name, _ = _get_shared_resources()
 
-    def create_document(self, report_data: Dict[str, Any]) -> bytes:
+    def create_document(
+        self,
+        report_data: Dict[str, Any],
+        out_stream: Optional[BinaryIO] = None
+    ) -> Optional[bytes]:
         """
         Create PDF document from report data.
 
         Args:
             report_data: Dictionary with report content
+            out_stream: Writable binary stream to render the PDF into (optional)
 
         Returns:
-            PDF file bytes
+            PDF file bytes, or None if the PDF was written to out_stream
         """
-        buffer = io.BytesIO()
+        buffer = out_stream if out_stream is not None else io.BytesIO()
 
         # Create document with GOST margins
         doc = SimpleDocTemplate(
@@ -82,130 +260,69 @@ class PDFExporter:
         # Build PDF
         doc.build(self.story, onFirstPage=self._add_page_number, onLaterPages=self._add_page_number)
 
-        buffer.seek(0)
-        return buffer.read()
+        if out_stream is not None:
+            return None
+        return buffer.getvalue()
 
     def _setup_styles(self) -> None:
         """Setup document styles according to GOST."""
-        self.styles = getSampleStyleSheet()
-
-        # GOST Normal style
-        self.styles.add(ParagraphStyle(
-            name='GOSTNormal',
-            fontName=self.font_name,
-            fontSize=14,
-            leading=21,  # 1.5 line spacing
-            alignment=TA_JUSTIFY,
-            firstLineIndent=12.5*mm,
-            spaceAfter=6,
-        ))
-
-        # GOST Heading 0 (structural elements)
-        self.styles.add(ParagraphStyle(
-            name='GOSTHeading0',
-            fontName=self.font_name,
-            fontSize=14,
-            leading=16,
-            alignment=TA_CENTER,
-            spaceBefore=0,
-            spaceAfter=12,
-            fontWeight='bold',
-        ))
-
-        # GOST Heading 1 (sections)
-        self.styles.add(ParagraphStyle(
-            name='GOSTHeading1',
-            fontName=self.font_name,
-            fontSize=14,
-            leading=16,
-            alignment=TA_LEFT,
-            spaceBefore=12,
-            spaceAfter=12,
-            fontWeight='bold',
-        ))
-
-        # GOST Heading 2 (subsections)
-        self.styles.add(ParagraphStyle(
-            name='GOSTHeading2',
-            fontName=self.font_name,
-            fontSize=14,
-            leading=16,
-            alignment=TA_LEFT,
-            spaceBefore=12,
-            spaceAfter=6,
-            fontWeight='bold',
-        ))
-
-        # Caption style
-        self.styles.add(ParagraphStyle(
-            name='Caption',
-            fontName=self.font_name,
-            fontSize=12,
-            leading=14,
-            alignment=TA_CENTER,
-            spaceAfter=6,
-        ))
-
-        # Bibliography style
-        self.styles.add(ParagraphStyle(
-            name='Bibliography',
-            fontName=self.font_name,
-            fontSize=14,
-            leading=21,
-            alignment=TA_LEFT,
-            leftIndent=10*mm,
-            firstLineIndent=-10*mm,
-            spaceAfter=6,
-        ))
+        _, self.styles = _get_shared_resources()
+
+    def _split_paragraphs(self, text: str) -> List[str]:
+        """Split text into non-empty paragraphs, caching the result per text."""
+        paragraphs = self._paragraph_cache.get(text)
+        if paragraphs is None:
+            paragraphs = [p for p in (s.strip() for s in text.split('\n\n')) if p]
+            self._paragraph_cache[text] = paragraphs
+        return paragraphs
+
+    def _build_paragraphs(self, text: str) -> List[Flowable]:
+        """Build body text paragraphs, each followed by the standard spacing."""
+        style = self.styles['GOSTNormal']
+        story = []
+        append = story.append
+        for para in self._split_paragraphs(text):
+            if '<' in para or '&' in para:
+                append(Paragraph(para, style))
+            else:
+                append(PlainParagraph(para, style))
+            append(Spacer(1, PARAGRAPH_SPACING))
+        return story
 
     def _add_page_number(self, canvas, doc) -> None:
         """Add page number to footer."""
-        canvas.saveState()
-        canvas.setFont(self.font_name, 12)
         page_number = canvas.getPageNumber()
-        if page_number > 1:  # Don't number title page
-            text = str(page_number)
-            canvas.drawCentredString(A4[0] / 2, 15*mm, text)
+        if page_number <= 1:  # Don't number title page
+            return
+
+        canvas.saveState()
+        if (canvas._fontname, canvas._fontsize) != (self.font_name, PAGE_NUMBER_FONT_SIZE):
+            canvas.setFont(self.font_name, PAGE_NUMBER_FONT_SIZE)
+        canvas.drawCentredString(PAGE_CENTER_X, 15*mm, str(page_number))
         canvas.restoreState()
 
     def _add_title_page(self, data: Dict[str, Any]) -> None:
         """Add title page."""
-        # Organization name
-        org = Paragraph(
-            f"<b>{data.get('organization', '')}</b>",
-            self.styles['GOSTHeading0']
-        )
-        self.story.append(org)
-        self.story.append(Spacer(1, 10*cm))
-
-        # Report type
-        report_type = Paragraph(
-            f"<b>{data.get('report_type', '').upper()}</b>",
-            self.styles['GOSTHeading0']
-        )
-        self.story.append(report_type)
-        self.story.append(Spacer(1, 1*cm))
-
-        # Title
-        title = Paragraph(
-            f"<b>{data.get('title', '')}</b>",
-            self.styles['GOSTHeading0']
-        )
-        self.story.append(title)
-        self.story.append(Spacer(1, 10*cm))
-
-        # Date
-        date = Paragraph(
-            data.get('date', ''),
-            self.styles['GOSTHeading0']
-        )
-        self.story.append(date)
-        self.story.append(PageBreak())
+        style = self.styles['GOSTHeading0']
+        self.story.extend([
+            # Organization name
+            BoldParagraph(data.get('organization', ''), style),
+            Spacer(1, 10*cm),
+            # Report type
+            BoldParagraph(upper_if_needed(data.get('report_type')), style),
+            Spacer(1, 1*cm),
+            # Title
+            BoldParagraph(data.get('title', ''), style),
+            Spacer(1, 10*cm),
+            # Date
+            Paragraph(data.get('date', ''), style),
+            PageBreak(),
+        ])
 
     def _add_abstract(self, data: Dict[str, Any]) -> None:
         """Add abstract section."""
         # Heading
-        heading = Paragraph("<b>РЕФЕРАТ</b>", self.styles['GOSTHeading0'])
+        heading = BoldParagraph("РЕФЕРАТ", self.styles['GOSTHeading0'])
         self.story.append(heading)
         self.story.append(Spacer(1, 1*cm))
 
@@ -224,7 +341,7 @@ class PDFExporter:
         # Keywords
         keywords = data.get("keywords", [])
         if keywords:
-            keywords_text = f"<b>КЛЮЧЕВЫЕ СЛОВА:</b> {', '.join(keywords).upper()}"
+            keywords_text = f"<b>КЛЮЧЕВЫЕ СЛОВА:</b> {upper_if_needed(', '.join(keywords))}"
             self.story.append(Paragraph(keywords_text, self.styles['GOSTNormal']))
             self.story.append(Spacer(1, 0.5*cm))
 
@@ -235,121 +352,150 @@ class PDFExporter:
 
     def _add_table_of_contents(self) -> None:
         """Add table of contents."""
-        # Heading
-        heading = Paragraph("<b>СОДЕРЖАНИЕ</b>", self.styles['GOSTHeading0'])
-        self.story.append(heading)
-        self.story.append(Spacer(1, 1*cm))
-
         # Add TOC (simplified version)
         # Note: For full TOC support, ReportLab requires additional setup
         toc_text = "ВВЕДЕНИЕ .......... 3"
-        self.story.append(Paragraph(toc_text, self.styles['GOSTNormal']))
-
-        self.story.append(PageBreak())
+        self.story.extend([
+            BoldParagraph("СОДЕРЖАНИЕ", self.styles['GOSTHeading0']),
+            Spacer(1, 1*cm),
+            Paragraph(toc_text, self.styles['GOSTNormal']),
+            PageBreak(),
+        ])
 
     def _add_introduction(self, data: Dict[str, Any]) -> None:
         """Add introduction section."""
         # Heading
-        heading = Paragraph("<b>ВВЕДЕНИЕ</b>", self.styles['GOSTHeading0'])
+        heading = BoldParagraph("ВВЕДЕНИЕ", self.styles['GOSTHeading0'])
         self.story.append(heading)
         self.story.append(Spacer(1, 0.5*cm))
 
         # Content
         text = data.get("text", "")
-        paragraphs = text.split('\n\n')
-        for para in paragraphs:
-            if para.strip():
-                self.story.append(Paragraph(para, self.styles['GOSTNormal']))
-                self.story.append(Spacer(1, 0.3*cm))
+        self.story.extend(self._build_paragraphs(text))
 
         self.story.append(PageBreak())
 
     def _add_main_sections(self, sections: List[Dict[str, Any]]) -> None:
         """Add main sections."""
-        for i, section in enumerate(sections, 1):
-            # Section heading
-            title = f"<b>{i} {section.get('title', '').upper()}</b>"
-            heading = Paragraph(title, self.styles['GOSTHeading1'])
-            self.story.append(heading)
-            self.story.append(Spacer(1, 0.5*cm))
-
-            # Section content
-            content = section.get("content", "")
-            if content:
-                paragraphs = content.split('\n\n')
-                for para in paragraphs:
-                    if para.strip():
-                        self.story.append(Paragraph(para, self.styles['GOSTNormal']))
-                        self.story.append(Spacer(1, 0.3*cm))
-
-            # Add subsections
-            for j, subsection in enumerate(section.get("subsections", []), 1):
-                # Subsection heading
-                subtitle = f"<b>{i}.{j} {subsection.get('title', '')}</b>"
-                subheading = Paragraph(subtitle, self.styles['GOSTHeading2'])
-                self.story.append(subheading)
-                self.story.append(Spacer(1, 0.3*cm))
-
-                # Subsection content
-                subcontent = subsection.get("content", "")
-                if subcontent:
-                    paragraphs = subcontent.split('\n\n')
-                    for para in paragraphs:
-                        if para.strip():
-                            self.story.append(Paragraph(para, self.styles['GOSTNormal']))
-                            self.story.append(Spacer(1, 0.3*cm))
-
-                # Add figures
-                for figure in subsection.get("figures", []):
-                    self._add_figure(figure)
-
-                # Add tables
-                for table in subsection.get("tables", []):
-                    self._add_table(table)
+        # Figure and table numbering is continuous across sections, so each
+        # section gets its starting numbers up front and is built
+        # independently of the others.
+        figure_number = self.figure_counter
+        table_number = self.table_counter
 
-            self.story.append(PageBreak())
+        for i, section in enumerate(sections, 1):
+            self.story.extend(self._build_section(i, section, figure_number, table_number))
+
+            for subsection in section.get("subsections", []):
+                figure_number += len(subsection.get("figures", []))
+                table_number += len(subsection.get("tables", []))
+
+        self.figure_counter = figure_number
+        self.table_counter = table_number
+
+    def _build_section(
+        self,
+        number: int,
+        section: Dict[str, Any],
+        figure_start: int,
+        table_start: int
+    ) -> List[Flowable]:
+        """
+        Build flowables for a single main section.
 
-    def _add_figure(self, figure_data: Dict[str, Any]) -> None:
-        """Add figure to document."""
-        self.figure_counter += 1
+        Args:
+            number: Section number
+            section: Section data
+            figure_start: Number of figures preceding this section
+            table_start: Number of tables preceding this section
 
-        # Add image if available
+        Returns:
+            List of flowables for the section
+        """
+        story = []
+        figure_number = figure_start
+        table_number = table_start
+
+        # Section heading
+        title = f"{number} {upper_if_needed(section.get('title'))}"
+        story.append(BoldParagraph(title, self.styles['GOSTHeading1']))
+        story.append(Spacer(1, 0.5*cm))
+
+        # Section content
+        content = section.get("content", "")
+        if content:
+            story.extend(self._build_paragraphs(content))
+
+        # Add subsections
+        for j, subsection in enumerate(section.get("subsections", []), 1):
+            # Subsection heading
+            subtitle = f"{number}.{j} {subsection.get('title', '')}"
+            story.append(BoldParagraph(subtitle, self.styles['GOSTHeading2']))
+            story.append(Spacer(1, 0.3*cm))
+
+            # Subsection content
+            subcontent = subsection.get("content", "")
+            if subcontent:
+                story.extend(self._build_paragraphs(subcontent))
+
+            # Add figures
+            for figure in subsection.get("figures", []):
+                figure_number += 1
+                story.extend(self._build_figure(figure_number, figure))
+
+            # Add tables
+            for table in subsection.get("tables", []):
+                table_number += 1
+                story.extend(self._build_table(table_number, table))
+
+        story.append(PageBreak())
+        return story
+
+    def _build_figure(self, number: int, figure_data: Dict[str, Any]) -> List[Flowable]:
+        """Build figure flowables."""
+        story = []
+
+        # Add image if available; images on disk are read lazily by ReportLab
+        image_path = figure_data.get("image_path")
         image_bytes = figure_data.get("image_bytes")
-        if image_bytes:
+        if image_path or image_bytes:
             try:
-                image_stream = io.BytesIO(image_bytes)
-                img = Image(image_stream, width=15*cm, height=10*cm, kind='proportional')
-                self.story.append(img)
+                if image_path:
+                    img = Image(image_path, width=15*cm, height=10*cm, kind='proportional')
+                else:
+                    img = BytesImage(image_bytes, width=15*cm, height=10*cm, kind='proportional')
+                story.append(img)
             except Exception:
                 # Skip if image cannot be loaded
                 pass
 
         # Add caption
         caption = self.formatter.format_figure_caption(
-            self.figure_counter,
+            number,
             figure_data.get("title", "")
         )
-        self.story.append(Paragraph(caption, self.styles['Caption']))
-        self.story.append(Spacer(1, 0.5*cm))
+        story.append(Paragraph(caption, self.styles['Caption']))
+        story.append(Spacer(1, 0.5*cm))
+        return story
 
-    def _add_table(self, table_data: Dict[str, Any]) -> None:
-        """Add table to document."""
-        self.table_counter += 1
+    def _build_table(self, number: int, table_data: Dict[str, Any]) -> List[Flowable]:
+        """Build table flowables."""
+        story = []
 
         # Add caption
         caption = self.formatter.format_table_caption(
-            self.table_counter,
+            number,
             table_data.get("title", "")
         )
-        self.story.append(Paragraph(caption, self.styles['GOSTNormal']))
-        self.story.append(Spacer(1, 0.3*cm))
+        story.append(Paragraph(caption, self.styles['GOSTNormal']))
+        story.append(Spacer(1, 0.3*cm))
 
         # Create table
-        data = table_data.get("data", [])
+        rows = format_table_rows(table_data.get("data", []))
         headers = table_data.get("headers", [])
 
-        if data and headers:
-            table_data_list = [headers] + data
+        if rows and headers:
+            table_data_list = [list(headers)] + rows
 
             table = Table(table_data_list, hAlign='LEFT')
             table.setStyle(TableStyle([
@@ -365,60 +511,65 @@ class PDFExporter:
                 ('FONTSIZE', (0, 1), (-1, -1), 10),
             ]))
 
-            self.story.append(table)
+            story.append(table)
 
-        self.story.append(Spacer(1, 0.5*cm))
+        story.append(Spacer(1, 0.5*cm))
+        return story
 
     def _add_conclusion(self, data: Dict[str, Any]) -> None:
         """Add conclusion section."""
         # Heading
-        heading = Paragraph("<b>ЗАКЛЮЧЕНИЕ</b>", self.styles['GOSTHeading0'])
+        heading = BoldParagraph("ЗАКЛЮЧЕНИЕ", self.styles['GOSTHeading0'])
         self.story.append(heading)
         self.story.append(Spacer(1, 0.5*cm))
 
         # Content
         text = data.get("text", "")
-        paragraphs = text.split('\n\n')
-        for para in paragraphs:
-            if para.strip():
-                self.story.append(Paragraph(para, self.styles['GOSTNormal']))
-                self.story.append(Spacer(1, 0.3*cm))
+        self.story.extend(self._build_paragraphs(text))
 
         self.story.append(PageBreak())
 
     def _add_bibliography(self, bibliography: List[Dict[str, Any]]) -> None:
         """Add bibliography section."""
         # Heading
-        heading = Paragraph("<b>СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ</b>", self.styles['GOSTHeading0'])
+        heading = BoldParagraph("СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ", self.styles['GOSTHeading0'])
         self.story.append(heading)
         self.story.append(Spacer(1, 0.5*cm))
 
         # Bibliography entries
-        for i, entry in enumerate(bibliography, 1):
-            entry_text = self._format_bibliography_entry(entry)
-            full_text = f"{i}. {entry_text}"
-            self.story.append(Paragraph(full_text, self.styles['Bibliography']))
+        style = self.styles['Bibliography']
+        self.story.extend([
+            Paragraph(f"{i}. {self._format_bibliography_entry(entry)}", style)
+            for i, entry in enumerate(bibliography, 1)
+        ])
 
         self.story.append(PageBreak())
 
     def _format_bibliography_entry(self, entry: Dict[str, Any]) -> str:
         """Format bibliography entry."""
-        entry_type = entry.get("type", "website")
-
-        if entry_type == "website":
-            title = entry.get("title", "")
-            url = entry.get("url", "")
-            access_date = entry.get("access_date", "")
-
-            text = f"{title}"
-            if url:
-                text += f". – URL: {url}"
-            if access_date:
-                text += f" (дата обращения: {access_date})"
-
-            return text
-
-        return entry.get("title", "")
+        format_entry = self._BIBLIOGRAPHY_FORMATTERS.get(entry.get("type", "website"))
+        if format_entry is None:
+            return entry.get("title", "")
+        return format_entry(entry)
+
+    @staticmethod
+    def _format_website_entry(entry: Dict[str, Any]) -> str:
+        """Format website bibliography entry."""
+        title = entry.get("title", "")
+        url = entry.get("url", "")
+        access_date = entry.get("access_date", "")
+
+        parts = [str(title)]
+        if url:
+            parts += [". – URL: ", str(url)]
+        if access_date:
+            parts += [" (дата обращения: ", str(access_date), ")"]
+
+        return "".join(parts)
+
+    _BIBLIOGRAPHY_FORMATTERS = {
+        "website": _format_website_entry,
+    }
 
     def _add_appendices(self, appendices: List[Dict[str, Any]]) -> None:
         """Add appendices."""
@@ -427,8 +578,8 @@ class PDFExporter:
 
         for appendix in appendices:
             # Heading
-            heading = Paragraph(
-                f"<b>ПРИЛОЖЕНИЕ {appendix.get('letter', 'А')}</b>",
+            heading = BoldParagraph(
+                f"ПРИЛОЖЕНИЕ {appendix.get('letter', 'А')}",
                 self.styles['GOSTHeading0']
             )
             self.story.append(heading)
@@ -441,10 +592,6 @@ class PDFExporter:
 
             # Content
             content = appendix.get("content", "")
-            paragraphs = content.split('\n\n')
-            for para in paragraphs:
-                if para.strip():
-                    self.story.append(Paragraph(para, self.styles['GOSTNormal']))
-                    self.story.append(Spacer(1, 0.3*cm))
+            self.story.extend(self._build_paragraphs(content))
 
             self.story.append(PageBreak())
@@ -1,26 +1,121 @@
 """Main report generator orchestrator."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Sequence
 from pathlib import Path
 from datetime import datetime
+import asyncio
+import hashlib
 import logging
-from sqlalchemy.orm import Session
-
+import os
+import time
+import uuid
+from sqlalchemy import String, cast, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload, defer
+
+from app.core.database import AsyncSessionLocal
 from app.models.research import Research
 from app.models.report import Report, ReportFormat, ReportStatus
-from app.models.analysis_result import AnalysisResult
-from app.models.competitor import Competitor
 from app.models.collected_data import CollectedData
-from app.models.source_verification import SourceVerification
+from app.models.competitor import Competitor
+from app.models.data_source import DataSource
 
 from .content_generator import ContentGenerator
-from .visualization import VisualizationService
+from .visualization import VisualizationService, get_render_executor
 from .gost_formatter import GOSTFormatter
 from .docx_exporter import DOCXExporter
 from .pdf_exporter import PDFExporter
 
 logger = logging.getLogger(__name__)
 
+REPORTS_DIR = Path("./reports")
+FIGURES_DIR = REPORTS_DIR / "figures"
+
+# Figure files untouched for longer than any generation runs may be swept
+FIGURE_GRACE_PERIOD = 24 * 60 * 60  # seconds
+FIGURE_SWEEP_INTERVAL = 60 * 60  # seconds
+
+# Shared by all generators; per-report counters come from counter_scope()
+_visualization_service = VisualizationService()
+
+# Exporter class and file extension for each supported report format
+_EXPORTERS = {
+    ReportFormat.PDF: (PDFExporter, "pdf"),
+    ReportFormat.DOCX: (DOCXExporter, "docx"),
+}
+
+
+def _export_document(format: ReportFormat, report_data: Dict[str, Any]) -> bytes:
+    """Export report content to a document; runs inside a worker process."""
+    exporter_class, _ = _EXPORTERS[format]
+    return exporter_class().create_document(report_data)
+
+
+def _stale_figure_files(cutoff: float) -> List[Path]:
+    """Get figure files (and leftover temp files) last written or reused before cutoff."""
+    stale = []
+    for path in FIGURES_DIR.glob("*"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                stale.append(path)
+        except FileNotFoundError:
+            continue
+    return stale
+
+
+async def sweep_unused_figures(
+    db: AsyncSession,
+    grace_period: float = FIGURE_GRACE_PERIOD
+) -> int:
+    """
+    Delete figure files that no stored report refers to.
+
+    Figures are named by a hash of their contents and shared by reports,
+    so they are not deleted when a report is deleted or fails. Generations
+    still in flight have not stored their content yet; they write or touch
+    their figures, so only files untouched for the grace period are removed.
+
+    Args:
+        db: Database session
+        grace_period: Seconds a file must stay untouched before removal
+
+    Returns:
+        Number of deleted files
+    """
+    cutoff = time.time() - grace_period
+    removed = 0
+    for path in await asyncio.to_thread(_stale_figure_files, cutoff):
+        if path.suffix == ".png":
+            in_use = await db.scalar(
+                select(Report.id)
+                .where(cast(Report.content, String).contains(path.name))
+                .limit(1)
+            )
+            if in_use is not None:
+                continue
+        try:
+            # Skip files a generation reused while the query ran
+            if path.stat().st_mtime >= cutoff:
+                continue
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        removed += 1
+    return removed
+
+
+async def run_figure_sweeper(interval: float = FIGURE_SWEEP_INTERVAL) -> None:
+    """Periodically delete unused figure files; runs for the application lifetime."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                removed = await sweep_unused_figures(db)
+            if removed:
+                logger.info(f"Removed {removed} unused figure files")
+        except Exception:
+            logger.warning("Failed to sweep unused figure files", exc_info=True)
+        await asyncio.sleep(interval)
+
 
 class ReportGenerator:
     """
@@ -33,10 +128,8 @@ class ReportGenerator:
     def __init__(self, db: Session):
         self.db = db
         self.content_generator = ContentGenerator(db)
-        self.visualization_service = VisualizationService()
+        self.visualization_service = _visualization_service
         self.formatter = GOSTFormatter()
-        self.docx_exporter = DOCXExporter()
-        self.pdf_exporter = PDFExporter()
 
     async def generate_report(
         self,
@@ -53,85 +146,139 @@ class ReportGenerator:
         Returns:
             Generated Report instance
         """
-        try:
-            logger.info(f"Starting report generation for research {research.id}")
+        reports = await self.generate_reports(research, (format,))
+        return reports[0]
 
-            # Create report record
-            report = Report(
-                research_id=research.id,
-                title=research.title,
-                format=format,
-                status=ReportStatus.GENERATING
-            )
-            self.db.add(report)
-            self.db.commit()
+    async def generate_reports(
+        self,
+        research: Research,
+        formats: Sequence[ReportFormat] = (ReportFormat.PDF, ReportFormat.DOCX)
+    ) -> List[Report]:
+        """
+        Generate report for research in several formats at once.
 
-            # Collect data from database
-            analysis_results = self.db.query(AnalysisResult).filter(
-                AnalysisResult.research_id == research.id
-            ).all()
+        Report content is generated once and the documents are exported in
+        parallel worker processes.
 
-            competitors = self.db.query(Competitor).filter(
-                Competitor.research_id == research.id
-            ).all()
+        Args:
+            research: Research instance
+            formats: Report formats (PDF and/or DOCX)
 
-            collected_data = self.db.query(CollectedData).filter(
-                CollectedData.research_id == research.id
-            ).all()
+        Returns:
+            Generated Report instances, one per format
+        """
+        reports = []
+        try:
+            logger.info(f"Starting report generation for research {research.id}")
 
-            source_verifications = self.db.query(SourceVerification).join(
-                CollectedData
-            ).filter(
-                CollectedData.research_id == research.id
-            ).all()
+            # Create report records; flushing assigns the ids used for the
+            # file names while the whole generation stays in a single transaction
+            for format in formats:
+                report = Report(
+                    research_id=research.id,
+                    title=research.title,
+                    format=format,
+                    status=ReportStatus.GENERATING
+                )
+                self.db.add(report)
+                reports.append(report)
+            self.db.flush()
+
+            for format in formats:
+                if format not in _EXPORTERS:
+                    raise ValueError(f"Unsupported format: {format}")
+
+            # Collect data from database: each relationship is loaded with a
+            # single SELECT ... IN query instead of per-object lazy loads, and
+            # only with the columns the report reads (raw page content is
+            # never needed here)
+            research = self.db.query(Research).options(
+                selectinload(Research.analysis_results),
+                selectinload(Research.competitors).load_only(
+                    Competitor.name,
+                    Competitor.description,
+                    Competitor.market_share,
+                    Competitor.strengths,
+                    Competitor.weaknesses,
+                    Competitor.opportunities,
+                    Competitor.threats,
+                ),
+                selectinload(Research.collected_data).options(
+                    defer(CollectedData.raw_content),
+                    defer(CollectedData.processed_content),
+                    selectinload(CollectedData.source)
+                    .selectinload(DataSource.verifications),
+                ),
+            ).filter(Research.id == research.id).one()
+
+            analysis_results = research.analysis_results
+            competitors = research.competitors
+            collected_data = research.collected_data
+            source_verifications = list({
+                verification.id: verification
+                for data in collected_data
+                for verification in data.source.verifications
+            }.values())
 
             # Generate report content
             logger.info("Generating report content...")
-            report_data = await self._generate_report_content(
-                research,
-                analysis_results,
-                competitors,
-                collected_data,
-                source_verifications
-            )
-
-            # Export to requested format
-            logger.info(f"Exporting report to {format} format...")
-            if format == ReportFormat.PDF:
-                file_bytes = self.pdf_exporter.create_document(report_data)
-                file_extension = "pdf"
-            elif format == ReportFormat.DOCX:
-                file_bytes = self.docx_exporter.create_document(report_data)
-                file_extension = "docx"
-            else:
-                raise ValueError(f"Unsupported format: {format}")
-
-            # Save file
-            file_path = await self._save_report_file(
-                research.id,
-                report.id,
-                file_bytes,
-                file_extension
-            )
-
-            # Update report record
-            report.content = report_data
-            report.file_path = str(file_path)
-            report.file_size = len(file_bytes)
-            report.status = ReportStatus.COMPLETED
-            report.completed_at = datetime.utcnow()
+            with self.visualization_service.counter_scope():
+                report_data = await self._generate_report_content(
+                    research,
+                    analysis_results,
+                    competitors,
+                    collected_data,
+                    source_verifications
+                )
+
+            # Export to requested formats in parallel
+            logger.info(f"Exporting report to {', '.join(formats)} formats...")
+            loop = asyncio.get_running_loop()
+            documents = await asyncio.gather(*(
+                loop.run_in_executor(get_render_executor(), _export_document, format, report_data)
+                for format in formats
+            ))
+
+            for report, file_bytes in zip(reports, documents):
+                # Save file
+                file_path = await self._save_report_file(
+                    research.id,
+                    report.id,
+                    file_bytes,
+                    _EXPORTERS[report.format][1]
+                )
+
+                # Update report record
+                report.content = report_data
+                report.file_path = str(file_path)
+                report.file_size = len(file_bytes)
+                report.status = ReportStatus.COMPLETED
+                report.completed_at = datetime.utcnow()
 
             self.db.commit()
 
-            logger.info(f"Report generated successfully: {report.id}")
-            return report
+            logger.info(f"Reports generated successfully: {', '.join(str(r.id) for r in reports)}")
+            return reports
 
         except Exception as e:
             logger.error(f"Error generating report: {str(e)}", exc_info=True)
 
-            if report:
-                report.status = ReportStatus.FAILED
-                report.error_message = str(e)
+            if reports:
+                # The GENERATING rows were never committed, so discard the
+                # transaction and record the failure in a fresh one
+                failed_reports = [
+                    Report(
+                        id=report.id,
+                        research_id=report.research_id,
+                        title=report.title,
+                        format=report.format,
+                        status=ReportStatus.FAILED,
+                        error_message=str(e)
+                    )
+                    for report in reports
+                ]
+                self.db.rollback()
+                self.db.add_all(failed_reports)
                 self.db.commit()
 
             raise
@@ -145,29 +292,25 @@ class ReportGenerator:
         source_verifications: list
     ) -> Dict[str, Any]:
         """Generate complete report content."""
-        logger.info("Generating title page...")
-        title_page = await self.content_generator.generate_title_page(research)
-
-        logger.info("Generating abstract...")
-        abstract = await self.content_generator.generate_abstract(
-            research,
-            analysis_results
-        )
-
-        logger.info("Generating introduction...")
-        introduction = await self.content_generator.generate_introduction(
-            research,
-            analysis_results
-        )
-
-        logger.info("Generating main sections...")
-        main_sections = await self._generate_main_sections(
-            research,
-            analysis_results,
-            competitors,
-            collected_data
+        # Sections that only depend on the research data run in parallel
+        logger.info("Generating title page, abstract, introduction, main sections and bibliography...")
+        title_page, abstract, introduction, main_sections, bibliography = await asyncio.gather(
+            self.content_generator.generate_title_page(research),
+            self.content_generator.generate_abstract(research, analysis_results),
+            self.content_generator.generate_introduction(research, analysis_results),
+            self._generate_main_sections(
+                research,
+                analysis_results,
+                competitors,
+                collected_data
+            ),
+            self.content_generator.generate_bibliography(
+                collected_data,
+                source_verifications
+            ),
         )
 
+        # Conclusion is based on the other sections
         logger.info("Generating conclusion...")
         conclusion = await self.content_generator.generate_conclusion(
             research,
@@ -178,12 +321,6 @@ class ReportGenerator:
             }
         )
 
-        logger.info("Generating bibliography...")
-        bibliography = await self.content_generator.generate_bibliography(
-            collected_data,
-            source_verifications
-        )
-
         # Update abstract statistics
         abstract["statistics"] = {
             "pages": self._estimate_page_count(main_sections),
@@ -212,14 +349,24 @@ class ReportGenerator:
         collected_data: list
     ) -> list:
         """Generate all main sections of the report."""
+        logger.info("Generating industry, regional, competitor and trend analysis sections...")
+        (
+            industry_analysis,
+            regional_analysis,
+            competitor_analysis,
+            trend_analysis,
+            competitor_figures,
+        ) = await asyncio.gather(
+            self.content_generator.generate_industry_analysis(research, collected_data),
+            self.content_generator.generate_regional_analysis(research, analysis_results),
+            self.content_generator.generate_competitor_analysis(research, competitors),
+            self.content_generator.generate_trend_analysis(research, analysis_results),
+            self._create_competitor_figures(competitors),
+        )
+
         sections = []
 
         # Section 1: Industry Analysis
-        logger.info("Generating industry analysis section...")
-        industry_analysis = await self.content_generator.generate_industry_analysis(
-            research,
-            collected_data
-        )
         sections.append({
             "id": "industry",
             "title": "Анализ отрасли",
@@ -228,11 +375,6 @@ class ReportGenerator:
         })
 
         # Section 2: Regional Analysis
-        logger.info("Generating regional analysis section...")
-        regional_analysis = await self.content_generator.generate_regional_analysis(
-            research,
-            analysis_results
-        )
         sections.append({
             "id": "regional",
             "title": "Региональный анализ",
@@ -241,20 +383,34 @@ class ReportGenerator:
         })
 
         # Section 3: Competitor Analysis
-        logger.info("Generating competitor analysis section...")
-        competitor_analysis = await self.content_generator.generate_competitor_analysis(
-            research,
-            competitors
-        )
+        sections.append({
+            "id": "competitors",
+            "title": "Конкурентный анализ",
+            "content": competitor_analysis["text"],
+            "subsections": [],
+            "figures": competitor_figures,
+        })
 
-        # Add SWOT visualization if we have competitors
+        # Section 4: Trend Analysis
+        sections.append({
+            "id": "trends",
+            "title": "Анализ смежных отраслей и трендов",
+            "content": trend_analysis["text"],
+            "subsections": [],
+        })
+
+        return sections
+
+    async def _create_competitor_figures(self, competitors: list) -> list:
+        """Create competitor analysis figures."""
         figures = []
         if competitors:
             # Create SWOT diagram for top competitor
             top_competitor = competitors[0]
             if top_competitor.strengths and top_competitor.weaknesses:
                 try:
-                    swot_image = self.visualization_service.create_swot_diagram(
+                    swot_image = await self.visualization_service.render(
+                        "create_swot_diagram",
                         strengths=top_competitor.strengths or [],
                         weaknesses=top_competitor.weaknesses or [],
                         opportunities=top_competitor.opportunities or [],
@@ -263,33 +419,42 @@ class ReportGenerator:
                     )
                     figures.append({
                         "title": f"SWOT-анализ конкурента {top_competitor.name}",
-                        "image_bytes": swot_image,
+                        "image_path": str(await self._save_figure_file(swot_image)),
                     })
                 except Exception as e:
                     logger.warning(f"Failed to create SWOT diagram: {e}")
 
-        sections.append({
-            "id": "competitors",
-            "title": "Конкурентный анализ",
-            "content": competitor_analysis["text"],
-            "subsections": [],
-            "figures": figures,
-        })
+        return figures
 
-        # Section 4: Trend Analysis
-        logger.info("Generating trend analysis section...")
-        trend_analysis = await self.content_generator.generate_trend_analysis(
-            research,
-            analysis_results
-        )
-        sections.append({
-            "id": "trends",
-            "title": "Анализ смежных отраслей и трендов",
-            "content": trend_analysis["text"],
-            "subsections": [],
-        })
+    async def _save_figure_file(self, image_bytes: bytes) -> Path:
+        """
+        Save rendered figure to disk.
 
-        return sections
+        Report content keeps only the figure path, so the PNG bytes are not
+        held in memory or stored in the database with the report content.
+        Files are named by a hash of the image, so identical figures (e.g.
+        returned from the figure cache) are written once and shared by
+        reports; unused files are removed by sweep_unused_figures().
+        """
+        digest = hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+        file_path = FIGURES_DIR / f"{digest}.png"
+        await asyncio.to_thread(self._write_figure_file, file_path, image_bytes)
+        return file_path
+
+    @staticmethod
+    def _write_figure_file(file_path: Path, image_bytes: bytes) -> None:
+        """Write figure file, or touch it if it already exists."""
+        try:
+            # Reusing a file restarts its grace period before the sweep
+            os.utime(file_path)
+            return
+        except FileNotFoundError:
+            pass
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent writers of the same figure never expose a partial file
+        temp_path = file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex}.tmp")
+        temp_path.write_bytes(image_bytes)
+        os.replace(temp_path, file_path)
 
     async def _save_report_file(
         self,
@@ -299,47 +464,48 @@ class ReportGenerator:
         extension: str
     ) -> Path:
         """Save report file to disk."""
-        # Create reports directory if it doesn't exist
-        reports_dir = Path("./reports")
-        reports_dir.mkdir(exist_ok=True)
-
         # Create filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"report_{research_id}_{report_id}_{timestamp}.{extension}"
-        file_path = reports_dir / filename
+        file_path = REPORTS_DIR / filename
 
-        # Save file
-        with open(file_path, "wb") as f:
-            f.write(file_bytes)
+        # Save file in a worker thread so the event loop is not blocked by disk IO
+        await asyncio.to_thread(self._write_report_file, file_path, file_bytes)
 
         logger.info(f"Report file saved to {file_path}")
         return file_path
 
+    @staticmethod
+    def _write_report_file(file_path: Path, file_bytes: bytes) -> None:
+        """Write report file, creating its directory if it doesn't exist."""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "wb") as f:
+            f.write(file_bytes)
+
+    @staticmethod
+    def _count_words(text: str) -> int:
+        """
+        Approximate the number of words in text.
+
+        Counts separators with C-level str.count instead of building the
+        word list with split(); repeated whitespace makes it overcount
+        slightly, which is fine for page estimation.
+        """
+        if not text:
+            return 0
+        return text.count(' ') + text.count('\n') + 1
+
     def _estimate_page_count(self, sections: list) -> int:
         """Estimate total page count."""
-        # Simple estimation: ~500 words per page
-        total_words = 0
+        # Simple estimation: ~500 words per page; words, figures and tables
+        # are counted in a single pass over sections and subsections
+        total_words = total_figures = total_tables = 0
 
         for section in sections:
-            content = section.get("content", "")
-            total_words += len(content.split())
-
-            for subsection in section.get("subsections", []):
-                subcontent = subsection.get("content", "")
-                total_words += len(subcontent.split())
-
-        # Add pages for figures and tables
-        total_figures = sum(
-            len(section.get("figures", [])) +
-            sum(len(sub.get("figures", [])) for sub in section.get("subsections", []))
-            for section in sections
-        )
-
-        total_tables = sum(
-            len(section.get("tables", [])) +
-            sum(len(sub.get("tables", [])) for sub in section.get("subsections", []))
-            for section in sections
-        )
+            for part in (section, *section.get("subsections", ())):
+                total_words += self._count_words(part.get("content", ""))
+                total_figures += len(part.get("figures", ()))
+                total_tables += len(part.get("tables", ()))
 
         # Estimate: 500 words/page + 1 page per 2 figures/tables + fixed pages (title, abstract, etc.)
         estimated_pages = (total_words // 500) + (total_figures + total_tables) // 2 + 10
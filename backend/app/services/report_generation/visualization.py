@@ -1,21 +1,203 @@
 """Data visualization service for reports."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Iterator, TYPE_CHECKING
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+import asyncio
+import functools
+import hashlib
 import io
+import json
+import os
+import queue
+import textwrap
 import base64
-import matplotlib.pyplot as plt
-import matplotlib
-import seaborn as sns
-import pandas as pd
+import sys
 import numpy as np
-from matplotlib.figure import Figure
+from PIL import Image, ImageDraw, ImageFont
 
-# Use non-interactive backend
-matplotlib.use('Agg')
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    from matplotlib.figure import Figure
 
-# Set Russian font support
-plt.rcParams['font.family'] = 'DejaVu Sans'
-plt.rcParams['axes.unicode_minus'] = False
+# matplotlib, seaborn and pandas are slow to import, so they are loaded on
+# first render by _ensure_plotting() rather than when reports are imported
+plt = sns = pd = Figure = FigureCanvasAgg = font_manager = None
+
+
+def _ensure_plotting() -> None:
+    """Import and configure the plotting libraries once per process."""
+    global plt, sns, pd, Figure, FigureCanvasAgg, font_manager
+    if plt is not None:
+        return
+
+    import matplotlib
+    # Use non-interactive backend
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as _plt
+    import seaborn as _sns
+    import pandas as _pd
+    from matplotlib.figure import Figure as _Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg as _FigureCanvasAgg
+    from matplotlib import font_manager as _font_manager
+
+    # Set Russian font support
+    _plt.rcParams['font.family'] = 'DejaVu Sans'
+    _plt.rcParams['axes.unicode_minus'] = False
+
+    # Set seaborn style
+    _sns.set_style("whitegrid")
+    _sns.set_palette("husl")
+
+    sns, pd = _sns, _pd
+    Figure, FigureCanvasAgg, font_manager = _Figure, _FigureCanvasAgg, _font_manager
+    # Set last: it marks the libraries as loaded
+    plt = _plt
+
+@functools.lru_cache(maxsize=None)
+def _font_path(bold: bool = False) -> str:
+    """Get path of the DejaVu Sans TTF font bundled with matplotlib."""
+    _ensure_plotting()
+    return font_manager.findfont(
+        font_manager.FontProperties(family='DejaVu Sans', weight='bold' if bold else 'normal')
+    )
+
+
+# Number of points averaged in trend chart moving averages
+MOVING_AVERAGE_WINDOW = 3
+
+
+def _moving_average(values: np.ndarray, window: int = MOVING_AVERAGE_WINDOW) -> np.ndarray:
+    """
+    Compute trailing moving average, NaN-padded to the input length.
+
+    Equivalent to ``pd.Series(values).rolling(window).mean()`` without the
+    pandas per-call overhead, which dominates for short series.
+    """
+    result = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        result[window - 1:] = np.convolve(values, np.ones(window) / window, mode='valid')
+    return result
+
+
+# Blank default-size figures reused across charts (per process)
+FIGURE_POOL_SIZE = 4
+_figure_pool: "queue.Queue[Figure]" = queue.Queue(maxsize=FIGURE_POOL_SIZE)
+
+
+# Worker processes for rendering figures off the event loop (created on first use)
+_render_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _init_render_worker() -> None:
+    """
+    Warm up a rendering worker process when it starts.
+
+    Loads the plotting libraries, resolves fonts and draws a throwaway
+    figure so the font lookups and text caches are paid for at pool start
+    instead of by the first chart of a report.
+    """
+    _ensure_plotting()
+    _font_path()
+    _font_path(bold=True)
+
+    fig = Figure(figsize=(1, 1))
+    FigureCanvasAgg(fig)
+    fig.text(0.5, 0.5, "Ж", weight='bold')
+    fig.canvas.draw()
+
+
+def get_render_executor() -> ProcessPoolExecutor:
+    """Get the process pool used for figure and document rendering."""
+    global _render_executor
+    if _render_executor is None:
+        _render_executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_render_worker,
+        )
+    return _render_executor
+
+
+def shutdown_render_executor() -> None:
+    """Shut down the figure rendering process pool if it was started."""
+    global _render_executor
+    if _render_executor is not None:
+        _render_executor.shutdown(wait=False, cancel_futures=True)
+        _render_executor = None
+
+
+# Rendered figures by content hash of their arguments (least recently used first)
+FIGURE_CACHE_SIZE = 256
+_figure_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def _cache_key_default(value: Any) -> Any:
+    """Make figure arguments JSON-serializable for cache keys."""
+    # A DataFrame argument means pandas is already imported by the caller
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(value, pandas.DataFrame):
+        # str() of a DataFrame is truncated, so hash the full contents
+        return [
+            [str(c) for c in value.columns],
+            pandas.util.hash_pandas_object(value, index=True).tolist(),
+        ]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _cache_key_args(value: Any) -> Any:
+    """Normalize figure arguments so that dicts with any key type can be dumped."""
+    # JSON objects need str keys and json.dumps() never applies default= to
+    # keys, so dicts become ordered pairs keyed by repr() (dates, tuples, ...)
+    if isinstance(value, dict):
+        return [[repr(k), _cache_key_args(v)] for k, v in value.items()]
+    if isinstance(value, (list, tuple)):
+        return [_cache_key_args(v) for v in value]
+    return value
+
+
+def _get_cached_figure(key: str) -> Optional[bytes]:
+    """Get a rendered figure from the cache."""
+    image = _figure_cache.get(key)
+    if image is not None:
+        _figure_cache.move_to_end(key)
+    return image
+
+
+def _cache_figure(key: str, image: bytes) -> None:
+    """Store a rendered figure in the cache, evicting the oldest entries."""
+    _figure_cache[key] = image
+    _figure_cache.move_to_end(key)
+    while len(_figure_cache) > FIGURE_CACHE_SIZE:
+        _figure_cache.popitem(last=False)
+
+
+def _cached_figure(method: Callable[..., bytes]) -> Callable[..., bytes]:
+    """Memoize a figure creation method by a hash of its arguments."""
+    @functools.wraps(method)
+    def wrapper(self: "VisualizationService", *args, **kwargs) -> bytes:
+        key = self._figure_cache_key(method.__name__, args, kwargs)
+        image = _get_cached_figure(key)
+        if image is None:
+            _ensure_plotting()
+            image = method(self, *args, **kwargs)
+            _cache_figure(key, image)
+        return image
+
+    return wrapper
+
+
+# Figure and table counters of the report being generated (see counter_scope)
+_report_counters: ContextVar[Optional[Dict[str, int]]] = ContextVar("report_counters", default=None)
+
+
+def _render(service: "VisualizationService", method: str, kwargs: Dict[str, Any]) -> bytes:
+    """Call a figure creation method; runs inside a worker process."""
+    return getattr(service, method)(**kwargs)
 
 
 class VisualizationService:
@@ -26,15 +208,50 @@ class VisualizationService:
     """
 
     def __init__(self):
-        self.figure_counter = 0
-        self.table_counter = 0
+        self._counters = {"figures": 0, "tables": 0}
         self.default_figsize = (10, 6)
-        self.default_dpi = 300
+        self.default_dpi = 150
 
-        # Set seaborn style
-        sns.set_style("whitegrid")
-        sns.set_palette("husl")
+    async def render(self, method: str, **kwargs) -> bytes:
+        """
+        Render a figure in a worker process without blocking the event loop.
+
+        Matplotlib rendering is CPU-bound, so figures are created in a
+        process pool where several of them can render in parallel.
+        Figures already rendered with the same arguments are returned from
+        the cache.
+
+        Args:
+            method: Name of a figure creation method (e.g. "create_swot_diagram")
+            **kwargs: Arguments for the method (must be picklable)
+
+        Returns:
+            Image bytes (PNG format)
+        """
+        key = self._figure_cache_key(method, (), kwargs)
+        image = _get_cached_figure(key)
+        if image is None:
+            loop = asyncio.get_running_loop()
+            image = await loop.run_in_executor(
+                get_render_executor(),
+                functools.partial(_render, self, method, kwargs)
+            )
+            _cache_figure(key, image)
+        return image
+
+    def _figure_cache_key(self, method: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+        """Build a figure cache key from the method, its arguments and render settings."""
+        # Charts are drawn in dict insertion order, so keys of data dicts
+        # are not sorted; only keyword argument order is irrelevant
+        payload = json.dumps(
+            _cache_key_args(
+                [method, args, sorted(kwargs.items()), self.default_figsize, self.default_dpi]
+            ),
+            default=_cache_key_default,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
 
+    @_cached_figure
     def create_bar_chart(
         self,
         data: Dict[str, float],
@@ -56,20 +273,22 @@ class VisualizationService:
         Returns:
             Image bytes (PNG format)
         """
-        fig, ax = plt.subplots(figsize=self.default_figsize)
+        fig = self._new_figure()
+        ax = fig.add_subplot()
 
-        labels = list(data.keys())
-        values = list(data.values())
+        labels = list(data)
+        values = np.fromiter(data.values(), dtype=np.float64, count=len(data))
 
         ax.bar(labels, values, **kwargs)
         ax.set_xlabel(xlabel)
         ax.set_ylabel(ylabel)
         ax.set_title(title)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        fig.tight_layout()
 
         return self._figure_to_bytes(fig)
 
+    @_cached_figure
     def create_line_chart(
         self,
         data: Dict[str, List[float]],
@@ -93,20 +312,22 @@ class VisualizationService:
         Returns:
             Image bytes (PNG format)
         """
-        fig, ax = plt.subplots(figsize=self.default_figsize)
+        fig = self._new_figure()
+        ax = fig.add_subplot()
 
         for series_name, values in data.items():
-            ax.plot(x_labels, values, marker='o', label=series_name, **kwargs)
+            ax.plot(x_labels, np.asarray(values, dtype=np.float64), marker='o', label=series_name, **kwargs)
 
         ax.set_xlabel(xlabel)
         ax.set_ylabel(ylabel)
         ax.set_title(title)
         ax.legend()
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        fig.tight_layout()
 
         return self._figure_to_bytes(fig)
 
+    @_cached_figure
     def create_pie_chart(
         self,
         data: Dict[str, float],
@@ -124,17 +345,19 @@ class VisualizationService:
         Returns:
             Image bytes (PNG format)
         """
-        fig, ax = plt.subplots(figsize=self.default_figsize)
+        fig = self._new_figure()
+        ax = fig.add_subplot()
 
-        labels = list(data.keys())
-        values = list(data.values())
+        labels = list(data)
+        values = np.fromiter(data.values(), dtype=np.float64, count=len(data))
 
         ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90, **kwargs)
         ax.set_title(title)
-        plt.tight_layout()
+        fig.tight_layout()
 
         return self._figure_to_bytes(fig)
 
+    @_cached_figure
     def create_swot_diagram(
         self,
         strengths: List[str],
@@ -156,7 +379,8 @@ class VisualizationService:
         Returns:
             Image bytes (PNG format)
         """
-        fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+        fig = self._new_figure(figsize=(12, 10))
+        axes = fig.subplots(2, 2)
         fig.suptitle(title, fontsize=16, fontweight='bold')
 
         # Strengths (top-left)
@@ -191,13 +415,15 @@ class VisualizationService:
             '#FFD700'  # Light yellow
         )
 
-        plt.tight_layout()
+        fig.tight_layout()
         return self._figure_to_bytes(fig)
 
+    @_cached_figure
     def create_comparison_table(
         self,
-        data: pd.DataFrame,
-        title: str
+        data: "pd.DataFrame",
+        title: str,
+        renderer: str = "pil"
     ) -> bytes:
         """
         Create a comparison table visualization.
@@ -205,11 +431,85 @@ class VisualizationService:
         Args:
             data: DataFrame with comparison data
             title: Table title
+            renderer: "pil" to draw the table directly with Pillow (fast),
+                "matplotlib" to lay it out with matplotlib
 
         Returns:
             Image bytes (PNG format)
         """
-        fig, ax = plt.subplots(figsize=(12, len(data) * 0.5 + 2))
+        if renderer == "pil":
+            return self._render_table_pil(data, title)
+        return self._render_table_matplotlib(data, title)
+
+    def _render_table_pil(self, data: "pd.DataFrame", title: str) -> bytes:
+        """Draw comparison table directly on a Pillow image."""
+        scale = self.default_dpi / 72  # font sizes are in points
+        font = ImageFont.truetype(_font_path(), round(10 * scale))
+        header_font = ImageFont.truetype(_font_path(bold=True), round(10 * scale))
+        title_font = ImageFont.truetype(_font_path(bold=True), round(14 * scale))
+        padding = round(6 * scale)
+        row_height = round(20 * scale)
+        margin = round(10 * scale)
+        title_height = round(30 * scale)
+
+        header = [""] + [str(column) for column in data.columns]
+        rows = [
+            [str(label)] + [str(value) for value in values]
+            for label, values in zip(data.index, data.values.tolist())
+        ]
+
+        # Column widths fit the widest cell of each column
+        widths = [
+            round(max(
+                [header_font.getlength(header[i])] + [font.getlength(row[i]) for row in rows]
+            )) + 2 * padding
+            for i in range(len(header))
+        ]
+        table_width = sum(widths)
+        width = max(table_width, round(title_font.getlength(title)) + 2 * padding) + 2 * margin
+        height = title_height + row_height * (len(rows) + 1) + 2 * margin
+
+        image = Image.new('RGB', (width, height), 'white')
+        draw = ImageDraw.Draw(image)
+
+        # Title
+        draw.text((width / 2, margin + title_height / 2), title, fill='black', font=title_font, anchor='mm')
+
+        # Header row
+        left = (width - table_width) // 2
+        top = margin + title_height
+        draw.rectangle((left, top, left + table_width, top + row_height), fill='#4472C4')
+        x = left
+        for text, column_width in zip(header, widths):
+            draw.text((x + padding, top + row_height / 2), text, fill='white', font=header_font, anchor='lm')
+            x += column_width
+
+        # Body rows
+        for row in rows:
+            top += row_height
+            x = left
+            for text, column_width in zip(row, widths):
+                draw.text((x + padding, top + row_height / 2), text, fill='black', font=font, anchor='lm')
+                x += column_width
+
+        # Grid
+        bottom = top + row_height
+        table_top = margin + title_height
+        for y in range(table_top, bottom + 1, row_height):
+            draw.line((left, y, left + table_width, y), fill='black')
+        x = left
+        for column_width in [0] + widths:
+            x += column_width
+            draw.line((x, table_top, x, bottom), fill='black')
+
+        buf = io.BytesIO()
+        image.save(buf, format='PNG', compress_level=1)
+        return buf.getvalue()
+
+    def _render_table_matplotlib(self, data: "pd.DataFrame", title: str) -> bytes:
+        """Render comparison table with matplotlib."""
+        fig = self._new_figure(figsize=(12, len(data) * 0.5 + 2))
+        ax = fig.add_subplot()
         ax.axis('tight')
         ax.axis('off')
 
@@ -231,13 +531,14 @@ class VisualizationService:
             table[(0, i)].set_text_props(weight='bold', color='white')
 
         ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-        plt.tight_layout()
+        fig.tight_layout()
 
         return self._figure_to_bytes(fig)
 
+    @_cached_figure
     def create_heatmap(
         self,
-        data: pd.DataFrame,
+        data: "pd.DataFrame",
         title: str,
         **kwargs
     ) -> bytes:
@@ -252,17 +553,19 @@ class VisualizationService:
         Returns:
             Image bytes (PNG format)
         """
-        fig, ax = plt.subplots(figsize=self.default_figsize)
+        fig = self._new_figure()
+        ax = fig.add_subplot()
 
         sns.heatmap(data, annot=True, fmt='.2f', cmap='YlOrRd', ax=ax, **kwargs)
         ax.set_title(title)
-        plt.tight_layout()
+        fig.tight_layout()
 
         return self._figure_to_bytes(fig)
 
+    @_cached_figure
     def create_trend_chart(
         self,
-        data: pd.DataFrame,
+        data: "pd.DataFrame",
         title: str,
         xlabel: str = "Период",
         ylabel: str = "Значение"
@@ -279,7 +582,8 @@ class VisualizationService:
         Returns:
             Image bytes (PNG format)
         """
-        fig, ax = plt.subplots(figsize=self.default_figsize)
+        fig = self._new_figure()
+        ax = fig.add_subplot()
 
         # Plot original data
         for column in data.columns:
@@ -287,7 +591,7 @@ class VisualizationService:
 
             # Add moving average if enough data points
             if len(data) > 3:
-                ma = data[column].rolling(window=3).mean()
+                ma = _moving_average(data[column].to_numpy(dtype=np.float64))
                 ax.plot(data.index, ma, linestyle='--', label=f'{column} (скользящее среднее)')
 
         ax.set_xlabel(xlabel)
@@ -295,11 +599,12 @@ class VisualizationService:
         ax.set_title(title)
         ax.legend()
         ax.grid(True, alpha=0.3)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        fig.tight_layout()
 
         return self._figure_to_bytes(fig)
 
+    @_cached_figure
     def create_scatter_plot(
         self,
         x_data: List[float],
@@ -325,7 +630,8 @@ class VisualizationService:
         Returns:
             Image bytes (PNG format)
         """
-        fig, ax = plt.subplots(figsize=self.default_figsize)
+        fig = self._new_figure()
+        ax = fig.add_subplot()
 
         ax.scatter(x_data, y_data, **kwargs)
 
@@ -338,13 +644,13 @@ class VisualizationService:
         ax.set_ylabel(ylabel)
         ax.set_title(title)
         ax.grid(True, alpha=0.3)
-        plt.tight_layout()
+        fig.tight_layout()
 
         return self._figure_to_bytes(fig)
 
     def _draw_swot_quadrant(
         self,
-        ax: plt.Axes,
+        ax: "plt.Axes",
         title: str,
         items: List[str],
         color: str
@@ -372,26 +678,40 @@ class VisualizationService:
 
     def _wrap_text(self, text: str, width: int) -> str:
         """Wrap text to specified width."""
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
-
-        for word in words:
-            if current_length + len(word) + 1 <= width:
-                current_line.append(word)
-                current_length += len(word) + 1
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-                current_length = len(word)
-
-        if current_line:
-            lines.append(' '.join(current_line))
+        return '\n  '.join(textwrap.wrap(text, width=width, break_long_words=False))
 
-        return '\n  '.join(lines)
+    def _new_figure(self, figsize: Optional[tuple] = None) -> "Figure":
+        """
+        Get a blank figure, reusing a pooled one for the default size.
 
-    def _figure_to_bytes(self, fig: Figure) -> bytes:
+        Figures are created without pyplot so they hold no global state
+        and can be cleared and reused across charts.
+        """
+        figsize = figsize or self.default_figsize
+        if figsize == self.default_figsize:
+            try:
+                fig = _figure_pool.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                if tuple(fig.get_size_inches()) == tuple(figsize):
+                    return fig
+
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig
+
+    def _release_figure(self, fig: "Figure") -> None:
+        """Clear a rendered figure and return it to the pool if it has the default size."""
+        if tuple(fig.get_size_inches()) != tuple(self.default_figsize):
+            return
+        fig.clear()
+        try:
+            _figure_pool.put_nowait(fig)
+        except queue.Full:
+            pass
+
+    def _figure_to_bytes(self, fig: "Figure") -> bytes:
         """
         Convert matplotlib figure to bytes.
 
@@ -402,22 +722,62 @@ class VisualizationService:
             Image bytes (PNG format)
         """
         buf = io.BytesIO()
-        fig.savefig(buf, format='png', dpi=self.default_dpi, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return buf.read()
+        # Layout is already tightened by each creator, so skip the extra
+        # bbox_inches='tight' layout pass; fast zlib level trades slightly
+        # larger files for much cheaper PNG encoding
+        fig.savefig(
+            buf,
+            format='png',
+            dpi=self.default_dpi,
+            pil_kwargs={'compress_level': 1},
+        )
+        self._release_figure(fig)
+        return buf.getvalue()
+
+    @contextmanager
+    def counter_scope(self) -> Iterator[None]:
+        """
+        Count figures and tables of one report separately.
+
+        The service is shared between reports, so counters inside the scope
+        are kept per context: concurrently generated reports (and the tasks
+        they spawn) only see their own counts.
+        """
+        token = _report_counters.set({"figures": 0, "tables": 0})
+        try:
+            yield
+        finally:
+            _report_counters.reset(token)
+
+    def _current_counters(self) -> Dict[str, int]:
+        """Get counters of the active counter scope or of the service itself."""
+        counters = _report_counters.get()
+        return self._counters if counters is None else counters
+
+    @property
+    def figure_counter(self) -> int:
+        """Number of figures created in the current scope."""
+        return self._current_counters()["figures"]
+
+    @property
+    def table_counter(self) -> int:
+        """Number of tables created in the current scope."""
+        return self._current_counters()["tables"]
 
     def increment_figure_counter(self) -> int:
         """Increment and return figure counter."""
-        self.figure_counter += 1
-        return self.figure_counter
+        counters = self._current_counters()
+        counters["figures"] += 1
+        return counters["figures"]
 
     def increment_table_counter(self) -> int:
         """Increment and return table counter."""
-        self.table_counter += 1
-        return self.table_counter
+        counters = self._current_counters()
+        counters["tables"] += 1
+        return counters["tables"]
 
     def reset_counters(self) -> None:
         """Reset figure and table counters."""
-        self.figure_counter = 0
-        self.table_counter = 0
+        counters = self._current_counters()
+        counters["figures"] = 0
+        counters["tables"] = 0
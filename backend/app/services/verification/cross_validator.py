@@ -1,14 +1,89 @@
 """Cross-validation service for data verification."""
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+from collections import OrderedDict
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import difflib
+import hashlib
+import re
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from app.models.collected_data import CollectedData
 from app.models.source_verification import DataValidation, VerificationStatus
 
+# SimHash prefilter: contents whose fingerprints differ in more bits are
+# treated as non-matching without exact matching. Only applied when both
+# contents are long, where exact matching is expensive and fingerprints of
+# the many tokens are stable.
+SIMHASH_MAX_DISTANCE = 12
+SIMHASH_MIN_LENGTH = 2000
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Length of content heads compared for differences of non-matching contents
+DIFF_MAX_CHARS = 8192
+
+
+# Fingerprints by digest of their text (least recently used first); the
+# texts themselves (long contents) are not kept alive by the cache
+SIMHASH_CACHE_SIZE = 256
+_simhash_cache: "OrderedDict[bytes, int]" = OrderedDict()
+
+
+def compute_simhash(text: str) -> int:
+    """
+    Compute 64-bit SimHash fingerprint of text.
+
+    Each word token is hashed to 64 bits; a fingerprint bit is set when
+    the bit is set in the majority of token hashes. Similar texts get
+    fingerprints with a small Hamming distance.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        Fingerprint as unsigned 64-bit integer
+    """
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    simhash = _simhash_cache.get(key)
+    if simhash is not None:
+        _simhash_cache.move_to_end(key)
+        return simhash
+
+    tokens = _TOKEN_RE.findall(text.lower())
+    if tokens:
+        digests = b"".join(
+            hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest() for token in tokens
+        )
+        bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(len(tokens), 64)
+        fingerprint = np.packbits(bits.sum(axis=0) * 2 > len(tokens))
+        simhash = int.from_bytes(fingerprint.tobytes(), "big")
+    else:
+        simhash = 0
+
+    _simhash_cache[key] = simhash
+    while len(_simhash_cache) > SIMHASH_CACHE_SIZE:
+        _simhash_cache.popitem(last=False)
+    return simhash
+
+
+def simhash_distances(simhash: int, simhashes: np.ndarray) -> np.ndarray:
+    """
+    Compute Hamming distances from a fingerprint to many fingerprints.
+
+    Args:
+        simhash: Fingerprint to compare
+        simhashes: Fingerprints to compare it with (uint64 array)
+
+    Returns:
+        Array with the number of differing bits for each fingerprint
+    """
+    differing = np.bitwise_xor(simhashes, np.uint64(simhash))
+    return np.unpackbits(differing.view(np.uint8)).reshape(len(differing), 64).sum(axis=1)
+
 
 class CrossValidator:
     """Service for cross-validating data from multiple sources."""
@@ -18,6 +93,19 @@ class CrossValidator:
         self.db = db
         self.similarity_threshold = 0.7  # Minimum similarity to consider as matching
 
+    @property
+    def similarity_threshold(self) -> float:
+        """Minimum similarity ratio (0-1) to consider contents as matching."""
+        return self._similarity_threshold
+
+    @similarity_threshold.setter
+    def similarity_threshold(self, threshold: float):
+        self._similarity_threshold = threshold
+        # RapidFuzz scores are on a 0-100 scale; comparing them against the
+        # threshold on the same scale avoids rescaling every score. Rounding
+        # drops float artifacts (0.7 * 100 == 70.00000000000001)
+        self._threshold_score = round(threshold * 100, 6)
+
     async def validate_data(
         self,
         collected_data: CollectedData,
@@ -36,22 +124,21 @@ class CrossValidator:
         if not related_data:
             return await self._create_unvalidated_result(collected_data)
 
-        # Compare content with related data
-        comparisons = []
-        for related in related_data:
-            comparison = self._compare_content(
-                collected_data.processed_content or collected_data.raw_content,
-                related.processed_content or related.raw_content,
-            )
-            comparisons.append({
-                "source_id": str(related.source_id),
-                "similarity": comparison["similarity"],
-                "is_matching": comparison["is_matching"],
-                "differences": comparison["differences"],
-            })
+        # Compare content with all related data at once
+        primary_text = collected_data.processed_content or collected_data.raw_content
+        related_texts = [related.processed_content or related.raw_content for related in related_data]
+        similarities, matching_mask = self._score_contents(primary_text, related_texts)
+        source_ids = [str(related.source_id) for related in related_data]
+        is_matching = matching_mask.tolist()
+
+        # Comparison details are kept in the validation record
+        comparisons = [
+            {"source_id": source_id, **self._build_comparison(primary_text, text, similarity, match)}
+            for source_id, text, similarity, match in zip(source_ids, related_texts, similarities, is_matching)
+        ]
 
         # Count matching and contradicting sources
-        matching = sum(1 for c in comparisons if c["is_matching"])
+        matching = int(matching_mask.sum())
         contradicting = len(comparisons) - matching
 
         # Calculate confidence score
@@ -85,7 +172,7 @@ class CrossValidator:
                 "comparisons": comparisons,
             },
             contradictions=contradictions if contradictions else None,
-            supporting_sources=[c["source_id"] for c in comparisons if c["is_matching"]],
+            supporting_sources=[source_id for source_id, match in zip(source_ids, is_matching) if match],
             validated_at=datetime.utcnow() if is_validated else None,
         )
 
@@ -114,6 +201,149 @@ class CrossValidator:
             content1: First content
             content2: Second content
 
+        Returns:
+            Dictionary with comparison results
+        """
+        if not content1 or not content2:
+            return self._build_comparison(content1, content2, 0.0, False)
+
+        # Re-scrapes of the same page are common; equal contents need no matching
+        if content1 == content2:
+            return self._build_comparison(content1, content2, 1.0, True)
+
+        # Contents too different in length can't match and are left unscored
+        if self._max_similarity(content1, content2) < self.similarity_threshold:
+            return self._build_comparison(content1, content2, None, False)
+
+        # Calculate similarity score (normalized Indel similarity, computed in C++)
+        score = fuzz.ratio(content1, content2)
+
+        return self._build_comparison(
+            content1, content2, score / 100.0, score >= self._threshold_score
+        )
+
+    def _compare_contents(self, content: str, others: List[str]) -> List[Dict]:
+        """
+        Compare content with several other pieces of content.
+
+        All similarity ratios are computed in a single RapidFuzz call
+        that runs in parallel outside the interpreter. Contents that can't
+        match by length, and long contents too far apart by SimHash, are not
+        matched and get a similarity of None.
+
+        Args:
+            content: Content to compare
+            others: Contents to compare it with
+
+        Returns:
+            List of comparison results, one per item of others
+        """
+        similarities, matching = self._score_contents(content, others)
+
+        return [
+            self._build_comparison(content, other, similarity, is_matching)
+            for other, similarity, is_matching in zip(others, similarities, matching.tolist())
+        ]
+
+    def _score_contents(
+        self,
+        content: str,
+        others: List[str],
+    ) -> Tuple[List[Optional[float]], np.ndarray]:
+        """
+        Compute similarity of content to several other pieces of content.
+
+        Args:
+            content: Content to compare
+            others: Contents to compare it with
+
+        Returns:
+            Similarity ratios (0-1, None if not computed) and boolean mask
+            of matching contents, one item per item of others
+        """
+        if not content:
+            return [0.0] * len(others), np.zeros(len(others), dtype=bool)
+
+        # Only contents that differ from the compared one need matching;
+        # equal ones are fully similar and empty ones are never similar
+        similarities = [1.0 if other == content else 0.0 for other in others]
+        matching = np.fromiter((other == content for other in others), dtype=bool, count=len(others))
+        to_score = [i for i, other in enumerate(others) if other and other != content]
+
+        # Contents too different in length can't match and are left unscored
+        candidates = []
+        for i in to_score:
+            if self._max_similarity(content, others[i]) < self.similarity_threshold:
+                similarities[i] = None
+            else:
+                candidates.append(i)
+        to_score = candidates
+
+        # Long contents with distant fingerprints are left unscored
+        if len(content) >= SIMHASH_MIN_LENGTH:
+            long_items = [i for i in to_score if len(others[i]) >= SIMHASH_MIN_LENGTH]
+            if long_items:
+                distances = simhash_distances(
+                    compute_simhash(content),
+                    np.fromiter(
+                        (compute_simhash(others[i]) for i in long_items),
+                        dtype=np.uint64,
+                        count=len(long_items),
+                    ),
+                )
+                distant = set(np.asarray(long_items)[distances > SIMHASH_MAX_DISTANCE].tolist())
+                for i in distant:
+                    similarities[i] = None
+                to_score = [i for i in to_score if i not in distant]
+        if to_score:
+            scores = process.cdist(
+                [content],
+                [others[i] for i in to_score],
+                scorer=fuzz.ratio,
+                dtype=np.float64,
+                workers=-1,
+            )[0]
+            matching[to_score] = scores >= self._threshold_score
+            for i, score in zip(to_score, (scores / 100.0).tolist()):
+                similarities[i] = score
+
+        return similarities, matching
+
+    @staticmethod
+    def _max_similarity(content1: str, content2: str) -> float:
+        """
+        Get upper bound of the similarity ratio of two contents.
+
+        Turning one content into the other takes at least as many edits as
+        their length difference, which bounds the ratio from above in O(1)
+        (like SequenceMatcher.real_quick_ratio).
+
+        Args:
+            content1: First content
+            content2: Second content
+
+        Returns:
+            Maximum possible similarity ratio (0-1)
+        """
+        length1, length2 = len(content1), len(content2)
+        return 2 * min(length1, length2) / (length1 + length2)
+
+    def _build_comparison(
+        self,
+        content1: str,
+        content2: str,
+        similarity: Optional[float],
+        is_matching: bool,
+    ) -> Dict:
+        """
+        Build comparison result from a similarity ratio.
+
+        Args:
+            content1: First content
+            content2: Second content
+            similarity: Similarity ratio of the contents (0-1), None if not computed
+            is_matching: Whether the similarity reaches the threshold
+
         Returns:
             Dictionary with comparison results
         """
@@ -124,19 +354,14 @@ class CrossValidator:
                 "differences": ["One or both contents are empty"],
             }
 
-        # Calculate similarity ratio
-        similarity = difflib.SequenceMatcher(None, content1, content2).ratio()
-
-        # Determine if contents match
-        is_matching = similarity >= self.similarity_threshold
-
         # Find differences if not matching
         differences = []
         if not is_matching:
-            # Get detailed diff
+            # Get detailed diff; only the first lines are reported, so the
+            # heads of the contents are enough
             diff = difflib.unified_diff(
-                content1.splitlines(keepends=True),
-                content2.splitlines(keepends=True),
+                content1[:DIFF_MAX_CHARS].splitlines(keepends=True),
+                content2[:DIFF_MAX_CHARS].splitlines(keepends=True),
                 n=0,
             )
             differences = [line for line in diff if line.startswith('+') or line.startswith('-')]
@@ -211,15 +436,9 @@ class CrossValidator:
         """
         # This is a simplified implementation
         # In a real system, this would use more sophisticated NLP
-        # to extract and compare specific claims/facts
-
-        all_content = [primary_data.processed_content or primary_data.raw_content]
-        all_content.extend([d.processed_content or d.raw_content for d in related_data if d.processed_content or d.raw_content])
-
-        # Find most common content (simplified)
-        # In reality, we'd extract specific facts and find consensus on those
-        if not all_content:
-            return None
+        # to extract specific claims/facts and find consensus on those
+        # (e.g. the most common fact by hash), without keeping every
+        # related content in memory
 
         # For now, return the primary content if it's verified by majority
         return primary_data.processed_content or primary_data.raw_content
@@ -239,21 +458,22 @@ class CrossValidator:
         Returns:
             List of contradictions found
         """
-        contradictions = []
+        # Read contents once instead of per comparison and snippet
+        primary_text = collected_data.processed_content or collected_data.raw_content
+        related_texts = [related.processed_content or related.raw_content for related in related_data]
+        primary_snippet = (primary_text or "")[:200]
 
-        for related in related_data:
-            comparison = self._compare_content(
-                collected_data.processed_content or collected_data.raw_content,
-                related.processed_content or related.raw_content,
-            )
+        contradictions = []
+        comparisons = self._compare_contents(primary_text, related_texts)
 
+        for related, related_text, comparison in zip(related_data, related_texts, comparisons):
             if not comparison["is_matching"]:
                 contradictions.append({
                     "source_id": str(related.source_id),
                     "similarity": comparison["similarity"],
                     "differences": comparison["differences"][:10],  # Limit to 10
-                    "primary_content_snippet": (collected_data.processed_content or collected_data.raw_content)[:200],
-                    "contradicting_content_snippet": (related.processed_content or related.raw_content)[:200],
+                    "primary_content_snippet": primary_snippet,
+                    "contradicting_content_snippet": (related_text or "")[:200],
                 })
 
         return contradictions
@@ -271,22 +491,22 @@ class CrossValidator:
         Returns:
             Dictionary with validation report
         """
-        # Get all validations for this data
-        stmt = select(DataValidation).where(
-            DataValidation.collected_data_id == collected_data.id
+        # Get most recent validation for this data
+        stmt = (
+            select(DataValidation)
+            .where(DataValidation.collected_data_id == collected_data.id)
+            .order_by(DataValidation.created_at.desc())
+            .limit(1)
         )
         result = await self.db.execute(stmt)
-        validations = list(result.scalars().all())
+        latest_validation = result.scalar_one_or_none()
 
-        if not validations:
+        if latest_validation is None:
             return {
                 "has_validation": False,
                 "message": "No validation performed yet",
             }
 
-        # Get most recent validation
-        latest_validation = max(validations, key=lambda v: v.created_at)
-
         return {
             "has_validation": True,
             "is_validated": latest_validation.is_validated,
@@ -1,8 +1,13 @@
 """Fact-checking service for verifying claims and citations."""
 
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime
+import asyncio
+import functools
+import hashlib
 import re
+import time
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -11,14 +16,163 @@ from app.models.collected_data import CollectedData
 from app.models.data_source import DataSource
 from app.models.source_verification import SourceVerification, TrustedSource
 
+# Patterns are compiled once at import rather than looked up in the re
+# module cache (or recompiled after eviction) on every call
+
+# Sentences with specific patterns that indicate claims (simplified)
+_CLAIM_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(\d+(?:,\d+)*(?:\.\d+)?)\s*(процент|%|рубл|долл|евро|тыс|млн|млрд)',
+        r'(рост|снижение|увеличение|уменьшение|составил|достиг)\s+(?:на\s+)?(\d+)',
+        r'(в\s+\d{4}\s+году)',
+    )
+]
+
+# Every claim, statistics and reference pattern contains a digit
+_DIGIT_RE = re.compile(r'\d')
+
+# Maximum number of items kept by each extractor
+MAX_CLAIMS = 20
+MAX_STATISTICS = 30
+MAX_REFERENCES = 50
+MAX_CITATIONS = 50
+
+# Number of citation URLs probed (all at once) per check
+MAX_VERIFIED_CITATIONS = 20
+
+# Number of citation URLs probed at once (matches the connection pool size)
+MAX_CONCURRENT_PROBES = 50
+
+# Statuses of servers that do not support HEAD; probed with a ranged GET instead
+HEAD_UNSUPPORTED_STATUSES = frozenset({405, 501})
+
+# Delay before probing a timed out URL once more (seconds)
+CITATION_RETRY_DELAY = 0.5
+
+# Client error statuses that are temporary (like 5xx) and not cached
+TRANSIENT_CLIENT_STATUSES = frozenset({408, 429})
+
+# Content shorter than this cannot hold a claim worth checking
+MIN_FACT_CHECK_LENGTH = 32
+
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+# Statistical data patterns with their types
+_STAT_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), stat_type)
+    for pattern, stat_type in (
+        # Percentage: "составляет 25%", "рост на 10%"
+        (r'(\w+(?:\s+\w+)?)\s+(?:составляет|составил|равен|равна|достиг)\s+(\d+(?:,\d+)?)\s*%', 'percentage'),
+        # Money amounts: "10 млн рублей", "5.5 млрд долларов"
+        (r'(\d+(?:[,.]\d+)?)\s*(млн|млрд|тыс)\s*(рубл|долл|евро)', 'monetary'),
+        # Year-based stats: "в 2024 году составил"
+        (r'в\s+(\d{4})\s+году\s+(\w+)\s+составил\s+(\d+(?:[,.]\d+)?)', 'yearly'),
+    )
+]
+
+# Common reference patterns (simplified)
+_REF_PATTERNS = [
+    re.compile(pattern, re.MULTILINE)
+    for pattern in (
+        # Pattern: Author (Year). Title.
+        r'([А-ЯA-Z][а-яa-z]+(?:\s+[А-ЯA-Z]\.[А-ЯA-Z]\.)?)\s+\((\d{4})\)\.',
+        # Pattern: [1] Reference text
+        r'\[(\d+)\]\s+([^\n]+)',
+    )
+]
+
+# HTTP client shared by all fact checkers (created on first use)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the HTTP client used for citation checks.
+
+    One client is shared so that probes reuse keep-alive connections and
+    HTTP/2 streams to the same hosts across documents.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=FactChecker.timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=25),
+            follow_redirects=True,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client if it was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Extraction results by scanner and content digest (least recently used first).
+# Matches are kept as tuples rather than one dict per match; the dicts are
+# only built by the _extract_* methods whose results end up in the API/JSON
+EXTRACTION_CACHE_SIZE = 1024
+_extraction_cache: "OrderedDict[Tuple[str, bytes], tuple]" = OrderedDict()
+
+# Citation check results by URL: (expiry time, result bucket, entry)
+CITATION_CACHE_SIZE = 4096
+CITATION_CACHE_TTL = 3600  # 1 hour
+_citation_cache: "OrderedDict[str, Tuple[float, str, Dict]]" = OrderedDict()
+
+
+def _cached_extraction(method: Callable[..., tuple]) -> Callable[..., tuple]:
+    """Memoize a content scanning method by a digest of the content."""
+    @functools.wraps(method)
+    def wrapper(self: "FactChecker", content: str) -> tuple:
+        if not content:
+            return method(self, content)
+
+        key = (method.__name__, hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest())
+        result = _extraction_cache.get(key)
+        if result is None:
+            result = method(self, content)
+            _extraction_cache[key] = result
+            while len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+                _extraction_cache.popitem(last=False)
+        else:
+            _extraction_cache.move_to_end(key)
+        return result
+
+    return wrapper
+
+
+def _get_cached_citation(url: str) -> Optional[Tuple[str, Dict]]:
+    """Get a fresh citation check result from the cache."""
+    cached = _citation_cache.get(url)
+    if cached is None:
+        return None
+    expires_at, bucket, entry = cached
+    if expires_at < time.monotonic():
+        del _citation_cache[url]
+        return None
+    return bucket, entry
+
+
+def _cache_citation(url: str, bucket: str, entry: Dict) -> None:
+    """Store a citation check result, evicting the oldest entries."""
+    _citation_cache[url] = (time.monotonic() + CITATION_CACHE_TTL, bucket, entry)
+    _citation_cache.move_to_end(url)
+    while len(_citation_cache) > CITATION_CACHE_SIZE:
+        _citation_cache.popitem(last=False)
+
 
 class FactChecker:
     """Service for fact-checking data and verifying claims."""
 
+    timeout = 10.0
+
     def __init__(self, db: AsyncSession):
         """Initialize fact checker."""
         self.db = db
-        self.timeout = 10.0
 
     async def check_facts(
         self,
@@ -35,21 +189,103 @@ class FactChecker:
         Returns:
             Dictionary with fact-checking results
         """
+        claims, citations, stats = self._extract_all(collected_data)
+
+        # Verify citations/links
+        if citations:
+            verified_citations = await self._verify_citations(citations)
+        else:
+            verified_citations = self._group_citation_results([], {})
+
+        return self._record_fact_check(verification, claims, verified_citations, len(citations), stats)
+
+    async def check_facts_batch(
+        self,
+        items: List[Tuple[CollectedData, SourceVerification]],
+    ) -> List[Dict]:
+        """
+        Perform fact-checking on several pieces of collected data.
+
+        URLs cited by several documents are probed only once, and the
+        probes of all documents run concurrently.
+
+        Args:
+            items: Pairs of data to fact-check and verification record to update
+
+        Returns:
+            List of fact-checking results, one per item
+        """
+        extracted = [self._extract_all(collected_data) for collected_data, _ in items]
+
+        # Probe every cited URL once for the whole batch
+        urls = list(dict.fromkeys(
+            url
+            for _, citations, _ in extracted
+            for url in citations[:MAX_VERIFIED_CITATIONS]
+        ))
+        checked = await self._check_urls(urls)
+
+        return [
+            self._record_fact_check(
+                verification,
+                claims,
+                self._group_citation_results(citations[:MAX_VERIFIED_CITATIONS], checked),
+                len(citations),
+                stats,
+            )
+            for (_, verification), (claims, citations, stats) in zip(items, extracted)
+        ]
+
+    def _extract_all(
+        self,
+        collected_data: CollectedData,
+    ) -> Tuple[List[Dict], List[str], List[Dict]]:
+        """
+        Extract claims, citations and statistics from collected data.
+
+        Args:
+            collected_data: Data to extract from
+
+        Returns:
+            Tuple of claims, citation URLs and statistical data points
+        """
         content = collected_data.processed_content or collected_data.raw_content
 
-        # Extract claims from content
-        claims = self._extract_claims(content)
+        if not content or len(content) < MIN_FACT_CHECK_LENGTH:
+            # Nothing to check; passes vacuously
+            return [], [], []
 
-        # Verify citations/links
-        citations = self._extract_citations(content)
-        verified_citations = await self._verify_citations(citations)
+        # Statistical data is only extracted; in a real implementation, we
+        # would verify it against official sources
+        return (
+            self._extract_claims(content),
+            self._extract_citations(content),
+            self._extract_statistics(content),
+        )
+
+    def _record_fact_check(
+        self,
+        verification: SourceVerification,
+        claims: List[Dict],
+        verified_citations: Dict,
+        citations_count: int,
+        stats: List[Dict],
+    ) -> Dict:
+        """
+        Score fact-checking results and store them in the verification record.
 
-        # Check for statistical data
-        stats = self._extract_statistics(content)
-        # In a real implementation, we would verify these against official sources
+        Args:
+            verification: Verification record to update
+            claims: Claims found in the data
+            verified_citations: Results of citation verification
+            citations_count: Number of citations found in the data
+            stats: Statistical data points found in the data
 
+        Returns:
+            Dictionary with fact-checking results
+        """
         # Calculate fact-check score
-        total_claims = len(claims) + len(citations) + len(stats)
+        total_claims = len(claims) + citations_count + len(stats)
         verified_claims = len(verified_citations["valid"])
 
         fact_check_passed = True
@@ -91,30 +327,32 @@ class FactChecker:
         Returns:
             List of claims with metadata
         """
-        if not content:
-            return []
+        return [
+            {
+                "type": "numerical_claim",
+                "text": text,
+                "position": position,
+                "verified": False,
+            }
+            for text, position in self._scan_claims(content)
+        ]
 
-        claims = []
+    @_cached_extraction
+    def _scan_claims(self, content: str) -> Tuple[Tuple[str, int], ...]:
+        """Find claims in content as (text, position) pairs."""
+        if not content or not _DIGIT_RE.search(content):
+            return ()
 
-        # Look for sentences with specific patterns that indicate claims
-        # This is a simplified implementation
-        claim_patterns = [
-            r'(\d+(?:,\d+)*(?:\.\d+)?)\s*(процент|%|рубл|долл|евро|тыс|млн|млрд)',
-            r'(рост|снижение|увеличение|уменьшение|составил|достиг)\s+(?:на\s+)?(\d+)',
-            r'(в\s+\d{4}\s+году)',
-        ]
+        claims = []
 
-        for pattern in claim_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                claims.append({
-                    "type": "numerical_claim",
-                    "text": match.group(0),
-                    "position": match.start(),
-                    "verified": False,
-                })
+        for pattern in _CLAIM_PATTERNS:
+            for match in pattern.finditer(content):
+                claims.append((match.group(0), match.start()))
+                # Stop scanning once the limit is reached
+                if len(claims) == MAX_CLAIMS:
+                    return tuple(claims)
 
-        return claims[:20]  # Limit to 20 claims
+        return tuple(claims)
 
     def _extract_citations(self, content: str) -> List[str]:
         """
@@ -126,14 +364,22 @@ class FactChecker:
         Returns:
             List of URLs
         """
+        return list(self._scan_citations(content))
+
+    @_cached_extraction
+    def _scan_citations(self, content: str) -> Tuple[str, ...]:
+        """Find unique URLs in content in order of first occurrence."""
         if not content:
-            return []
+            return ()
 
-        # Extract URLs
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        urls = re.findall(url_pattern, content)
+        # Stop at the limit
+        urls = {}
+        for match in _URL_RE.finditer(content):
+            urls[match.group(0)] = None
+            if len(urls) == MAX_CITATIONS:
+                break
 
-        return list(set(urls))[:50]  # Limit to 50 unique URLs
+        return tuple(urls)
 
     async def _verify_citations(self, citations: List[str]) -> Dict:
         """
@@ -145,45 +391,130 @@ class FactChecker:
         Returns:
             Dictionary with valid and invalid citations
         """
-        valid = []
-        invalid = []
-        errors = []
-
-        for url in citations[:20]:  # Limit to 20 to avoid long processing
-            try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.head(url, follow_redirects=True)
-                    if response.status_code < 400:
-                        valid.append({
-                            "url": url,
-                            "status_code": response.status_code,
-                            "accessible": True,
-                        })
-                    else:
-                        invalid.append({
-                            "url": url,
-                            "status_code": response.status_code,
-                            "accessible": False,
-                            "error": f"HTTP {response.status_code}",
-                        })
-            except httpx.RequestError as e:
-                invalid.append({
-                    "url": url,
-                    "accessible": False,
-                    "error": str(e)[:100],
-                })
-            except Exception as e:
-                errors.append({
-                    "url": url,
-                    "error": str(e)[:100],
-                })
+        # Limit to avoid long processing
+        urls = citations[:MAX_VERIFIED_CITATIONS]
+        checked = await self._check_urls(urls)
 
-        return {
-            "valid": valid,
-            "invalid": invalid,
-            "errors": errors,
-            "total_checked": len(valid) + len(invalid) + len(errors),
-        }
+        return self._group_citation_results(urls, checked)
+
+    @staticmethod
+    def _group_citation_results(urls: List[str], checked: Dict[str, Tuple[str, Dict]]) -> Dict:
+        """
+        Group citation check results by outcome.
+
+        Args:
+            urls: Checked URLs to group
+            checked: Result bucket and entry by URL
+
+        Returns:
+            Dictionary with valid and invalid citations
+        """
+        results = {"valid": [], "invalid": [], "errors": []}
+        for url in urls:
+            bucket, entry = checked[url]
+            results[bucket].append(entry)
+        results["total_checked"] = len(urls)
+
+        return results
+
+    async def _check_urls(self, urls: List[str]) -> Dict[str, Tuple[str, Dict]]:
+        """
+        Check that URLs are accessible.
+
+        URLs checked recently (e.g. cited by other documents) are taken
+        from the cache; the others are probed concurrently over the shared
+        connection pool.
+
+        Args:
+            urls: Unique URLs to check
+
+        Returns:
+            Result bucket ("valid", "invalid" or "errors") and entry by URL
+        """
+        checked = {url: _get_cached_citation(url) for url in urls}
+        to_probe = [url for url, result in checked.items() if result is None]
+
+        if to_probe:
+            client = get_http_client()
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+
+            async def probe(url: str) -> httpx.Response:
+                async with semaphore:
+                    return await self._probe_citation(client, url)
+
+            responses = await asyncio.gather(
+                *(probe(url) for url in to_probe),
+                return_exceptions=True,
+            )
+
+            # Only definite HTTP outcomes are cached; network errors may be transient
+            for url, response in zip(to_probe, responses):
+                if isinstance(response, httpx.TimeoutException):
+                    # A slow server says nothing about the citation itself
+                    checked[url] = ("errors", {
+                        "url": url,
+                        "error": f"Timeout: {str(response)[:100]}",
+                    })
+                elif isinstance(response, httpx.RequestError):
+                    checked[url] = ("invalid", {
+                        "url": url,
+                        "accessible": False,
+                        "error": str(response)[:100],
+                    })
+                elif isinstance(response, Exception):
+                    checked[url] = ("errors", {
+                        "url": url,
+                        "error": str(response)[:100],
+                    })
+                elif response.status_code < 400:
+                    checked[url] = ("valid", {
+                        "url": url,
+                        "status_code": response.status_code,
+                        "accessible": True,
+                    })
+                    _cache_citation(url, *checked[url])
+                else:
+                    checked[url] = ("invalid", {
+                        "url": url,
+                        "status_code": response.status_code,
+                        "accessible": False,
+                        "error": f"HTTP {response.status_code}",
+                    })
+                    # Server errors and rate limits are probed again next time
+                    if (
+                        response.status_code < 500
+                        and response.status_code not in TRANSIENT_CLIENT_STATUSES
+                    ):
+                        _cache_citation(url, *checked[url])
+
+        return checked
+
+    async def _probe_citation(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """
+        Request the status of a citation URL without downloading its body.
+
+        Servers rejecting HEAD are asked for the first byte with a ranged
+        GET; a timed out probe is retried once after a short delay.
+
+        Args:
+            client: HTTP client to use
+            url: URL to probe
+
+        Returns:
+            Response with the status of the URL
+        """
+        try:
+            response = await client.head(url)
+        except httpx.TimeoutException:
+            await asyncio.sleep(CITATION_RETRY_DELAY)
+            response = await client.head(url)
+
+        if response.status_code in HEAD_UNSUPPORTED_STATUSES:
+            # The body is not read; the connection is dropped on exit
+            async with client.stream("GET", url, headers={"Range": "bytes=0-0"}) as response:
+                pass
+
+        return response
 
     def _extract_statistics(self, content: str) -> List[Dict]:
         """
@@ -195,32 +526,32 @@ class FactChecker:
         Returns:
             List of statistical data points
         """
-        if not content:
-            return []
+        return [
+            {
+                "type": stat_type,
+                "text": text,
+                "groups": groups,
+                "verified": False,
+            }
+            for stat_type, text, groups in self._scan_statistics(content)
+        ]
 
-        stats = []
+    @_cached_extraction
+    def _scan_statistics(self, content: str) -> Tuple[Tuple[str, str, tuple], ...]:
+        """Find statistical data in content as (type, text, groups) triples."""
+        if not content or not _DIGIT_RE.search(content):
+            return ()
 
-        # Patterns for statistical data
-        stat_patterns = [
-            # Percentage: "составляет 25%", "рост на 10%"
-            (r'(\w+(?:\s+\w+)?)\s+(?:составляет|составил|равен|равна|достиг)\s+(\d+(?:,\d+)?)\s*%', 'percentage'),
-            # Money amounts: "10 млн рублей", "5.5 млрд долларов"
-            (r'(\d+(?:[,.]\d+)?)\s*(млн|млрд|тыс)\s*(рубл|долл|евро)', 'monetary'),
-            # Year-based stats: "в 2024 году составил"
-            (r'в\s+(\d{4})\s+году\s+(\w+)\s+составил\s+(\d+(?:[,.]\d+)?)', 'yearly'),
-        ]
+        stats = []
 
-        for pattern, stat_type in stat_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                stats.append({
-                    "type": stat_type,
-                    "text": match.group(0),
-                    "groups": match.groups(),
-                    "verified": False,
-                })
+        for pattern, stat_type in _STAT_PATTERNS:
+            for match in pattern.finditer(content):
+                stats.append((stat_type, match.group(0), match.groups()))
+                # Stop scanning once the limit is reached
+                if len(stats) == MAX_STATISTICS:
+                    return tuple(stats)
 
-        return stats[:30]  # Limit to 30 stats
+        return tuple(stats)
 
     async def verify_against_official_sources(
         self,
@@ -305,29 +636,31 @@ class FactChecker:
         Returns:
             List of references with metadata
         """
-        if not content:
-            return []
+        return [
+            {
+                "text": text,
+                "groups": groups,
+                "position": position,
+            }
+            for text, groups, position in self._scan_references(content)
+        ]
 
-        references = []
+    @_cached_extraction
+    def _scan_references(self, content: str) -> Tuple[Tuple[str, tuple, int], ...]:
+        """Find references in content as (text, groups, position) triples."""
+        if not content or not _DIGIT_RE.search(content):
+            return ()
 
-        # Common reference patterns (simplified)
-        patterns = [
-            # Pattern: Author (Year). Title.
-            r'([А-ЯA-Z][а-яa-z]+(?:\s+[А-ЯA-Z]\.[А-ЯA-Z]\.)?)\s+\((\d{4})\)\.',
-            # Pattern: [1] Reference text
-            r'\[(\d+)\]\s+([^\n]+)',
-        ]
+        references = []
 
-        for pattern in patterns:
-            matches = re.finditer(pattern, content, re.MULTILINE)
-            for match in matches:
-                references.append({
-                    "text": match.group(0),
-                    "groups": match.groups(),
-                    "position": match.start(),
-                })
+        for pattern in _REF_PATTERNS:
+            for match in pattern.finditer(content):
+                references.append((match.group(0), match.groups(), match.start()))
+                # Stop scanning once the limit is reached
+                if len(references) == MAX_REFERENCES:
+                    return tuple(references)
 
-        return references[:50]  # Limit to 50 references
+        return tuple(references)
 
     async def check_citation_quality(
         self,
@@ -344,11 +677,12 @@ class FactChecker:
         """
         content = collected_data.processed_content or collected_data.raw_content
 
-        citations = self._extract_citations(content)
-        references = self.extract_references(content)
+        # Only the counts of matches are needed here
+        citations = self._scan_citations(content)
+        references = self._scan_references(content)
 
         # Verify citations
-        verified_citations = await self._verify_citations(citations)
+        verified_citations = await self._verify_citations(list(citations))
 
         total_citations = len(citations) + len(references)
         valid_citations = len(verified_citations["valid"])
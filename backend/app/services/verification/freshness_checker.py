@@ -3,12 +3,90 @@
 from typing import Optional, Dict
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
+from email.utils import parsedate_to_datetime
+import functools
 import re
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.collected_data import CollectedData
 from app.models.source_verification import SourceVerification, VerificationStatus
 
+_MONTHS_RU = {
+    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
+    'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
+    'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12,
+}
+
+# Common date formats in a single pattern, so that text is scanned once.
+# The named group of each format is followed by its three date parts.
+# Dates are delimited by non-digits rather than word boundaries, so that
+# dates inside longer digit runs are rejected while "2024-01-15T10:00" and
+# "15.01.2024г." still match
+_DATE_RE = re.compile(
+    r'(?<!\d)(?:'
+    # ISO format: 2024-01-15
+    r'(?P<iso>(\d{4})-(\d{2})-(\d{2}))'
+    # Russian format: 15.01.2024
+    r'|(?P<dotted>(\d{2})\.(\d{2})\.(\d{4}))'
+    # Russian month names: 15 января 2024
+    r'|(?P<month_name>(\d{1,2})\s+(' + '|'.join(_MONTHS_RU) + r')\s+(\d{4}))'
+    r')(?!\d)',
+    re.IGNORECASE,
+)
+
+# Every date format contains a four-digit year; the much simpler pattern
+# rules out dateless text faster than the full one
+_YEAR_RE = re.compile(r'\d{4}')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_exact_date(date_str: str) -> Optional[datetime]:
+    """Parse date string with the formats that fully specify the date."""
+    # Most metadata dates are ISO formatted, which is parsed in C
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+
+    # RFC 2822 dates of feeds and HTTP headers: "Mon, 15 Jan 2024 10:30:00 +0300"
+    try:
+        return parsedate_to_datetime(date_str)
+    except (ValueError, TypeError):
+        pass
+
+    # Unix timestamps in seconds (ten digits from 2001 to 2286)
+    if len(date_str) == 10 and date_str.isdigit():
+        return datetime.utcfromtimestamp(int(date_str))
+
+    return None
+
+
+def parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse date string to datetime.
+
+    Common formats are tried with specialized parsers first; the slow
+    fuzzy dateutil parser is the last resort. Results of the common
+    formats are cached: documents from the same feed often share
+    publication dates.
+
+    Args:
+        date_str: Date string in various formats
+
+    Returns:
+        datetime object or None
+    """
+    parsed = _parse_exact_date(date_str)
+    if parsed is not None:
+        return parsed
+
+    try:
+        # Try using dateutil parser (handles many formats); it fills missing
+        # fields from today, so its results are not cached
+        return date_parser.parse(date_str, fuzzy=True)
+    except (ValueError, TypeError):
+        return None
+
 
 class FreshnessChecker:
     """Service for checking data freshness and actuality."""
@@ -41,8 +119,35 @@ class FreshnessChecker:
         Returns:
             Dictionary with freshness check results
         """
-        # Extract content date from the collected data
-        content_date = await self._extract_content_date(collected_data)
+        return self._check_freshness(collected_data, category)
+
+    async def check_and_update_freshness(
+        self,
+        collected_data: CollectedData,
+        verification: SourceVerification,
+        category: str = "general",
+    ) -> SourceVerification:
+        """
+        Check freshness of collected data and record it in a verification.
+
+        Same as check_freshness followed by update_verification_freshness,
+        in a single step.
+
+        Args:
+            collected_data: CollectedData to check
+            verification: SourceVerification to update
+            category: Content category for threshold determination
+
+        Returns:
+            Updated SourceVerification
+        """
+        freshness_result = self._check_freshness(collected_data, category)
+        return self._apply_freshness(verification, freshness_result)
+
+    def _check_freshness(self, collected_data: CollectedData, category: str) -> Dict:
+        """Check freshness of collected data (see check_freshness)."""
+        # Extract content date from the collected data, unless it is already set
+        content_date = collected_data.content_date or self._extract_content_date(collected_data)
 
         if not content_date:
             return {
@@ -77,7 +182,7 @@ class FreshnessChecker:
 
         return result
 
-    async def _extract_content_date(self, collected_data: CollectedData) -> Optional[datetime]:
+    def _extract_content_date(self, collected_data: CollectedData) -> Optional[datetime]:
         """
         Extract content publication date from collected data.
 
@@ -119,14 +224,11 @@ class FreshnessChecker:
         Returns:
             datetime object or None
         """
-        if not date_str:
+        # Only strings can be parsed (and cached)
+        if not date_str or not isinstance(date_str, str):
             return None
 
-        try:
-            # Try using dateutil parser (handles many formats)
-            return date_parser.parse(date_str, fuzzy=True)
-        except (ValueError, TypeError):
-            return None
+        return parse_date(date_str)
 
     def _extract_date_from_text(self, text: str) -> Optional[datetime]:
         """
@@ -138,52 +240,28 @@ class FreshnessChecker:
         Returns:
             datetime object or None
         """
-        if not text:
+        if not text or not _YEAR_RE.search(text):
             return None
 
-        # Common date patterns
-        patterns = [
-            # ISO format: 2024-01-15
-            r'\b(\d{4})-(\d{2})-(\d{2})\b',
-            # Russian format: 15.01.2024
-            r'\b(\d{2})\.(\d{2})\.(\d{4})\b',
-            # Russian month names
-            r'\b(\d{1,2})\s+(января|февраля|марта|апреля|мая|июня|июля|августа|сентября|октября|ноября|декабря)\s+(\d{4})\b',
-        ]
-
-        months_ru = {
-            'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
-            'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
-            'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12,
-        }
-
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                match = matches[0]  # Take first match
+        # Take the first valid date in the text
+        for match in _DATE_RE.finditer(text):
+            if match.lastgroup == "iso":
+                # Parsed by a single C call
                 try:
-                    if isinstance(match, tuple) and len(match) == 3:
-                        if match[1] in months_ru:
-                            # Russian month name format
-                            day = int(match[0])
-                            month = months_ru[match[1]]
-                            year = int(match[2])
-                            return datetime(year, month, day)
-                        elif '-' in text[text.find(match[0]):text.find(match[0])+15]:
-                            # ISO format
-                            year = int(match[0])
-                            month = int(match[1])
-                            day = int(match[2])
-                            return datetime(year, month, day)
-                        else:
-                            # Russian DD.MM.YYYY format
-                            day = int(match[0])
-                            month = int(match[1])
-                            year = int(match[2])
-                            return datetime(year, month, day)
-                except (ValueError, IndexError):
+                    return datetime.fromisoformat(match.group("iso"))
+                except ValueError:
                     continue
 
+            index = match.lastindex
+            first, second, third = match.group(index + 1, index + 2, index + 3)
+            day = int(first)
+            month = int(second) if match.lastgroup == "dotted" else _MONTHS_RU[second.lower()]
+            year = int(third)
+            try:
+                return datetime(year, month, day)
+            except ValueError:
+                continue
+
         return None
 
     def _calculate_freshness_score(self, days_old: int, threshold: int) -> float:
@@ -197,15 +275,12 @@ class FreshnessChecker:
         Returns:
             Freshness score (0-1), where 1 is very fresh
         """
-        if days_old <= 0:
-            return 1.0
+        if threshold <= 0:
+            # No decay period: only content from today is fresh
+            return 1.0 if days_old <= 0 else 0.0
 
-        if days_old >= threshold * 2:
-            return 0.0
-
-        # Linear decay from 1.0 to 0.0
-        score = 1.0 - (days_old / (threshold * 2))
-        return max(0.0, min(1.0, score))
+        # Linear decay from 1.0 to 0.0 over twice the threshold, clamped
+        return min(1.0, max(0.0, 1.0 - days_old / (2.0 * threshold)))
 
     async def check_for_updates(self, collected_data: CollectedData) -> Dict:
         """
@@ -242,26 +317,38 @@ class FreshnessChecker:
         Returns:
             Updated SourceVerification
         """
+        return self._apply_freshness(verification, freshness_result)
+
+    def _apply_freshness(
+        self,
+        verification: SourceVerification,
+        freshness_result: Dict,
+    ) -> SourceVerification:
+        """Update verification record with freshness check results (see update_verification_freshness)."""
+        is_outdated = freshness_result.get("is_outdated", False)
+
         verification.last_update_check = datetime.utcnow()
         verification.content_date = freshness_result.get("content_date")
-        verification.is_outdated = freshness_result.get("is_outdated", False)
+        verification.is_outdated = is_outdated
         verification.days_since_update = freshness_result.get("days_old")
 
         # Add freshness issues if outdated
-        if freshness_result.get("is_outdated"):
+        # JSON columns are assigned new values at most once: in-place changes
+        # to loaded values are not tracked by the session
+        if is_outdated:
             issues = verification.issues_found or []
             if "outdated_content" not in issues:
-                issues.append("outdated_content")
-            verification.issues_found = issues
+                verification.issues_found = [*issues, "outdated_content"]
 
             # Update verification status if it was verified
             if verification.status == VerificationStatus.VERIFIED:
                 verification.status = VerificationStatus.FLAGGED
 
         # Update metadata
-        if not verification.verification_metadata:
-            verification.verification_metadata = {}
-        verification.verification_metadata["freshness_check"] = freshness_result
+        verification.verification_metadata = {
+            **(verification.verification_metadata or {}),
+            "freshness_check": freshness_result,
+        }
 
         return verification
 
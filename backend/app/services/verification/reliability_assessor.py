@@ -3,6 +3,10 @@
 from typing import Optional, Dict, List
 from datetime import datetime
 from urllib.parse import urlparse
+import bisect
+import functools
+import re
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -16,6 +20,63 @@ from app.models.source_verification import (
 )
 
 
+@functools.lru_cache(maxsize=10_000)
+def _url_domain(url: str) -> str:
+    """Extract domain from URL (sources are reassessed with the same URLs)."""
+    return urlparse(url).netloc
+
+
+def _indicator_pattern(*indicators: str) -> "re.Pattern[str]":
+    """Compile domain indicators into a single case-insensitive pattern."""
+    return re.compile("|".join(map(re.escape, indicators)), re.IGNORECASE)
+
+
+_GOVERNMENT_RE = _indicator_pattern(".gov.ru", ".ru/gov", "gosuslugi", "government")
+_EDUCATIONAL_RE = _indicator_pattern(".edu", ".ac.ru", "university", "institut")
+_RESEARCH_RE = _indicator_pattern("research", "scholar", "science", "academic", "nih.gov")
+_NEWS_RE = _indicator_pattern("news", "tass", "interfax", "ria", "rbc", "kommersant")
+
+# Domain heuristics for Russian sources with their trust scores, in order of precedence
+_DOMAIN_TRUST_HEURISTICS = [
+    (_GOVERNMENT_RE, 0.95),
+    (_EDUCATIONAL_RE, 0.85),
+    (_RESEARCH_RE, 0.80),
+    (_NEWS_RE, 0.60),
+]
+
+# Freshness scores by days since the last successful fetch: up to each
+# number of days, and beyond the last one. Scores decrease as data gets older
+_FRESHNESS_DAYS = np.array([1, 7, 30, 90, 180])
+_FRESHNESS_SCORES = np.array([1.0, 0.9, 0.7, 0.5, 0.3, 0.1])
+
+# Content quality by source type (source type as a proxy)
+_SOURCE_TYPE_QUALITY = {
+    "government": 0.9,
+    "api": 0.85,
+    "database": 0.8,
+    "news": 0.6,
+    "web_scraping": 0.5,
+}
+
+# Reliability ratings from the lowest score of each rating up
+_RATING_THRESHOLDS = [0.3, 0.5, 0.7, 0.9]
+_RATINGS = [
+    ReliabilityRating.UNRELIABLE,
+    ReliabilityRating.POOR,
+    ReliabilityRating.FAIR,
+    ReliabilityRating.GOOD,
+    ReliabilityRating.EXCELLENT,
+]
+
+# Verification statuses from the lowest score of each status up
+_STATUS_THRESHOLDS = [0.5, 0.7]
+_STATUSES = [
+    VerificationStatus.FAILED,
+    VerificationStatus.FLAGGED,
+    VerificationStatus.VERIFIED,
+]
+
+
 class ReliabilityAssessor:
     """Service for assessing source reliability."""
 
@@ -32,6 +93,19 @@ class ReliabilityAssessor:
             "cross_validation": 0.05,  # Validation against other sources
         }
 
+        # Trusted and blocked sources by domain, loaded on first use
+        self._trusted: Optional[Dict[str, TrustedSource]] = None
+        self._blocked: Optional[Dict[str, BlockedSource]] = None
+
+    async def _ensure_domain_index(self):
+        """Load trusted and blocked sources by domain, once per assessor."""
+        if self._trusted is None:
+            result = await self.db.execute(select(TrustedSource))
+            self._trusted = {trusted.domain: trusted for trusted in result.scalars()}
+        if self._blocked is None:
+            result = await self.db.execute(select(BlockedSource))
+            self._blocked = {blocked.domain: blocked for blocked in result.scalars()}
+
     async def assess_source(self, source: DataSource) -> SourceVerification:
         """
         Assess the reliability of a data source.
@@ -42,16 +116,49 @@ class ReliabilityAssessor:
         Returns:
             SourceVerification object with assessment results
         """
+        verifications = await self.assess_sources([source])
+        return verifications[0]
+
+    async def assess_sources(self, sources: List[DataSource]) -> List[SourceVerification]:
+        """
+        Assess the reliability of several data sources.
+
+        Trusted and blocked domains are loaded once, after which sources
+        are assessed without further database queries.
+
+        Args:
+            sources: DataSources to assess
+
+        Returns:
+            List of SourceVerification objects, one per source
+        """
+        await self._ensure_domain_index()
+        # All records of the batch share one timestamp
+        now = datetime.utcnow()
+        freshness_scores = self._calculate_freshness_scores(sources, now)
+        return [
+            self._assess_source(source, freshness_score, now)
+            for source, freshness_score in zip(sources, freshness_scores)
+        ]
+
+    def _assess_source(
+        self,
+        source: DataSource,
+        freshness_score: float,
+        now: datetime,
+    ) -> SourceVerification:
+        """Assess a data source once the domain index and freshness score are known."""
+        domain = self._extract_domain(source.url) if source.url else None
+
         # Check if source is in blacklist
-        is_blocked = await self._is_source_blocked(source)
-        if is_blocked:
-            return await self._create_blocked_verification(source)
+        blocked = self._get_blocking_record(domain)
+        if blocked:
+            return self._create_blocked_verification(source, blocked, now)
 
         # Calculate individual scores
-        domain_trust_score = await self._calculate_domain_trust(source)
+        domain_trust_score = self._calculate_domain_trust(domain)
         success_rate_score = self._calculate_success_rate(source)
-        freshness_score = self._calculate_freshness_score(source)
-        content_quality_score = await self._calculate_content_quality(source)
+        content_quality_score = self._calculate_content_quality(source)
 
         # Calculate overall reliability score
         reliability_score = (
@@ -75,8 +182,8 @@ class ReliabilityAssessor:
             reliability_score=reliability_score,
             trustworthiness_score=domain_trust_score,
             content_quality_score=content_quality_score,
-            last_update_check=datetime.utcnow(),
-            verified_at=datetime.utcnow() if status == VerificationStatus.VERIFIED else None,
+            last_update_check=now,
+            verified_at=now if status == VerificationStatus.VERIFIED else None,
             verification_metadata={
                 "domain_trust_score": domain_trust_score,
                 "success_rate_score": success_rate_score,
@@ -90,35 +197,28 @@ class ReliabilityAssessor:
 
         return verification
 
-    async def _is_source_blocked(self, source: DataSource) -> bool:
-        """Check if source domain is in blacklist."""
-        if not source.url:
-            return False
+    def _get_blocking_record(self, domain: Optional[str]) -> Optional[BlockedSource]:
+        """Get blacklist record of source domain, if any."""
+        if not domain:
+            return None
 
-        domain = self._extract_domain(source.url)
-        stmt = select(BlockedSource).where(BlockedSource.domain == domain)
-        result = await self.db.execute(stmt)
-        blocked = result.scalar_one_or_none()
-
-        return blocked is not None
+        return self._blocked.get(domain)
 
-    async def _create_blocked_verification(self, source: DataSource) -> SourceVerification:
+    def _create_blocked_verification(
+        self,
+        source: DataSource,
+        blocked: BlockedSource,
+        now: datetime,
+    ) -> SourceVerification:
         """Create verification record for blocked source."""
-        domain = self._extract_domain(source.url) if source.url else "unknown"
-
-        # Get block reason
-        stmt = select(BlockedSource).where(BlockedSource.domain == domain)
-        result = await self.db.execute(stmt)
-        blocked = result.scalar_one_or_none()
-
         verification = SourceVerification(
             source_id=source.id,
             status=VerificationStatus.FAILED,
             reliability_rating=ReliabilityRating.UNRELIABLE,
             reliability_score=0.0,
             trustworthiness_score=0.0,
-            last_update_check=datetime.utcnow(),
-            verification_notes=f"Source is in blacklist: {blocked.reason if blocked else 'Unknown reason'}",
+            last_update_check=now,
+            verification_notes=f"Source is in blacklist: {blocked.reason or 'Unknown reason'}",
             issues_found=["blocked_source"],
         )
 
@@ -128,37 +228,31 @@ class ReliabilityAssessor:
 
         return verification
 
-    async def _calculate_domain_trust(self, source: DataSource) -> float:
+    def _calculate_domain_trust(self, domain: Optional[str]) -> float:
         """
         Calculate trust score based on domain reputation.
 
+        Args:
+            domain: Source domain, None for sources without URL
+
         Returns:
             Trust score (0-1)
         """
-        if not source.url:
+        if domain is None:
             return 0.5  # Neutral score for sources without URL
 
-        domain = self._extract_domain(source.url)
-
         # Check if domain is in trusted sources
-        stmt = select(TrustedSource).where(TrustedSource.domain == domain)
-        result = await self.db.execute(stmt)
-        trusted = result.scalar_one_or_none()
+        trusted = self._trusted.get(domain)
 
         if trusted:
             return trusted.trust_score
 
         # Domain heuristics for Russian sources
-        if self._is_government_domain(domain):
-            return 0.95
-        elif self._is_educational_domain(domain):
-            return 0.85
-        elif self._is_research_domain(domain):
-            return 0.80
-        elif self._is_news_domain(domain):
-            return 0.60
-        else:
-            return 0.50  # Unknown domain, neutral score
+        for pattern, trust_score in _DOMAIN_TRUST_HEURISTICS:
+            if pattern.search(domain):
+                return trust_score
+
+        return 0.50  # Unknown domain, neutral score
 
     def _calculate_success_rate(self, source: DataSource) -> float:
         """
@@ -169,33 +263,31 @@ class ReliabilityAssessor:
         """
         return source.success_rate if source.success_rate is not None else 0.5
 
-    def _calculate_freshness_score(self, source: DataSource) -> float:
+    def _calculate_freshness_scores(self, sources: List[DataSource], now: datetime) -> List[float]:
         """
-        Calculate score based on data freshness.
+        Calculate scores based on data freshness for several sources.
+
+        Args:
+            sources: Sources to score
+            now: Current time
 
         Returns:
-            Freshness score (0-1)
+            Freshness scores (0-1), one per source
         """
-        if not source.last_successful_fetch:
-            return 0.5  # Neutral for new sources
-
-        days_since_fetch = (datetime.utcnow() - source.last_successful_fetch).days
-
-        # Score decreases as data gets older
-        if days_since_fetch <= 1:
-            return 1.0
-        elif days_since_fetch <= 7:
-            return 0.9
-        elif days_since_fetch <= 30:
-            return 0.7
-        elif days_since_fetch <= 90:
-            return 0.5
-        elif days_since_fetch <= 180:
-            return 0.3
-        else:
-            return 0.1
-
-    async def _calculate_content_quality(self, source: DataSource) -> float:
+        scores = np.full(len(sources), 0.5)  # Neutral for new sources
+
+        fetched = [i for i, source in enumerate(sources) if source.last_successful_fetch]
+        if fetched:
+            days_since_fetch = np.fromiter(
+                ((now - sources[i].last_successful_fetch).days for i in fetched),
+                dtype=np.int64,
+                count=len(fetched),
+            )
+            scores[fetched] = _FRESHNESS_SCORES[np.searchsorted(_FRESHNESS_DAYS, days_since_fetch)]
+
+        return scores.tolist()
+
+    def _calculate_content_quality(self, source: DataSource) -> float:
         """
         Calculate score based on content quality.
 
@@ -204,22 +296,8 @@ class ReliabilityAssessor:
         """
         # This is a placeholder - in real implementation, this would analyze
         # the actual content quality using NLP techniques
-        # For now, we use source type as a proxy
-
-        score = 0.5  # Default neutral score
-
-        if source.source_type.value == "government":
-            score = 0.9
-        elif source.source_type.value == "api":
-            score = 0.85
-        elif source.source_type.value == "database":
-            score = 0.8
-        elif source.source_type.value == "news":
-            score = 0.6
-        elif source.source_type.value == "web_scraping":
-            score = 0.5
-
-        return score
+        # For now, we use source type as a proxy (neutral score by default)
+        return _SOURCE_TYPE_QUALITY.get(source.source_type.value, 0.5)
 
     def _get_reliability_rating(self, score: float) -> ReliabilityRating:
         """
@@ -231,16 +309,7 @@ class ReliabilityAssessor:
         Returns:
             ReliabilityRating enum value
         """
-        if score >= 0.9:
-            return ReliabilityRating.EXCELLENT
-        elif score >= 0.7:
-            return ReliabilityRating.GOOD
-        elif score >= 0.5:
-            return ReliabilityRating.FAIR
-        elif score >= 0.3:
-            return ReliabilityRating.POOR
-        else:
-            return ReliabilityRating.UNRELIABLE
+        return _RATINGS[bisect.bisect_right(_RATING_THRESHOLDS, score)]
 
     def _determine_verification_status(self, score: float) -> VerificationStatus:
         """
@@ -252,37 +321,27 @@ class ReliabilityAssessor:
         Returns:
             VerificationStatus enum value
         """
-        if score >= 0.7:
-            return VerificationStatus.VERIFIED
-        elif score >= 0.5:
-            return VerificationStatus.FLAGGED
-        else:
-            return VerificationStatus.FAILED
+        return _STATUSES[bisect.bisect_right(_STATUS_THRESHOLDS, score)]
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        parsed = urlparse(url)
-        return parsed.netloc
+        return _url_domain(url)
 
     def _is_government_domain(self, domain: str) -> bool:
         """Check if domain is a government domain."""
-        gov_indicators = [".gov.ru", ".ru/gov", "gosuslugi", "government"]
-        return any(indicator in domain.lower() for indicator in gov_indicators)
+        return _GOVERNMENT_RE.search(domain) is not None
 
     def _is_educational_domain(self, domain: str) -> bool:
         """Check if domain is an educational domain."""
-        edu_indicators = [".edu", ".ac.ru", "university", "institut"]
-        return any(indicator in domain.lower() for indicator in edu_indicators)
+        return _EDUCATIONAL_RE.search(domain) is not None
 
     def _is_research_domain(self, domain: str) -> bool:
         """Check if domain is a research domain."""
-        research_indicators = ["research", "scholar", "science", "academic", "nih.gov"]
-        return any(indicator in domain.lower() for indicator in research_indicators)
+        return _RESEARCH_RE.search(domain) is not None
 
     def _is_news_domain(self, domain: str) -> bool:
         """Check if domain is a news domain."""
-        news_indicators = ["news", "tass", "interfax", "ria", "rbc", "kommersant"]
-        return any(indicator in domain.lower() for indicator in news_indicators)
+        return _NEWS_RE.search(domain) is not None
 
     async def add_trusted_source(
         self,
@@ -320,6 +379,9 @@ class ReliabilityAssessor:
         await self.db.commit()
         await self.db.refresh(trusted_source)
 
+        if self._trusted is not None:
+            self._trusted[domain] = trusted_source
+
         return trusted_source
 
     async def block_source(
@@ -352,6 +414,9 @@ class ReliabilityAssessor:
         await self.db.commit()
         await self.db.refresh(blocked_source)
 
+        if self._blocked is not None:
+            self._blocked[domain] = blocked_source
+
         return blocked_source
 
     async def get_trusted_sources(self) -> List[TrustedSource]:
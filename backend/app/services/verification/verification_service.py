@@ -2,8 +2,12 @@
 
 from typing import List, Dict, Optional
 from datetime import datetime
+from collections import defaultdict
+import asyncio
+import bisect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import load_only
 
 from app.models.data_source import DataSource
 from app.models.collected_data import CollectedData
@@ -17,6 +21,72 @@ from app.services.verification.reliability_assessor import ReliabilityAssessor
 from app.services.verification.freshness_checker import FreshnessChecker
 from app.services.verification.cross_validator import CrossValidator
 from app.services.verification.fact_checker import FactChecker
+from app.utils.query_optimizer import QueryOptimizer
+
+# Maximum number of related data items used for cross-validation
+RELATED_DATA_LIMIT = 10
+
+# Sources scoring below this are not worth cross-validating or fact-checking
+MIN_VERIFIABLE_RELIABILITY = 0.2
+
+# Rows fetched per round-trip when streaming verification reports
+REPORT_YIELD_PER = 500
+
+# Source reliability levels by score, looked up with bisect_right
+_RELIABILITY_THRESHOLDS = [0.5, 0.7]
+_RELIABILITY_LEVELS = ["low", "medium", "high"]
+
+# Overall assessment rules, applied in order:
+# (results section, predicate on the section, list to append to, message,
+# recommendation). Messages are formatted with the section's values.
+# Cross-validation without compared sources has no confidence score and
+# is treated as inconclusive.
+_ASSESSMENT_RULES = (
+    (
+        "source_verification",
+        lambda source_ver: 0.5 <= (source_ver.get("reliability_score") or 0) < 0.7,
+        "warnings",
+        "Source has moderate reliability",
+        None,
+    ),
+    (
+        "source_verification",
+        lambda source_ver: (source_ver.get("reliability_score") or 0) < 0.5,
+        "issues",
+        "Source has low reliability score",
+        None,
+    ),
+    (
+        "freshness",
+        lambda freshness: freshness.get("is_outdated"),
+        "issues",
+        "Data is outdated ({days_old} days old)",
+        "Consider finding more recent data",
+    ),
+    (
+        "cross_validation",
+        lambda cross_val: cross_val.get("contradicting_sources", 0) > 0,
+        "warnings",
+        "Data contradicts other sources",
+        "Review contradicting sources for accuracy",
+    ),
+    (
+        "cross_validation",
+        lambda cross_val: (
+            (confidence := cross_val.get("confidence_score", 0)) is not None and confidence < 0.5
+        ),
+        "issues",
+        "Low confidence from cross-validation",
+        None,
+    ),
+    (
+        "fact_check",
+        lambda fact_check: not fact_check.get("fact_check_passed"),
+        "issues",
+        "Failed fact-checking",
+        "Verify claims against official sources",
+    ),
+)
 
 
 class VerificationService:
@@ -65,13 +135,10 @@ class VerificationService:
             latest_data = result.scalar_one_or_none()
 
             if latest_data:
-                freshness_result = await self.freshness_checker.check_freshness(
+                verification = await self.freshness_checker.check_and_update_freshness(
                     latest_data,
-                    category=source.category or "general",
-                )
-                verification = await self.freshness_checker.update_verification_freshness(
                     verification,
-                    freshness_result,
+                    category=source.category or "general",
                 )
 
         # Save verification
@@ -86,6 +153,8 @@ class VerificationService:
         collected_data: CollectedData,
         perform_cross_validation: bool = True,
         perform_fact_check: bool = True,
+        source: Optional[DataSource] = None,
+        related_data: Optional[List[CollectedData]] = None,
     ) -> Dict:
         """
         Perform complete verification of collected data.
@@ -94,6 +163,8 @@ class VerificationService:
             collected_data: CollectedData to verify
             perform_cross_validation: Whether to cross-validate
             perform_fact_check: Whether to perform fact-checking
+            source: Source of the data if already loaded
+            related_data: Related data from other sources if already loaded
 
         Returns:
             Dictionary with complete verification results
@@ -104,7 +175,9 @@ class VerificationService:
         }
 
         # 1. Get or create source verification
-        source = await self._get_source(collected_data.source_id)
+        if source is None:
+            source = await self._get_source(collected_data.source_id)
+        source_verification = None
         if source:
             source_verification = await self.verify_source(source, perform_full_check=False)
             results["source_verification"] = {
@@ -122,32 +195,55 @@ class VerificationService:
         )
         results["freshness"] = freshness_result
 
-        # 3. Cross-validation (if requested)
-        if perform_cross_validation:
-            # Find related data from other sources
-            related_data = await self._find_related_data(collected_data)
-            validation = await self.cross_validator.validate_data(
-                collected_data,
-                related_data,
+        # Skip cross-validation and fact-checking for blocked or clearly
+        # unreliable sources, the assessment would not change anyway
+        if source_verification:
+            if source_verification.status == VerificationStatus.FAILED:
+                results["skipped_reason"] = "source_blocked"
+            elif (source_verification.reliability_score or 0) < MIN_VERIFIABLE_RELIABILITY:
+                results["skipped_reason"] = "low_reliability"
+        if "skipped_reason" in results:
+            perform_cross_validation = False
+            perform_fact_check = False
+
+        # Fact-checking only probes citations over HTTP, so it runs while
+        # cross-validation queries the database (the session itself can't be
+        # used concurrently)
+        fact_check_task = None
+        if perform_fact_check and source_verification:
+            fact_check_task = asyncio.create_task(
+                self.fact_checker.check_facts(collected_data, source_verification)
             )
-            self.db.add(validation)
-
-            results["cross_validation"] = {
-                "id": str(validation.id),
-                "is_validated": validation.is_validated,
-                "status": validation.validation_status.value,
-                "confidence_score": validation.confidence_score,
-                "agreement_percentage": validation.agreement_percentage,
-                "matching_sources": validation.matching_sources_count,
-                "contradicting_sources": validation.contradicting_sources_count,
-            }
+
+        # 3. Cross-validation (if requested)
+        try:
+            if perform_cross_validation:
+                # Find related data from other sources
+                if related_data is None:
+                    related_data = await self._find_related_data(collected_data)
+                validation = await self.cross_validator.validate_data(
+                    collected_data,
+                    related_data,
+                )
+                self.db.add(validation)
+
+                results["cross_validation"] = {
+                    "id": str(validation.id),
+                    "is_validated": validation.is_validated,
+                    "status": validation.validation_status.value,
+                    "confidence_score": validation.confidence_score,
+                    "agreement_percentage": validation.agreement_percentage,
+                    "matching_sources": validation.matching_sources_count,
+                    "contradicting_sources": validation.contradicting_sources_count,
+                }
+        except BaseException:
+            if fact_check_task:
+                fact_check_task.cancel()
+            raise
 
         # 4. Fact-checking (if requested and source verification exists)
-        if perform_fact_check and source_verification:
-            fact_check_result = await self.fact_checker.check_facts(
-                collected_data,
-                source_verification,
-            )
+        if fact_check_task:
+            fact_check_result = await fact_check_task
             results["fact_check"] = fact_check_result
 
             # Flag if needed
@@ -163,16 +259,71 @@ class VerificationService:
 
         return results
 
+    async def verify_collected_data_batch(
+        self,
+        collected_data_list: List[CollectedData],
+        perform_cross_validation: bool = True,
+        perform_fact_check: bool = True,
+    ) -> List[Dict]:
+        """
+        Perform complete verification of several pieces of collected data.
+
+        Sources and related data of the whole batch are loaded with two
+        queries instead of two per item.
+
+        Args:
+            collected_data_list: CollectedData items to verify
+            perform_cross_validation: Whether to cross-validate
+            perform_fact_check: Whether to perform fact-checking
+
+        Returns:
+            List of verification results, one per item
+        """
+        sources = await QueryOptimizer.get_by_ids(
+            self.db,
+            DataSource,
+            {collected_data.source_id for collected_data in collected_data_list},
+        )
+
+        # Data of the same researches, for related data of each item
+        data_by_research: Dict[object, List[CollectedData]] = {}
+        if perform_cross_validation:
+            research_ids = {collected_data.research_id for collected_data in collected_data_list}
+            stmt = select(CollectedData).where(CollectedData.research_id.in_(research_ids))
+            result = await self.db.execute(stmt)
+            for data in result.scalars():
+                data_by_research.setdefault(data.research_id, []).append(data)
+
+        # Items share the session, so they are verified one at a time
+        results = []
+        for collected_data in collected_data_list:
+            related_data = None
+            if perform_cross_validation:
+                related_data = [
+                    data for data in data_by_research.get(collected_data.research_id, [])
+                    if data.id != collected_data.id and data.source_id != collected_data.source_id
+                ][:RELATED_DATA_LIMIT]
+
+            results.append(await self.verify_collected_data(
+                collected_data,
+                perform_cross_validation=perform_cross_validation,
+                perform_fact_check=perform_fact_check,
+                source=sources.get(collected_data.source_id),
+                related_data=related_data,
+            ))
+
+        return results
+
     async def _get_source(self, source_id) -> Optional[DataSource]:
         """Get data source by ID."""
-        stmt = select(DataSource).where(DataSource.id == source_id)
+        stmt = select(DataSource).where(DataSource.id == source_id).limit(1)
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        return result.scalars().first()
 
     async def _find_related_data(
         self,
         collected_data: CollectedData,
-        limit: int = 10,
+        limit: int = RELATED_DATA_LIMIT,
     ) -> List[CollectedData]:
         """
         Find related data from other sources for cross-validation.
@@ -213,49 +364,32 @@ class VerificationService:
             "recommendations": [],
         }
 
-        # Assess source verification
-        if "source_verification" in results:
-            source_ver = results["source_verification"]
-            reliability_score = source_ver.get("reliability_score", 0)
-
-            if reliability_score >= 0.7:
-                assessment["reliability"] = "high"
-                assessment["is_trustworthy"] = True
-                assessment["confidence_level"] = "high"
-            elif reliability_score >= 0.5:
-                assessment["reliability"] = "medium"
-                assessment["confidence_level"] = "medium"
-                assessment["warnings"].append("Source has moderate reliability")
-            else:
-                assessment["reliability"] = "low"
-                assessment["issues"].append("Source has low reliability score")
-
-        # Assess freshness
-        if "freshness" in results:
-            freshness = results["freshness"]
-            if freshness.get("is_outdated"):
-                assessment["issues"].append(f"Data is outdated ({freshness.get('days_old')} days old)")
-                assessment["recommendations"].append("Consider finding more recent data")
-
-        # Assess cross-validation
-        if "cross_validation" in results:
-            cross_val = results["cross_validation"]
-            if cross_val.get("contradicting_sources", 0) > 0:
-                assessment["warnings"].append("Data contradicts other sources")
-                assessment["recommendations"].append("Review contradicting sources for accuracy")
-
-            if cross_val.get("confidence_score", 0) >= 0.7:
-                assessment["is_trustworthy"] = True
-            elif cross_val.get("confidence_score", 0) < 0.5:
-                assessment["is_trustworthy"] = False
-                assessment["issues"].append("Low confidence from cross-validation")
-
-        # Assess fact-checking
-        if "fact_check" in results:
-            fact_check = results["fact_check"]
-            if not fact_check.get("fact_check_passed"):
-                assessment["issues"].append("Failed fact-checking")
-                assessment["recommendations"].append("Verify claims against official sources")
+        # Reliability level and trust from the source score
+        source_ver = results.get("source_verification")
+        if source_ver is not None:
+            reliability_score = source_ver.get("reliability_score") or 0
+            assessment["reliability"] = _RELIABILITY_LEVELS[
+                bisect.bisect_right(_RELIABILITY_THRESHOLDS, reliability_score)
+            ]
+            assessment["is_trustworthy"] = assessment["reliability"] == "high"
+
+        # Cross-validation confidence overrides trust when conclusive
+        cross_val = results.get("cross_validation")
+        if cross_val is not None:
+            confidence_score = cross_val.get("confidence_score", 0)
+            if confidence_score is not None:
+                if confidence_score >= 0.7:
+                    assessment["is_trustworthy"] = True
+                elif confidence_score < 0.5:
+                    assessment["is_trustworthy"] = False
+
+        # Issues, warnings and recommendations in a single pass over the rules
+        for section, predicate, severity, message, recommendation in _ASSESSMENT_RULES:
+            values = results.get(section)
+            if values is not None and predicate(values):
+                assessment[severity].append(message.format_map(defaultdict(lambda: None, values)))
+                if recommendation:
+                    assessment["recommendations"].append(recommendation)
 
         # Determine final confidence level
         if len(assessment["issues"]) == 0 and assessment["is_trustworthy"]:
@@ -288,12 +422,24 @@ class VerificationService:
             "data_validations": [],
         }
 
+        # Only the reported columns are loaded; metadata and validation
+        # details (comparisons with their diffs) can be large. Rows are
+        # streamed so at most REPORT_YIELD_PER ORM objects are buffered
         if source_id:
-            stmt = select(SourceVerification).where(
+            stmt = select(SourceVerification).options(load_only(
+                SourceVerification.status,
+                SourceVerification.reliability_score,
+                SourceVerification.reliability_rating,
+                SourceVerification.is_outdated,
+                SourceVerification.fact_check_passed,
+                SourceVerification.verified_at,
+                SourceVerification.issues_found,
+            )).where(
                 SourceVerification.source_id == source_id
             )
-            result = await self.db.execute(stmt)
-            verifications = list(result.scalars().all())
+            verifications = await self.db.stream_scalars(
+                stmt.execution_options(yield_per=REPORT_YIELD_PER)
+            )
 
             report["source_verifications"] = [
                 {
@@ -306,15 +452,22 @@ class VerificationService:
                     "verified_at": v.verified_at,
                     "issues_found": v.issues_found,
                 }
-                for v in verifications
+                async for v in verifications
             ]
 
         if collected_data_id:
-            stmt = select(DataValidation).where(
+            stmt = select(DataValidation).options(load_only(
+                DataValidation.is_validated,
+                DataValidation.validation_status,
+                DataValidation.confidence_score,
+                DataValidation.agreement_percentage,
+                DataValidation.validated_at,
+            )).where(
                 DataValidation.collected_data_id == collected_data_id
             )
-            result = await self.db.execute(stmt)
-            validations = list(result.scalars().all())
+            validations = await self.db.stream_scalars(
+                stmt.execution_options(yield_per=REPORT_YIELD_PER)
+            )
 
             report["data_validations"] = [
                 {
@@ -325,7 +478,7 @@ class VerificationService:
                     "agreement_percentage": v.agreement_percentage,
                     "validated_at": v.validated_at,
                 }
-                for v in validations
+                async for v in validations
             ]
 
         return report
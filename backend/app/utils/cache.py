@@ -1,13 +1,41 @@
 """Caching utilities using Redis."""
 
-import json
+import time
 import hashlib
-from typing import Any, Optional, Callable
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, Optional, Callable
 from functools import wraps
+import orjson
 from redis import asyncio as aioredis
 
 from app.core.config import settings
 
+# In-process cache tier in front of Redis: entries hold serialized payloads
+# and live only briefly, since invalidation can't reach other workers
+LOCAL_CACHE_MAXSIZE = 1024
+LOCAL_CACHE_TTL = 5  # seconds
+
+
+def _serialize(value: Any) -> bytes:
+    """Serialize a value for Redis, falling back to its string form."""
+    try:
+        return orjson.dumps(
+            value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    except orjson.JSONEncodeError:
+        return str(value).encode()
+
+
+def _deserialize(raw: Optional[bytes]) -> Optional[Any]:
+    """Deserialize a Redis value, returning non-JSON values as strings."""
+    if not raw:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return raw.decode()
+
 
 class CacheService:
     """Redis cache service."""
@@ -20,11 +48,8 @@ class CacheService:
     async def connect(self):
         """Connect to Redis."""
         if not self.redis:
-            self.redis = await aioredis.from_url(
-                str(settings.redis_url),
-                encoding="utf-8",
-                decode_responses=True
-            )
+            # Values stay raw bytes, (de)serialized with orjson
+            self.redis = await aioredis.from_url(str(settings.redis_url))
 
     async def close(self):
         """Close Redis connection."""
@@ -41,16 +66,22 @@ class CacheService:
         Returns:
             Cached value or None
         """
+        return _deserialize(await self.get_raw(key))
+
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        Get serialized value from cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached bytes or None
+        """
         if not self.redis:
             await self.connect()
 
-        value = await self.redis.get(key)
-        if value:
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return value
-        return None
+        return await self.redis.get(key)
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
@@ -61,6 +92,20 @@ class CacheService:
             value: Value to cache
             ttl: Time to live in seconds (default: 1 hour)
 
+        Returns:
+            True if successful
+        """
+        return await self.set_raw(key, _serialize(value), ttl)
+
+    async def set_raw(self, key: str, payload: bytes, ttl: Optional[int] = None) -> bool:
+        """
+        Set already serialized value in cache.
+
+        Args:
+            key: Cache key
+            payload: Serialized value
+            ttl: Time to live in seconds (default: 1 hour)
+
         Returns:
             True if successful
         """
@@ -69,12 +114,49 @@ class CacheService:
 
         ttl = ttl or self._default_ttl
 
-        try:
-            serialized_value = json.dumps(value)
-        except (TypeError, ValueError):
-            serialized_value = str(value)
+        return await self.redis.setex(key, ttl, payload)
 
-        return await self.redis.setex(key, ttl, serialized_value)
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values from cache in a single MGET round-trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values (None for misses) in the order of keys
+        """
+        if not keys:
+            return []
+        if not self.redis:
+            await self.connect()
+
+        return [_deserialize(value) for value in await self.redis.mget(keys)]
+
+    async def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Set several values in cache using one pipelined round-trip.
+
+        Args:
+            mapping: Cache keys mapped to values
+            ttl: Time to live in seconds (default: 1 hour)
+
+        Returns:
+            True if all values were stored
+        """
+        if not mapping:
+            return True
+        if not self.redis:
+            await self.connect()
+
+        ttl = ttl or self._default_ttl
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.setex(key, ttl, _serialize(value))
+            results = await pipe.execute()
+
+        return all(results)
 
     async def delete(self, key: str) -> bool:
         """
@@ -136,20 +218,59 @@ class CacheService:
         Returns:
             Generated cache key
         """
-        # Create a deterministic key from arguments
-        key_data = {
-            "args": args,
-            "kwargs": sorted(kwargs.items())
-        }
-        key_hash = hashlib.md5(
-            json.dumps(key_data, sort_keys=True, default=str).encode()
-        ).hexdigest()
-
-        return f"{prefix}:{key_hash}"
-
-
-# Global cache instance
+        # Hash reprs directly instead of serializing an intermediate dict;
+        # NUL separators keep argument boundaries unambiguous.
+        key_hash = hashlib.blake2b(prefix.encode(), digest_size=16)
+        for arg in args:
+            key_hash.update(b"\0")
+            key_hash.update(repr(arg).encode())
+        for name in sorted(kwargs):
+            key_hash.update(b"\0")
+            key_hash.update(name.encode())
+            key_hash.update(b"=")
+            key_hash.update(repr(kwargs[name]).encode())
+
+        return f"{prefix}:{key_hash.hexdigest()}"
+
+
+class _LocalTTLCache:
+    """Bounded in-process LRU with per-entry expiry, kept in front of Redis."""
+
+    def __init__(self, maxsize: int = LOCAL_CACHE_MAXSIZE):
+        """Initialize local cache."""
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._maxsize = maxsize
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a live cached payload or None, evicting it if expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        payload, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def set(self, key: str, payload: bytes, ttl: int = LOCAL_CACHE_TTL):
+        """Store a payload for ttl seconds, evicting the least recently used."""
+        self._entries[key] = (payload, time.monotonic() + min(ttl, LOCAL_CACHE_TTL))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear_pattern(self, pattern: str) -> int:
+        """Drop keys matching a Redis-style glob pattern."""
+        keys = [key for key in self._entries if fnmatchcase(key, pattern)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+
+# Global cache instances
 cache = CacheService()
+_local_cache = _LocalTTLCache()
 
 
 def cached(prefix: str, ttl: int = 3600):
@@ -172,16 +293,24 @@ def cached(prefix: str, ttl: int = 3600):
             # Generate cache key
             cache_key = cache.cache_key(prefix, *args, **kwargs)
 
-            # Try to get from cache
-            cached_value = await cache.get(cache_key)
-            if cached_value is not None:
-                return cached_value
+            # Try the in-process cache first, then Redis. Hits are decoded
+            # from the payload, so callers get fresh copies of the same
+            # types either way
+            payload = _local_cache.get(cache_key)
+            if payload is None:
+                payload = await cache.get_raw(cache_key)
+                if payload:
+                    _local_cache.set(cache_key, payload, ttl)
+            if payload:
+                return _deserialize(payload)
 
             # Execute function
             result = await func(*args, **kwargs)
 
-            # Store in cache
-            await cache.set(cache_key, result, ttl)
+            # Store in both cache tiers
+            payload = _serialize(result)
+            _local_cache.set(cache_key, payload, ttl)
+            await cache.set_raw(cache_key, payload, ttl)
 
             return result
 
@@ -209,6 +338,7 @@ def invalidate_cache(pattern: str):
             result = await func(*args, **kwargs)
 
             # Invalidate cache
+            _local_cache.clear_pattern(pattern)
             await cache.clear_pattern(pattern)
 
             return result
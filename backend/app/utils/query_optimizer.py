@@ -1,7 +1,8 @@
 """Database query optimization utilities."""
 
-from typing import List, Optional, Type, TypeVar
-from sqlalchemy import select, func
+import functools
+from typing import Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+from sqlalchemy import select, func, literal, insert, bindparam
 from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,6 +10,74 @@ from app.core.database import Base
 
 T = TypeVar('T', bound=Base)
 
+# Rows per INSERT ... RETURNING statement in bulk_create, keeping each
+# statement well under the PostgreSQL bind parameter limit
+BULK_CREATE_CHUNK_SIZE = 1000
+
+
+# Statements below are built once per (model, shape) with bound parameters
+# instead of literal values, so per-call query construction is skipped and
+# SQLAlchemy's compiled cache is hit every time.
+def _filter_shape(filters: dict) -> Tuple[Tuple[Tuple[str, bool], ...], dict]:
+    """
+    Split filters into a hashable statement shape and bound parameter values.
+
+    Args:
+        filters: Dictionary of filters {field: value}
+
+    Returns:
+        Tuple of (sorted (field, is_null) pairs, parameters for non-null fields)
+    """
+    shape = tuple(sorted((field, value is None) for field, value in filters.items()))
+    params = {field: value for field, value in filters.items() if value is not None}
+    return shape, params
+
+
+def _filter_conditions(model: Type[T], filter_shape: Tuple[Tuple[str, bool], ...]) -> list:
+    """Build conditions bound to parameters named after the fields (IS NULL for null ones)."""
+    return [
+        getattr(model, field).is_(None) if is_null else getattr(model, field) == bindparam(field)
+        for field, is_null in filter_shape
+    ]
+
+
+@functools.lru_cache(maxsize=256)
+def _get_with_relations_statement(model: Type[T], relations: Tuple[str, ...]):
+    """Build select by ID (parameter "id") with eager-loaded relations."""
+    query = select(model).where(model.id == bindparam("id"))
+    for relation in relations:
+        query = query.options(selectinload(getattr(model, relation)))
+    return query
+
+
+@functools.lru_cache(maxsize=256)
+def _get_by_ids_statement(model: Type[T]):
+    """Build select by a list of IDs (expanding parameter "ids")."""
+    return select(model).where(model.id.in_(bindparam("ids", expanding=True)))
+
+
+@functools.lru_cache(maxsize=256)
+def _filtered_statement(model: Type[T], filter_shape: Tuple[Tuple[str, bool], ...]):
+    """Build select filtered on the given fields."""
+    return select(model).where(*_filter_conditions(model, filter_shape))
+
+
+@functools.lru_cache(maxsize=256)
+def _count_statement(model: Type[T], filter_shape: Tuple[Tuple[str, bool], ...]):
+    """Build count of rows filtered on the given fields."""
+    return select(func.count()).select_from(model).where(*_filter_conditions(model, filter_shape))
+
+
+@functools.lru_cache(maxsize=256)
+def _exists_statement(model: Type[T], filter_shape: Tuple[Tuple[str, bool], ...]):
+    """Build first-row probe filtered on the given fields."""
+    return (
+        select(literal(1))
+        .select_from(model)
+        .where(*_filter_conditions(model, filter_shape))
+        .limit(1)
+    )
+
 
 class QueryOptimizer:
     """Utility class for optimizing database queries."""
@@ -40,15 +109,42 @@ class QueryOptimizer:
                 relations=["reports", "analysis_results"]
             )
         """
-        query = select(model).where(model.id == id)
-
-        if relations:
-            for relation in relations:
-                query = query.options(selectinload(getattr(model, relation)))
+        query = _get_with_relations_statement(model, tuple(relations or ()))
 
-        result = await db.execute(query)
+        result = await db.execute(query, {"id": id})
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_by_ids(
+        db: AsyncSession,
+        model: Type[T],
+        ids: Iterable[any],
+    ) -> Dict[any, T]:
+        """
+        Get model instances by IDs with a single query.
+
+        Args:
+            db: Database session
+            model: SQLAlchemy model class
+            ids: Instance IDs (duplicates and None are ignored)
+
+        Returns:
+            Dictionary of found instances by ID
+
+        Example:
+            sources = await QueryOptimizer.get_by_ids(
+                db,
+                DataSource,
+                {data.source_id for data in collected_data}
+            )
+        """
+        ids = {id for id in ids if id is not None}
+        if not ids:
+            return {}
+
+        result = await db.execute(_get_by_ids_statement(model), {"ids": list(ids)})
+        return {instance.id: instance for instance in result.scalars()}
+
     @staticmethod
     async def get_paginated(
         db: AsyncSession,
@@ -82,17 +178,13 @@ class QueryOptimizer:
                 order_by=Research.created_at.desc()
             )
         """
-        # Build query
-        query = select(model)
-
-        # Apply filters
-        if filters:
-            for field, value in filters.items():
-                query = query.where(getattr(model, field) == value)
+        # Build query and count query with the same filters
+        filter_shape, params = _filter_shape(filters or {})
+        query = _filtered_statement(model, filter_shape)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
+        # Get total count (counting the table directly, not a subquery)
+        count_query = _count_statement(model, filter_shape)
+        total_result = await db.execute(count_query, params)
         total = total_result.scalar()
 
         # Apply ordering
@@ -103,7 +195,7 @@ class QueryOptimizer:
         query = query.offset(skip).limit(limit)
 
         # Execute query
-        result = await db.execute(query)
+        result = await db.execute(query, params)
         items = result.scalars().all()
 
         return items, total
@@ -135,20 +227,25 @@ class QueryOptimizer:
             await QueryOptimizer.bulk_create(db, DataSource, data)
         """
         if not instances:
-            return []
+            return [] if return_instances else None
 
-        # Create instances
-        model_instances = [model(**data) for data in instances]
-
-        # Add to session
-        db.add_all(model_instances)
+        # Insert in chunks instead of add_all + per-row refresh; rows are
+        # only fetched back (RETURNING) when they are requested, in the
+        # order of the input
+        statement = insert(model)
+        if return_instances:
+            statement = statement.returning(model, sort_by_parameter_order=True)
+        created = []
+        for start in range(0, len(instances), BULK_CREATE_CHUNK_SIZE):
+            chunk = instances[start:start + BULK_CREATE_CHUNK_SIZE]
+            if return_instances:
+                created.extend((await db.scalars(statement, chunk)).all())
+            else:
+                await db.execute(statement, chunk)
         await db.commit()
 
         if return_instances:
-            # Refresh all instances
-            for instance in model_instances:
-                await db.refresh(instance)
-            return model_instances
+            return created
 
         return None
 
@@ -176,17 +273,12 @@ class QueryOptimizer:
                 {"email": "test@example.com"}
             )
         """
-        query = select(model)
-
-        for field, value in filters.items():
-            query = query.where(getattr(model, field) == value)
-
-        query = select(func.count()).select_from(query.subquery())
-
-        result = await db.execute(query)
-        count = result.scalar()
+        # Stop at the first matching row instead of counting all of them
+        filter_shape, params = _filter_shape(filters)
+        query = _exists_statement(model, filter_shape)
 
-        return count > 0
+        result = await db.execute(query, params)
+        return result.scalar() is not None
 
     @staticmethod
     def optimize_query_for_listing(query, model: Type[T]) -> any:
@@ -260,4 +352,5 @@ class DatabaseIndexHelper:
             # Composite indexes for common queries
             "CREATE INDEX IF NOT EXISTS idx_research_user_status ON research(user_id, status);",
             "CREATE INDEX IF NOT EXISTS idx_collected_data_research_source ON collected_data(research_id, source_id);",
+            "CREATE INDEX IF NOT EXISTS ix_collected_data_research_id_covering ON collected_data(research_id) INCLUDE (id, source_id);",
         ]
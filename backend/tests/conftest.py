@@ -6,14 +6,20 @@ from typing import AsyncGenerator
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from app.main import app
-from app.core.database import Base, get_db
+import orjson
+from app.core.database import Base, get_db, json_serializer
 from app.core.config import settings
 
 # Test database URL
 # In CI, DATABASE_URL already points to test_db, so we don't append _test
 TEST_DATABASE_URL = str(settings.database_url).replace("postgresql://", "postgresql+asyncpg://")
 
-engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+engine = create_async_engine(
+    TEST_DATABASE_URL,
+    echo=False,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
+)
 TestingSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
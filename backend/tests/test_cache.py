@@ -0,0 +1,214 @@
+"""Tests for caching utilities."""
+
+import fnmatch
+import uuid
+import pytest
+import numpy as np
+from datetime import datetime
+
+from app.utils import cache as cache_module
+from app.utils.cache import (
+    CacheService,
+    _LocalTTLCache,
+    _deserialize,
+    _serialize,
+    cached,
+    invalidate_cache,
+)
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands used by CacheService."""
+
+    def __init__(self):
+        """Initialize storage."""
+        self.data = {}
+        self.pipelines = []
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value if isinstance(value, bytes) else str(value).encode()
+        return True
+
+    async def keys(self, pattern):
+        return [key for key in self.data if fnmatch.fnmatchcase(key, pattern)]
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        self.pipelines.append(FakePipeline(self))
+        return self.pipelines[-1]
+
+
+class FakePipeline:
+    """Queues commands and runs them against FakeRedis on execute."""
+
+    def __init__(self, redis):
+        """Initialize pipeline."""
+        self.redis = redis
+        self.commands = []
+        self.executions = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, ttl, value))
+
+    async def execute(self):
+        self.executions += 1
+        return [await self.redis.setex(*command) for command in self.commands]
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    """Point the global cache at an in-memory Redis with an empty local tier."""
+    service = CacheService()
+    service.redis = FakeRedis()
+    monkeypatch.setattr(cache_module, "cache", service)
+    monkeypatch.setattr(cache_module, "_local_cache", _LocalTTLCache())
+    return service
+
+
+def test_local_cache_expiry(monkeypatch):
+    """Test local entries expire after the capped TTL."""
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    local = _LocalTTLCache()
+
+    local.set("key", b"1", ttl=3600)
+    now[0] += cache_module.LOCAL_CACHE_TTL - 0.1
+    assert local.get("key") == b"1"
+
+    now[0] += 0.1
+    assert local.get("key") is None
+    assert "key" not in local._entries
+
+
+def test_local_cache_lru_eviction():
+    """Test the least recently used entry is evicted when full."""
+    local = _LocalTTLCache(maxsize=2)
+    local.set("a", b"1")
+    local.set("b", b"2")
+    local.get("a")
+    local.set("c", b"3")
+
+    assert local.get("a") == b"1"
+    assert local.get("b") is None
+    assert local.get("c") == b"3"
+
+
+def test_local_cache_clear_pattern():
+    """Test keys matching a glob pattern are dropped."""
+    local = _LocalTTLCache()
+    local.set("market:1", b"1")
+    local.set("market:2", b"2")
+    local.set("report:1", b"3")
+
+    assert local.clear_pattern("market:*") == 2
+    assert local.get("market:1") is None
+    assert local.get("report:1") == b"3"
+
+
+@pytest.mark.asyncio
+async def test_cached_returns_copies(fake_cache):
+    """Test cached results are decoded copies on local and Redis hits."""
+    calls = []
+
+    @cached(prefix="test")
+    async def compute(value):
+        calls.append(value)
+        return {"items": (1, 2)}
+
+    first = await compute(1)
+    local_hit = await compute(1)
+    local_hit["items"].append(3)
+    cache_module._local_cache.clear_pattern("*")
+    redis_hit = await compute(1)
+
+    assert calls == [1]
+    assert first == {"items": (1, 2)}
+    assert local_hit == {"items": [1, 2, 3]}
+    assert redis_hit == {"items": [1, 2]}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cache_clears_both_tiers(fake_cache):
+    """Test invalidation reaches the local tier and Redis."""
+    calls = []
+
+    @cached(prefix="test")
+    async def compute(value):
+        calls.append(value)
+        return value
+
+    @invalidate_cache("test:*")
+    async def update():
+        return None
+
+    await compute(1)
+    await update()
+    await compute(1)
+
+    assert calls == [1, 1]
+
+
+def test_cache_key_deterministic():
+    """Test cache keys are stable and keep argument boundaries."""
+    service = CacheService()
+
+    key = service.cache_key("market", "toys", region="RU", year=2024)
+
+    assert key == service.cache_key("market", "toys", year=2024, region="RU")
+    assert key.startswith("market:") and len(key) == len("market:") + 32
+    assert service.cache_key("p", "ab", "c") != service.cache_key("p", "a", "bc")
+    assert service.cache_key("p", 1) != service.cache_key("p", "1")
+    assert service.cache_key("p", "x") != service.cache_key("p", x="x")
+
+
+@pytest.mark.asyncio
+async def test_get_many_and_set_many(fake_cache):
+    """Test multi-key helpers round-trip values in one call each."""
+    assert await fake_cache.set_many({"a": {"x": 1}, "b": [1, 2], "c": "text"}, ttl=60)
+    values = await fake_cache.get_many(["a", "missing", "b", "c"])
+
+    assert values == [{"x": 1}, None, [1, 2], "text"]
+    pipelines = fake_cache.redis.pipelines
+    assert len(pipelines) == 1 and pipelines[0].executions == 1
+    assert await fake_cache.get_many([]) == []
+    assert await fake_cache.set_many({}) is True
+
+
+def test_serialize_round_trip():
+    """Test orjson payloads for JSON, native extra types and fallbacks."""
+    value_id = uuid.uuid4()
+
+    assert _deserialize(_serialize({"a": [1, 2.5, None], 1: "int key"})) == {
+        "a": [1, 2.5, None], "1": "int key",
+    }
+    assert _deserialize(_serialize(datetime(2024, 1, 2, 3, 4))) == "2024-01-02T03:04:00"
+    assert _deserialize(_serialize(value_id)) == str(value_id)
+    assert _deserialize(_serialize(np.array([1, 2]))) == [1, 2]
+    assert _deserialize(_serialize(object())).startswith("<object object")
+    assert _deserialize(b"plain text") == "plain text"
+    assert _deserialize(None) is None
+    assert _deserialize(b"") is None
+
+
+@pytest.mark.asyncio
+async def test_get_and_set_use_bytes(fake_cache):
+    """Test values are stored as orjson bytes and decoded on read."""
+    assert await fake_cache.set("key", {"score": 0.5}, ttl=60)
+
+    assert fake_cache.redis.data["key"] == b'{"score":0.5}'
+    assert await fake_cache.get("key") == {"score": 0.5}
+    assert await fake_cache.get("missing") is None
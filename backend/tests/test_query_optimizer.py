@@ -0,0 +1,140 @@
+"""Tests for database query optimization utilities."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.data_source import DataSource, SourceType
+from app.utils import query_optimizer
+from app.utils.query_optimizer import QueryOptimizer
+
+
+def _compile(statement) -> str:
+    """Render a statement as PostgreSQL SQL."""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _sources(count: int) -> list:
+    """Build DataSource rows for bulk inserts."""
+    return [
+        {"name": f"Source {i}", "source_type": SourceType.NEWS, "url": f"https://source{i}.ru"}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_without_returning():
+    """Test rows are inserted in chunks without fetching them back."""
+    db = Mock(execute=AsyncMock(), scalars=AsyncMock(), commit=AsyncMock())
+
+    with patch.object(query_optimizer, "BULK_CREATE_CHUNK_SIZE", 2):
+        result = await QueryOptimizer.bulk_create(db, DataSource, _sources(5))
+
+    assert result is None
+    assert [len(call.args[1]) for call in db.execute.await_args_list] == [2, 2, 1]
+    assert all("RETURNING" not in _compile(call.args[0]) for call in db.execute.await_args_list)
+    db.scalars.assert_not_awaited()
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_returning_in_input_order():
+    """Test RETURNING rows are sorted by the order of the input rows."""
+    db = Mock(scalars=AsyncMock(return_value=Mock(all=Mock(return_value=[]))), commit=AsyncMock())
+
+    await QueryOptimizer.bulk_create(db, DataSource, _sources(2), return_instances=True)
+
+    statement = db.scalars.await_args.args[0]
+    assert statement._sort_by_parameter_order
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_empty():
+    """Test empty input returns like non-empty input without touching the db."""
+    db = Mock(execute=AsyncMock(), commit=AsyncMock())
+
+    assert await QueryOptimizer.bulk_create(db, DataSource, []) is None
+    assert await QueryOptimizer.bulk_create(db, DataSource, [], return_instances=True) == []
+    db.execute.assert_not_awaited()
+    db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_returning(db_session: AsyncSession):
+    """Test created instances are returned from INSERT ... RETURNING."""
+    with patch.object(query_optimizer, "BULK_CREATE_CHUNK_SIZE", 2):
+        sources = await QueryOptimizer.bulk_create(
+            db_session, DataSource, _sources(3), return_instances=True
+        )
+
+    assert [source.name for source in sources] == ["Source 0", "Source 1", "Source 2"]
+    assert all(source.id is not None for source in sources)
+    assert all(source.reliability_score == 0.5 for source in sources)
+
+
+def test_filter_shape_null_values():
+    """Test None filters render IS NULL and are not bound as parameters."""
+    shape, params = query_optimizer._filter_shape({"url": "https://a.ru", "category": None})
+
+    assert shape == (("category", True), ("url", False))
+    assert params == {"url": "https://a.ru"}
+
+    sql = _compile(query_optimizer._filtered_statement(DataSource, shape))
+    assert "data_sources.category IS NULL" in sql
+    assert "data_sources.url = %(url)s" in sql
+
+
+def test_statements_cached_per_shape():
+    """Test statements are built once per model and filter shape."""
+    shape, _ = query_optimizer._filter_shape({"url": "https://a.ru"})
+    other_shape, _ = query_optimizer._filter_shape({"url": "https://b.ru"})
+
+    assert shape == other_shape
+    assert query_optimizer._count_statement(DataSource, shape) is query_optimizer._count_statement(
+        DataSource, other_shape
+    )
+    assert query_optimizer._filter_shape({"url": None})[0] != shape
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_expanding_parameter():
+    """Test IDs are passed as one expanding parameter, skipping None and duplicates."""
+    db = Mock(execute=AsyncMock(return_value=Mock(scalars=Mock(return_value=[]))))
+
+    assert await QueryOptimizer.get_by_ids(db, DataSource, [None]) == {}
+    db.execute.assert_not_awaited()
+
+    await QueryOptimizer.get_by_ids(db, DataSource, ["a", "a", None, "b"])
+
+    statement, params = db.execute.await_args.args
+    assert sorted(params["ids"]) == ["a", "b"]
+    assert "IN (__[POSTCOMPILE_ids])" in _compile(statement)
+
+
+def test_count_and_exists_statements():
+    """Test counting the table directly and probing a single row."""
+    shape, _ = query_optimizer._filter_shape({"url": "https://a.ru"})
+
+    count_sql = _compile(query_optimizer._count_statement(DataSource, shape))
+    exists_sql = _compile(query_optimizer._exists_statement(DataSource, shape))
+
+    assert "count(*)" in count_sql and "FROM data_sources" in count_sql
+    assert "anon" not in count_sql  # no subquery
+    assert "LIMIT" in exists_sql and "count" not in exists_sql
+
+
+@pytest.mark.asyncio
+async def test_paginated_and_exists(db_session: AsyncSession):
+    """Test pagination totals and existence checks with value and None filters."""
+    await QueryOptimizer.bulk_create(db_session, DataSource, _sources(3))
+
+    items, total = await QueryOptimizer.get_paginated(
+        db_session, DataSource, skip=1, limit=1,
+        filters={"category": None}, order_by=DataSource.name,
+    )
+
+    assert total == 3
+    assert [item.name for item in items] == ["Source 1"]
+    assert await QueryOptimizer.exists(db_session, DataSource, {"url": "https://source2.ru"})
+    assert not await QueryOptimizer.exists(db_session, DataSource, {"url": "https://missing.ru"})
@@ -1,8 +1,9 @@
 """Tests for report generation module."""
 
+import os
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
+from datetime import date, datetime
 from uuid import uuid4
 
 from app.services.report_generation.gost_formatter import GOSTFormatter, GOSTPageSettings, GOSTNumberingRules
@@ -37,6 +38,15 @@ class TestGOSTFormatter:
         assert result["bold"] is True
         assert result["alignment"] == "left"
 
+    def test_format_heading_subsection(self):
+        """Test formatting subsection heading keeps the tail of the text."""
+        formatter = GOSTFormatter()
+        result = formatter.format_heading("анализ рынка РФ", 2)
+
+        assert result["text"] == "Анализ рынка РФ"
+        assert result["bold"] is True
+        assert formatter.format_heading("", 3)["text"] == ""
+
     def test_format_figure_caption(self):
         """Test formatting figure caption."""
         formatter = GOSTFormatter()
@@ -102,6 +112,18 @@ class TestGOSTFormatter:
         assert "https://rosstat.gov.ru" in entry
         assert "01.01.2024" in entry
 
+    def test_format_bibliography_entry_missing_values(self):
+        """Test entries with None values render like plain string formatting."""
+        formatter = GOSTFormatter()
+
+        book = formatter.format_bibliography_entry("book", ["Иванов И.И."], "Маркетинг", 2024, publisher=None)
+        article = formatter.format_bibliography_entry("article", [], "Статья", 2023, journal=None)
+        website = formatter.format_bibliography_entry("website", [], None, 2024, url=None)
+
+        assert book == "Иванов И.И. Маркетинг. – None, 2024."
+        assert article == " Статья // None. – 2023."
+        assert website == "None. – URL: None"
+
 
 class TestVisualizationService:
     """Tests for visualization service."""
@@ -149,6 +171,81 @@ class TestVisualizationService:
         assert isinstance(image_bytes, bytes)
         assert len(image_bytes) > 0
 
+    def test_create_comparison_table(self):
+        """Test creating comparison table with both renderers."""
+        import pandas as pd
+
+        service = VisualizationService()
+        data = pd.DataFrame(
+            {"Цена": [100, 200], "Доля рынка": ["30%", "15%"]},
+            index=["Компания А", "Компания Б"]
+        )
+
+        for renderer in ("pil", "matplotlib"):
+            image_bytes = service.create_comparison_table(data, "Сравнение", renderer=renderer)
+            assert image_bytes.startswith(b'\x89PNG')
+
+    def test_figure_cache(self):
+        """Test identical figures are rendered only once."""
+        service = VisualizationService()
+        data = {"Cached A": 1, "Cached B": 2}
+
+        first = service.create_bar_chart(data, "Cached", "X", "Y")
+        with patch.object(service, "_figure_to_bytes") as figure_to_bytes:
+            second = service.create_bar_chart(data, "Cached", "X", "Y")
+
+        assert second == first
+        figure_to_bytes.assert_not_called()
+
+    def test_figure_cache_key_keeps_data_order(self):
+        """Test data dicts in a different order get different cache keys."""
+        service = VisualizationService()
+        key = service._figure_cache_key
+        kwargs = {"title": "T", "xlabel": "X"}
+
+        first = key("create_bar_chart", ({"A": 2, "B": 1},), kwargs)
+
+        assert first != key("create_bar_chart", ({"B": 1, "A": 2},), kwargs)
+        assert first == key("create_bar_chart", ({"A": 2, "B": 1},), {"xlabel": "X", "title": "T"})
+
+    def test_figure_cache_key_non_str_keys(self):
+        """Test data dicts keyed by dates or tuples get distinct cache keys."""
+        service = VisualizationService()
+        key = service._figure_cache_key
+
+        by_date = key("create_bar_chart", ({date(2024, 1, 1): 1.0},), {})
+        by_tuple = key("create_bar_chart", ({("RU", 2024): 1.0},), {})
+
+        assert by_date == key("create_bar_chart", ({date(2024, 1, 1): 1.0},), {})
+        assert by_date != key("create_bar_chart", ({date(2024, 1, 2): 1.0},), {})
+        assert by_date != key("create_bar_chart", ({"2024-01-01": 1.0},), {})
+        assert by_tuple != key("create_bar_chart", ({("RU", 2025): 1.0},), {})
+
+    @pytest.mark.asyncio
+    async def test_render_in_worker_process(self):
+        """Test rendering a figure in the worker process pool."""
+        service = VisualizationService()
+
+        image_bytes = await service.render(
+            "create_pie_chart",
+            data={"Category A": 60, "Category B": 40},
+            title="Market Share"
+        )
+
+        assert image_bytes.startswith(b'\x89PNG')
+
+    def test_moving_average_matches_pandas(self):
+        """Test moving average matches pandas rolling mean."""
+        import numpy as np
+        import pandas as pd
+        from app.services.report_generation.visualization import _moving_average
+
+        values = np.array([1.0, 4.0, 2.0, 8.0, 5.0, 7.0])
+
+        np.testing.assert_allclose(
+            _moving_average(values), pd.Series(values).rolling(window=3).mean().to_numpy()
+        )
+
     def test_figure_counter(self):
         """Test figure counter increment."""
         service = VisualizationService()
@@ -160,6 +257,23 @@ class TestVisualizationService:
         service.reset_counters()
         assert service.figure_counter == 0
 
+    @pytest.mark.asyncio
+    async def test_counter_scope_isolates_reports(self):
+        """Test concurrent reports on a shared service count separately."""
+        import asyncio
+
+        service = VisualizationService()
+
+        async def generate(figures: int) -> int:
+            with service.counter_scope():
+                for _ in range(figures):
+                    service.increment_figure_counter()
+                    await asyncio.sleep(0)
+                return service.figure_counter
+
+        assert await asyncio.gather(generate(2), generate(3)) == [2, 3]
+        assert service.figure_counter == 0
+
 
 class TestContentGenerator:
     """Tests for content generator."""
@@ -228,6 +342,26 @@ class TestContentGenerator:
         assert bibliography[0]["url"] == "https://example.com/1"
         assert bibliography[1]["url"] == "https://example.com/2"
 
+    @pytest.mark.asyncio
+    async def test_generate_bibliography_verifications(self):
+        """Test bibliography entries use the first verification of their source."""
+        generator = ContentGenerator(Mock())
+
+        collected_data = [
+            Mock(source_url="https://example.com/1", title="Source 1", collected_at=datetime.now()),
+            Mock(source_url="https://example.com/2", title="Source 2", collected_at=datetime.now()),
+        ]
+        verifications = [
+            Mock(source_url="https://example.com/2", reliability_score=0.9, is_verified=True),
+            Mock(source_url="https://example.com/2", reliability_score=0.1, is_verified=False),
+        ]
+
+        bibliography = await generator.generate_bibliography(collected_data, verifications)
+
+        assert bibliography[0]["reliability_score"] is None
+        assert bibliography[1]["reliability_score"] == 0.9
+        assert bibliography[1]["is_verified"] is True
+
 
 class TestDOCXExporter:
     """Tests for DOCX exporter."""
@@ -296,6 +430,105 @@ class TestPDFExporter:
         # PDF files start with %PDF
         assert pdf_bytes.startswith(b'%PDF')
 
+    def test_create_document_to_stream(self):
+        """Test rendering PDF document directly into a stream."""
+        import io
+
+        exporter = PDFExporter()
+        stream = io.BytesIO()
+
+        result = exporter.create_document(
+            {"title_page": {"title": "Test Title"}, "introduction": {"text": "Test"}},
+            out_stream=stream,
+        )
+
+        assert result is None
+        assert stream.getvalue().startswith(b'%PDF')
+
+    def test_build_figure_from_path(self, tmp_path):
+        """Test figures stored on disk are embedded by path."""
+        from reportlab.platypus import Image
+
+        image_path = tmp_path / "figure.png"
+        image_path.write_bytes(VisualizationService().create_pie_chart({"A": 1, "B": 2}, "Pie"))
+        exporter = PDFExporter()
+        exporter._setup_styles()
+
+        story = exporter._build_figure(1, {"title": "Fig", "image_path": str(image_path)})
+
+        assert isinstance(story[0], Image)
+
+    def test_main_sections_numbering(self):
+        """Test figure and table numbering continues across sections."""
+        exporter = PDFExporter()
+        exporter._setup_styles()
+        table = {"title": "T", "headers": ["A"], "data": [[1]]}
+        sections = [
+            {"title": "One", "content": "Text", "subsections": [{"title": "1", "tables": [table]}]},
+            {"title": "Two", "subsections": [{"title": "2", "tables": [table, table]}]},
+        ]
+
+        exporter._add_main_sections(sections)
+        captions = [f.text for f in exporter.story if getattr(f, "text", "").startswith("Таблица")]
+
+        assert exporter.table_counter == 3
+        assert [c.split(" –")[0] for c in captions] == ["Таблица 1", "Таблица 2", "Таблица 3"]
+
+    def test_bold_paragraph_matches_markup(self):
+        """Test BoldParagraph produces the same fragments as <b> markup."""
+        from reportlab.platypus import Paragraph
+        from app.services.report_generation.pdf_exporter import BoldParagraph
+
+        exporter = PDFExporter()
+        exporter._setup_styles()
+        style = exporter.styles['GOSTHeading1']
+
+        expected = Paragraph("<b>1 АНАЛИЗ РЫНКА</b>", style)
+        result = BoldParagraph("1 АНАЛИЗ РЫНКА", style)
+
+        assert vars(result.frags[0]) == vars(expected.frags[0])
+
+    def test_format_table_rows_numpy(self):
+        """Test numpy and list table bodies are formatted the same way."""
+        import numpy as np
+        from app.services.report_generation.gost_formatter import format_table_rows
+
+        values = [[1.0, 2.345], [10.5, 0.1 + 0.2]]
+
+        assert format_table_rows(np.array(values)) == format_table_rows(values)
+        assert format_table_rows(values) == [["1.0", "2.345"], ["10.5", "0.30000000000000004"]]
+        assert format_table_rows([["a", 1]]) == [["a", "1"]]
+        assert format_table_rows(None) == []
+
+    def test_numpy_table_in_both_exporters(self):
+        """Test a numpy table body exports to PDF and DOCX."""
+        import numpy as np
+
+        report_data = {
+            "title_page": {"organization": "Org", "report_type": "Report", "title": "Title", "date": "01.01.2024"},
+            "abstract": {"statistics": {}, "keywords": [], "summary": ""},
+            "sections": [],
+            "introduction": {"text": "Введение"},
+            "conclusion": {"text": "Заключение"},
+            "bibliography": [],
+            "appendices": [],
+            "main_sections": [{
+                "id": "analysis",
+                "title": "Анализ",
+                "subsections": [{
+                    "title": "Цены",
+                    "tables": [{
+                        "title": "Цены",
+                        "headers": ["A", "B"],
+                        "data": np.array([[1.5, 2.0]]),
+                    }],
+                }],
+            }],
+        }
+
+        assert len(PDFExporter().create_document(report_data)) > 0
+        assert len(DOCXExporter().create_document(report_data)) > 0
+
 
 class TestReportGenerator:
     """Tests for report generator."""
@@ -319,6 +552,120 @@ class TestReportGenerator:
         assert "sections" in preview
         assert "estimated_pages" in preview
 
+    @pytest.mark.asyncio
+    async def test_generate_reports_all_formats(self, tmp_path):
+        """Test generating PDF and DOCX from one content generation."""
+        db = Mock()
+        generator = ReportGenerator(db)
+
+        research = Mock(spec=Research)
+        research.id = uuid4()
+        research.title = "Test Research"
+        research.analysis_results = research.competitors = research.collected_data = []
+        db.query.return_value.options.return_value.filter.return_value.one.return_value = research
+
+        report_data = {
+            "title_page": {
+                "organization": "Test Org",
+                "report_type": "Test Report",
+                "title": "Test Title",
+                "date": "01.01.2024",
+            },
+            "introduction": {"text": "Test introduction"},
+            "main_sections": [],
+            "conclusion": {"text": "Test conclusion"},
+            "bibliography": [],
+        }
+        saved = {}
+
+        async def save(research_id, report_id, file_bytes, extension):
+            saved[extension] = file_bytes
+            return tmp_path / f"report.{extension}"
+
+        with patch.object(generator, "_generate_report_content", return_value=report_data) as generate, \
+                patch.object(generator, "_save_report_file", side_effect=save):
+            reports = await generator.generate_reports(research)
+
+        generate.assert_called_once()
+        assert [r.format for r in reports] == [ReportFormat.PDF, ReportFormat.DOCX]
+        assert all(r.status == ReportStatus.COMPLETED for r in reports)
+        assert saved["pdf"].startswith(b"%PDF")
+        assert saved["docx"].startswith(b"PK")
+        db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_save_figure_file_by_content(self, tmp_path):
+        """Test identical figures are written once and reuse touches the file."""
+        generator = ReportGenerator(Mock())
+
+        with patch("app.services.report_generation.report_generator.FIGURES_DIR", tmp_path):
+            first = await generator._save_figure_file(b"png-a")
+            os.utime(first, (0, 0))
+            second = await generator._save_figure_file(b"png-a")
+            other = await generator._save_figure_file(b"png-b")
+
+        assert first == second != other
+        assert first.read_bytes() == b"png-a"
+        assert first.stat().st_mtime > 0
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted([first.name, other.name])
+
+    @pytest.mark.asyncio
+    async def test_sweep_unused_figures(self, tmp_path):
+        """Test only stale figures no report refers to are deleted."""
+        from app.services.report_generation.report_generator import sweep_unused_figures
+
+        used, unused, recent = (tmp_path / f"{name}.png" for name in ("used", "unused", "recent"))
+        leftover = tmp_path / "unused.png.abc.tmp"
+        for path in (used, unused, recent, leftover):
+            path.write_bytes(b"png")
+        for path in (used, unused, leftover):
+            os.utime(path, (0, 0))
+        db = Mock(scalar=AsyncMock(side_effect=lambda statement: (
+            "other report" if "used.png" in statement.compile().params.values() else None
+        )))
+
+        with patch("app.services.report_generation.report_generator.FIGURES_DIR", tmp_path):
+            removed = await sweep_unused_figures(db, grace_period=60)
+
+        assert removed == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["recent.png", "used.png"]
+        assert db.scalar.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_reports_failure_keeps_figures(self, tmp_path):
+        """Test figures of a failed generation are left for the sweep."""
+        db = Mock()
+        generator = ReportGenerator(db)
+        research = Mock(spec=Research)
+        research.id = uuid4()
+        research.title = "Test Research"
+        research.analysis_results = research.competitors = research.collected_data = []
+
+        async def generate(*args):
+            await generator._save_figure_file(b"png")
+            raise RuntimeError("LLM unavailable")
+
+        db.query.return_value.options.return_value.filter.return_value.one.return_value = research
+        with patch("app.services.report_generation.report_generator.FIGURES_DIR", tmp_path), \
+                patch.object(generator, "_generate_report_content", side_effect=generate):
+            with pytest.raises(RuntimeError):
+                await generator.generate_reports(research)
+
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_docx_missing_figure_file(self, tmp_path):
+        """Test a figure whose file is gone is exported with its caption only."""
+        from docx import Document
+
+        exporter = DOCXExporter()
+        exporter.document = Document()
+
+        exporter._add_figure({"title": "Missing", "image_path": str(tmp_path / "gone.png")})
+
+        assert exporter.figure_counter == 1
+        assert not exporter.document.inline_shapes
+        assert any("Missing" in p.text for p in exporter.document.paragraphs)
+
     def test_estimate_page_count(self):
         """Test estimating page count."""
         db = Mock()
@@ -118,6 +118,87 @@ async def test_blocked_source_assessment(db_session: AsyncSession):
     assert verification.reliability_score == 0.0
 
 
+def test_reliability_assessor_domain_heuristics():
+    """Test domain trust heuristics and their precedence."""
+    assessor = ReliabilityAssessor(None)
+    assessor._trusted, assessor._blocked = {}, {}
+
+    def trust(url):
+        return assessor._calculate_domain_trust(assessor._extract_domain(url))
+
+    assert trust("https://news.gov.ru/article") == 0.95
+    assert trust("https://MSU.University.ru") == 0.85
+    assert trust("https://science.example.org") == 0.80
+    assert trust("https://RBC.ru") == 0.60
+    assert trust("https://example.com") == 0.50
+    assert assessor._is_news_domain("TASS.ru")
+
+
+def test_reliability_assessor_ratings():
+    """Test score thresholds of ratings and statuses."""
+    assessor = ReliabilityAssessor(None)
+
+    assert [assessor._get_reliability_rating(score) for score in (0.0, 0.3, 0.5, 0.69, 0.7, 0.9, 1.0)] == [
+        ReliabilityRating.UNRELIABLE,
+        ReliabilityRating.POOR,
+        ReliabilityRating.FAIR,
+        ReliabilityRating.FAIR,
+        ReliabilityRating.GOOD,
+        ReliabilityRating.EXCELLENT,
+        ReliabilityRating.EXCELLENT,
+    ]
+    assert [assessor._determine_verification_status(score) for score in (0.49, 0.5, 0.7)] == [
+        VerificationStatus.FAILED,
+        VerificationStatus.FLAGGED,
+        VerificationStatus.VERIFIED,
+    ]
+    assert assessor._calculate_content_quality(DataSource(name="API", source_type=SourceType.API)) == 0.85
+
+
+def test_reliability_assessor_freshness_scores():
+    """Test freshness scores decrease with days since the last fetch."""
+    assessor = ReliabilityAssessor(None)
+    now = datetime.utcnow()
+    sources = [
+        DataSource(name=f"Source {days}", last_successful_fetch=now - timedelta(days=days) if days is not None else None)
+        for days in (None, 0, 1, 2, 7, 8, 30, 90, 180, 181, 1000)
+    ]
+
+    assert assessor._calculate_freshness_scores(sources, now) == [
+        0.5, 1.0, 1.0, 0.9, 0.9, 0.7, 0.7, 0.5, 0.3, 0.1, 0.1,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reliability_assessor_domain_index():
+    """Test trusted and blocked sources are loaded once per assessor."""
+    from unittest.mock import AsyncMock, Mock
+
+    trusted = TrustedSource(domain="rosstat.gov.ru", name="Росстат", trust_score=0.99)
+    blocked = BlockedSource(domain="fake-news.com", reason="Fake news")
+    db = Mock()
+    db.execute = AsyncMock(side_effect=[
+        Mock(scalars=Mock(return_value=[trusted])),
+        Mock(scalars=Mock(return_value=[blocked])),
+    ])
+
+    assessor = ReliabilityAssessor(db)
+    good, bad = await assessor.assess_sources([
+        DataSource(name="Росстат", source_type=SourceType.GOVERNMENT, url="https://rosstat.gov.ru/stats"),
+        DataSource(name="Fake", source_type=SourceType.NEWS, url="https://fake-news.com/article"),
+    ])
+    unknown = await assessor.assess_source(DataSource(
+        name="Blog", source_type=SourceType.NEWS, url="https://blog.example.com",
+    ))
+
+    assert db.execute.await_count == 2
+    assert unknown.trustworthiness_score == 0.5
+    assert good.verified_at == good.last_update_check == bad.last_update_check
+    assert good.trustworthiness_score == 0.99
+    assert bad.status == VerificationStatus.FAILED
+    assert bad.verification_notes == "Source is in blacklist: Fake news"
+
+
 @pytest.mark.asyncio
 async def test_freshness_checker_recent_data(db_session: AsyncSession):
     """Test freshness checking for recent data."""
@@ -165,6 +246,129 @@ async def test_freshness_checker_outdated_data(db_session: AsyncSession):
     assert result["days_old"] > 90
 
 
+@pytest.mark.asyncio
+async def test_freshness_checker_content_date_set():
+    """Test a set content date is used without extracting one."""
+    from unittest.mock import Mock, patch
+
+    checker = FreshnessChecker(None)
+    data = Mock(content_date=datetime.utcnow() - timedelta(days=10))
+
+    with patch.object(FreshnessChecker, "_extract_content_date") as extract:
+        result = await checker.check_freshness(data, category="news")
+
+    extract.assert_not_called()
+    assert result["is_fresh"] is True
+    assert result["days_old"] == 10
+
+
+@pytest.mark.asyncio
+async def test_freshness_checker_check_and_update():
+    """Test outdated data flags the verification in one step."""
+    from unittest.mock import Mock
+
+    checker = FreshnessChecker(None)
+    data = Mock(content_date=datetime.utcnow() - timedelta(days=100))
+    verification = SourceVerification(status=VerificationStatus.VERIFIED, issues_found=None)
+
+    verification = await checker.check_and_update_freshness(data, verification, category="news")
+
+    assert verification.is_outdated is True
+    assert verification.days_since_update == 100
+    assert verification.status == VerificationStatus.FLAGGED
+    assert verification.issues_found == ["outdated_content"]
+    assert verification.verification_metadata["freshness_check"]["threshold_days"] == 90
+
+    # Loaded JSON values are replaced rather than changed in place
+    issues, metadata = verification.issues_found, verification.verification_metadata
+    await checker.check_and_update_freshness(data, verification, category="news")
+
+    assert verification.issues_found is issues
+    assert verification.verification_metadata is not metadata
+    assert metadata.keys() == verification.verification_metadata.keys()
+
+
+def test_freshness_checker_score():
+    """Test freshness score decays linearly over twice the threshold."""
+    checker = FreshnessChecker(None)
+
+    assert [checker._calculate_freshness_score(days, 30) for days in (-5, 0, 15, 30, 60, 90)] == [
+        1.0, 1.0, 0.75, 0.5, 0.0, 0.0,
+    ]
+    assert checker._calculate_freshness_score(0, 0) == 1.0
+    assert checker._calculate_freshness_score(1, 0) == 0.0
+
+
+def test_freshness_checker_extract_date_from_text():
+    """Test extracting dates in supported formats from text."""
+    checker = FreshnessChecker(None)
+
+    assert checker._extract_date_from_text("Обновлено 2024-01-15") == datetime(2024, 1, 15)
+    assert checker._extract_date_from_text("от 15.01.2024 г.") == datetime(2024, 1, 15)
+    assert checker._extract_date_from_text("15 Января 2024 года") == datetime(2024, 1, 15)
+    # The first date in the text is taken, whatever its format
+    assert checker._extract_date_from_text("от 15.01.2024, изм. 2024-03-01") == datetime(2024, 1, 15)
+    assert checker._extract_date_from_text("Опубликовано 2024-01-15T10:30:00") == datetime(2024, 1, 15)
+    assert checker._extract_date_from_text("Приказ от 15.01.2024г.") == datetime(2024, 1, 15)
+    assert checker._extract_date_from_text("15.01.2024 - отчёт за 2023-й год") == datetime(2024, 1, 15)
+    assert checker._extract_date_from_text("Артикул 115.01.20245") is None
+    assert checker._extract_date_from_text("2024-13-01 или 2024-02-30") is None
+    # Invalid dates are skipped
+    assert checker._extract_date_from_text("31.02.2024, 2023-02-03") == datetime(2023, 2, 3)
+    assert checker._extract_date_from_text("Без даты") is None
+
+
+def test_freshness_checker_parse_date():
+    """Test parsing metadata dates."""
+    from app.services.verification.freshness_checker import parse_date
+
+    checker = FreshnessChecker(None)
+
+    assert checker._parse_date("2024-01-15T10:30:00") == datetime(2024, 1, 15, 10, 30)
+    assert checker._parse_date("Jan 15, 2024") == datetime(2024, 1, 15)
+    assert checker._parse_date("Mon, 15 Jan 2024 10:30:00 -0000") == datetime(2024, 1, 15, 10, 30)
+    assert checker._parse_date("1705314600") == datetime(2024, 1, 15, 10, 30)
+    assert checker._parse_date("not a date") is None
+    assert checker._parse_date(20240115) is None
+    assert checker._parse_date("2024-01-15T10:30:00") is parse_date("2024-01-15T10:30:00")
+
+
+def test_freshness_checker_parse_date_incomplete_not_cached():
+    """Test dates completed from today are parsed again on every call."""
+    from unittest.mock import patch
+    from app.services.verification import freshness_checker
+
+    days = [datetime(2024, 1, 15, 10, 30), datetime(2024, 1, 16, 10, 30)]
+    with patch.object(freshness_checker.date_parser, "parse", side_effect=days) as parse:
+        assert freshness_checker.parse_date("10:30") == days[0]
+        assert freshness_checker.parse_date("10:30") == days[1]
+
+    assert parse.call_count == 2
+
+
+def test_freshness_checker_extract_content_date():
+    """Test content date sources in order of precedence."""
+    from unittest.mock import Mock
+
+    checker = FreshnessChecker(None)
+    collected = datetime(2024, 3, 1)
+
+    def data(metadata=None, content=None):
+        return Mock(
+            content_date=None,
+            extra_metadata=metadata,
+            processed_content=content,
+            raw_content=None,
+            collected_date=collected,
+        )
+
+    assert checker._extract_content_date(
+        data({"publication_date": "2024-01-15"}, "от 10.02.2024")
+    ) == datetime(2024, 1, 15)
+    assert checker._extract_content_date(data({}, "от 10.02.2024")) == datetime(2024, 2, 10)
+    assert checker._extract_content_date(data(None, "Без даты")) == collected
+
+
 @pytest.mark.asyncio
 async def test_cross_validator_matching_content(db_session: AsyncSession):
     """Test cross-validation with matching content."""
@@ -203,6 +407,270 @@ async def test_cross_validator_matching_content(db_session: AsyncSession):
     assert validation.is_validated is True
 
 
+def test_cross_validator_compare_content():
+    """Test content similarity comparison."""
+    validator = CrossValidator(None)
+
+    similar = validator._compare_content(
+        "Market grew by 15% in 2024",
+        "Market grew by 15 percent in 2024",
+    )
+    different = validator._compare_content(
+        "Market grew by 15% in 2024",
+        "Совершенно другой текст о погоде",
+    )
+
+    assert similar["is_matching"] is True
+    assert similar["differences"] == []
+    assert different["is_matching"] is False
+    assert 0.0 <= different["similarity"] < validator.similarity_threshold
+    assert different["differences"]
+
+
+def test_cross_validator_compare_contents():
+    """Test batched comparison matches pairwise comparison."""
+    validator = CrossValidator(None)
+    content = "Market grew by 15% in 2024"
+    others = ["Market grew by 15 percent in 2024", "Совершенно другой текст", None, content]
+
+    comparisons = validator._compare_contents(content, others)
+
+    assert comparisons == [validator._compare_content(content, other) for other in others]
+    assert [c["is_matching"] for c in comparisons] == [True, False, False, True]
+    assert comparisons[3]["similarity"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_cross_validator_validate_data_counts():
+    """Test matching sources are counted from the comparison results."""
+    from unittest.mock import Mock
+
+    validator = CrossValidator(None)
+    content = "Market grew by 15% in 2024"
+    primary = Mock(id=1, processed_content=content, raw_content=None)
+    related = [
+        Mock(source_id=i, processed_content=text, raw_content=None)
+        for i, text in enumerate([content, "Совершенно другой текст", "Market grew by 15 percent in 2024"])
+    ]
+
+    validation = await validator.validate_data(primary, related)
+
+    assert validation.matching_sources_count == 2
+    assert validation.contradicting_sources_count == 1
+    assert validation.supporting_sources == ["0", "2"]
+    assert [c["source_id"] for c in validation.contradictions] == ["1"]
+    assert validation.validation_details["comparisons"][0] == {
+        "source_id": "0",
+        "similarity": 1.0,
+        "is_matching": True,
+        "differences": [],
+    }
+
+def test_cross_validator_threshold_edge():
+    """Test a similarity equal to the threshold counts as matching."""
+    validator = CrossValidator(None)
+    validator.set_similarity_threshold(0.7)
+    content, other = "abcdefghij", "abcdefgxyz"  # ratio is exactly 70
+
+    assert validator._compare_content(content, other)["is_matching"] is True
+    assert validator._compare_contents(content, [other])[0]["is_matching"] is True
+    assert validator._compare_contents(content, [other])[0]["similarity"] == 0.7
+
+
+def test_cross_validator_length_bound():
+    """Test contents too different in length are not scored."""
+    validator = CrossValidator(None)
+    content = "Market grew by 15% in 2024"
+
+    comparison = validator._compare_content(content, content + " and is expected to double by 2030")
+
+    assert comparison["is_matching"] is False
+    assert comparison["similarity"] is None
+    assert validator._max_similarity("abc", "abcdef") == pytest.approx(2 / 3)
+
+
+def test_cross_validator_simhash_prefilter():
+    """Test long unrelated contents are filtered out by SimHash."""
+    from app.services.verification.cross_validator import compute_simhash
+
+    validator = CrossValidator(None)
+    words = [f"слово{i}" for i in range(1000)]
+    content = " ".join(words[:500])
+    similar = " ".join(words[:490] + words[600:610])
+    unrelated = " ".join(words[500:])
+
+    assert (compute_simhash(content) ^ compute_simhash(similar)).bit_count() <= 12
+
+    comparisons = validator._compare_contents(content, [similar, unrelated])
+
+    assert comparisons[0]["is_matching"] is True
+    assert comparisons[1]["is_matching"] is False
+    assert comparisons[1]["similarity"] is None
+
+
+def test_simhash_cache_keyed_by_digest():
+    """Test SimHash fingerprints are memoized without keeping the texts."""
+    from app.services.verification import cross_validator
+
+    text = "рынок игрушек " * 200
+    simhash = cross_validator.compute_simhash(text)
+
+    assert cross_validator.compute_simhash(text) == simhash
+    assert all(isinstance(key, bytes) and len(key) == 16 for key in cross_validator._simhash_cache)
+    assert cross_validator.compute_simhash("") == 0
+
+
+def test_simhash_distances():
+    """Test vectorized Hamming distances match per-pair popcount."""
+    import numpy as np
+    from app.services.verification.cross_validator import simhash_distances
+
+    simhash = 0xF0F0_0000_0000_0001
+    others = [0, simhash, 2**64 - 1, 0x0F0F_0000_0000_0001]
+
+    distances = simhash_distances(simhash, np.array(others, dtype=np.uint64))
+
+    assert distances.tolist() == [(simhash ^ other).bit_count() for other in others]
+
+
+def test_fact_checker_extraction():
+    """Test extracting claims, citations, statistics and references."""
+    checker = FactChecker(None)
+    content = (
+        "В 2024 году выручка составил 15 млн рублей, рост на 10%.\n"
+        "Источник: https://rosstat.gov.ru/data\n"
+        "[1] Иванов И.И. Рынок России"
+    )
+
+    claims = checker._extract_claims(content)
+    stats = checker._extract_statistics(content)
+
+    assert any(c["text"] == "15 млн" for c in claims)
+    assert checker._extract_citations(content) == ["https://rosstat.gov.ru/data"]
+    assert {s["type"] for s in stats} == {"monetary", "yearly"}
+    assert checker.extract_references(content)[0]["groups"] == ("1", "Иванов И.И. Рынок России")
+    assert checker._extract_citations("https://b.ru https://a.ru https://b.ru") == [
+        "https://b.ru",
+        "https://a.ru",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fact_checker_verify_citations():
+    """Test citations are probed and sorted by outcome."""
+    from unittest.mock import AsyncMock, Mock, patch
+    import httpx
+
+    async def head(url, **kwargs):
+        if "down" in url:
+            raise httpx.ConnectError("connection refused")
+        if "busy" in url:
+            return Mock(status_code=429)
+        if "broken" in url:
+            return Mock(status_code=503)
+        return Mock(status_code=404 if "missing" in url else 200)
+
+    urls = [
+        "https://ok.ru", "https://missing.ru", "https://down.ru",
+        "https://busy.ru", "https://broken.ru",
+    ]
+    checker = FactChecker(None)
+    with patch.object(httpx.AsyncClient, "head", new=AsyncMock(side_effect=head)):
+        result = await checker._verify_citations(urls)
+
+    assert [c["url"] for c in result["valid"]] == ["https://ok.ru"]
+    assert [c["url"] for c in result["invalid"]] == urls[1:]
+    assert result["total_checked"] == 5
+
+    # Definite HTTP results are reused; network errors, rate limits and
+    # server errors are probed again
+    probe = AsyncMock(side_effect=head)
+    with patch.object(httpx.AsyncClient, "head", new=probe):
+        cached = await checker._verify_citations(urls)
+
+    assert sorted(call.args[0] for call in probe.call_args_list) == [
+        "https://broken.ru", "https://busy.ru", "https://down.ru",
+    ]
+    assert cached["valid"] == result["valid"]
+
+
+@pytest.mark.asyncio
+async def test_fact_checker_probe_citation():
+    """Test HEAD fallbacks for servers rejecting HEAD and for timeouts."""
+    from contextlib import asynccontextmanager
+    from unittest.mock import AsyncMock, Mock, patch
+    import httpx
+
+    calls = []
+
+    async def head(url, **kwargs):
+        calls.append(url)
+        if "slow" in url and calls.count(url) == 1:
+            raise httpx.ReadTimeout("timed out")
+        return Mock(status_code=405 if "nohead" in url else 200)
+
+    @asynccontextmanager
+    async def stream(method, url, **kwargs):
+        assert kwargs["headers"] == {"Range": "bytes=0-0"}
+        yield Mock(status_code=206)
+
+    checker = FactChecker(None)
+    client = httpx.AsyncClient()
+    with patch.object(client, "head", new=AsyncMock(side_effect=head)), \
+            patch.object(client, "stream", new=stream), \
+            patch("app.services.verification.fact_checker.CITATION_RETRY_DELAY", 0):
+        ranged = await checker._probe_citation(client, "https://nohead.ru")
+        retried = await checker._probe_citation(client, "https://slow.ru")
+    await client.aclose()
+
+    assert ranged.status_code == 206
+    assert retried.status_code == 200
+    assert calls.count("https://slow.ru") == 2
+
+
+@pytest.mark.asyncio
+async def test_fact_checker_short_content():
+    """Test that too short content passes without any checks."""
+    from unittest.mock import Mock, patch
+
+    checker = FactChecker(None)
+    verification = SourceVerification(status=VerificationStatus.PENDING)
+    data = Mock(processed_content=None, raw_content="Рост на 5%")
+
+    with patch.object(FactChecker, "_verify_citations") as verify:
+        result = await checker.check_facts(data, verification)
+
+    verify.assert_not_called()
+    assert result["fact_check_passed"] is True
+    assert result["total_claims"] == 0
+    assert verification.fact_check_performed is True
+    assert verification.verification_metadata["fact_check"] == result
+
+@pytest.mark.asyncio
+async def test_fact_checker_batch_probes_urls_once():
+    """Test URLs cited by several documents are probed once per batch."""
+    from unittest.mock import AsyncMock, Mock, patch
+    import httpx
+
+    checker = FactChecker(None)
+    items = [
+        (
+            Mock(processed_content=f"Документ {i}: см. https://batch-shared.ru и https://batch-{i}.ru"),
+            SourceVerification(status=VerificationStatus.PENDING),
+        )
+        for i in range(3)
+    ]
+    probe = AsyncMock(return_value=Mock(status_code=200))
+
+    with patch.object(httpx.AsyncClient, "head", new=probe):
+        results = await checker.check_facts_batch(items)
+
+    assert sorted(call.args[0] for call in probe.call_args_list) == [
+        "https://batch-0.ru", "https://batch-1.ru", "https://batch-2.ru", "https://batch-shared.ru",
+    ]
+    assert [r["verified_claims"] for r in results] == [2, 2, 2]
+    assert all(v.fact_check_passed for _, v in items)
+
 @pytest.mark.asyncio
 async def test_fact_checker_citations(db_session: AsyncSession):
     """Test fact checking with citations."""
@@ -311,3 +779,152 @@ async def test_verification_service_report(db_session: AsyncSession):
     assert report is not None
     assert "source_verifications" in report
     assert len(report["source_verifications"]) > 0
+
+
+def test_verification_service_overall_assessment():
+    """Test overall assessment rules."""
+    service = VerificationService(None)
+
+    assessment = service._generate_overall_assessment({
+        "source_verification": {"reliability_score": 0.6},
+        "freshness": {"is_outdated": True, "days_old": 400},
+        "cross_validation": {"contradicting_sources": 2, "confidence_score": 0.3},
+        "fact_check": {"fact_check_passed": False},
+    })
+
+    assert assessment["reliability"] == "medium"
+    assert assessment["is_trustworthy"] is False
+    assert assessment["confidence_level"] == "low"
+    assert assessment["issues"] == [
+        "Data is outdated (400 days old)",
+        "Low confidence from cross-validation",
+        "Failed fact-checking",
+    ]
+    assert assessment["warnings"] == [
+        "Source has moderate reliability",
+        "Data contradicts other sources",
+    ]
+    assert len(assessment["recommendations"]) == 3
+
+    # Cross-validation without compared sources is inconclusive
+    assessment = service._generate_overall_assessment({
+        "source_verification": {"reliability_score": 0.8},
+        "cross_validation": {"contradicting_sources": 0, "confidence_score": None},
+    })
+
+    assert assessment["reliability"] == "high"
+    assert assessment["is_trustworthy"] is True
+    assert assessment["confidence_level"] == "high"
+    assert assessment["issues"] == []
+
+
+@pytest.mark.asyncio
+async def test_verification_service_report_streams_rows():
+    """Test report rows are streamed in batches."""
+    import uuid
+    from unittest.mock import AsyncMock, Mock
+
+    verification = SourceVerification(
+        id=uuid.uuid4(), status=VerificationStatus.VERIFIED, reliability_score=0.8,
+    )
+
+    async def rows():
+        yield verification
+
+    db = Mock(stream_scalars=AsyncMock(return_value=rows()))
+    service = VerificationService(db)
+
+    report = await service.get_verification_report(source_id=str(uuid.uuid4()))
+
+    assert report["source_verifications"][0]["id"] == str(verification.id)
+    stmt = db.stream_scalars.await_args.args[0]
+    assert stmt.get_execution_options()["yield_per"] == 500
+
+
+@pytest.mark.asyncio
+async def test_verification_service_fact_check_runs_with_cross_validation():
+    """Test fact-checking runs while related data is looked up."""
+    import asyncio
+    import uuid
+    from unittest.mock import AsyncMock, Mock, patch
+
+    service = VerificationService(Mock(commit=AsyncMock()))
+    source_verification = SourceVerification(
+        id=uuid.uuid4(), status=VerificationStatus.VERIFIED, reliability_score=0.8,
+    )
+    data = Mock(id=uuid.uuid4(), content_date=datetime.utcnow(), processed_content="Рост на 5%")
+    fact_check_started = asyncio.Event()
+
+    async def check_facts(collected_data, verification):
+        fact_check_started.set()
+        return {"fact_check_passed": True}
+
+    async def find_related_data(collected_data):
+        # Only completes if fact-checking has started concurrently
+        await asyncio.wait_for(fact_check_started.wait(), timeout=1)
+        return [Mock(source_id=uuid.uuid4(), processed_content="Рост на 5%")]
+
+    with patch.object(service, "_get_source", AsyncMock(return_value=DataSource(name="Source"))), \
+            patch.object(service, "verify_source", AsyncMock(return_value=source_verification)), \
+            patch.object(service, "_find_related_data", find_related_data), \
+            patch.object(service.fact_checker, "check_facts", check_facts):
+        results = await service.verify_collected_data(data)
+
+    assert results["fact_check"] == {"fact_check_passed": True}
+    assert results["cross_validation"]["matching_sources"] == 1
+
+
+@pytest.mark.asyncio
+async def test_verification_service_skips_blocked_source():
+    """Test blocked sources skip cross-validation and fact-checking."""
+    import uuid
+    from unittest.mock import AsyncMock, Mock, patch
+
+    service = VerificationService(Mock(commit=AsyncMock()))
+    source_verification = SourceVerification(
+        id=uuid.uuid4(), status=VerificationStatus.FAILED, reliability_score=0.0,
+    )
+    data = Mock(id=uuid.uuid4(), content_date=datetime.utcnow(), processed_content="Рост на 5%")
+
+    with patch.object(service, "_get_source", AsyncMock(return_value=DataSource(name="Source"))), \
+            patch.object(service, "verify_source", AsyncMock(return_value=source_verification)), \
+            patch.object(service, "_find_related_data", AsyncMock()) as find_related_data, \
+            patch.object(service.fact_checker, "check_facts", AsyncMock()) as check_facts:
+        results = await service.verify_collected_data(data)
+
+    assert results["skipped_reason"] == "source_blocked"
+    assert "freshness" in results
+    assert "cross_validation" not in results
+    assert "fact_check" not in results
+    find_related_data.assert_not_awaited()
+    check_facts.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_verification_service_batch_preloads_data():
+    """Test sources and related data of a batch are loaded once."""
+    import uuid
+    from unittest.mock import AsyncMock, Mock, patch
+
+    research_id = uuid.uuid4()
+    sources = [DataSource(id=uuid.uuid4(), name=f"Source {i}") for i in range(2)]
+    items = [
+        CollectedData(id=uuid.uuid4(), research_id=research_id, source_id=source.id)
+        for source in sources
+    ]
+    db = Mock()
+    db.execute = AsyncMock(side_effect=[
+        Mock(scalars=Mock(return_value=sources)),
+        Mock(scalars=Mock(return_value=items)),
+    ])
+    service = VerificationService(db)
+
+    with patch.object(service, "verify_collected_data", AsyncMock(return_value={})) as verify:
+        results = await service.verify_collected_data_batch(items)
+
+    assert results == [{}, {}]
+    assert db.execute.await_count == 2
+    first, second = (call.kwargs for call in verify.call_args_list)
+    assert first["source"] is sources[0]
+    assert first["related_data"] == [items[1]]
+    assert second["related_data"] == [items[0]]